@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+NEXUS WCAG Hunt Result Cache
+Content-addressed store of hunter reports, so unchanged pages skip re-hunting
+
+Entries are keyed by a hash of (page content, hunter class, contrast
+thresholds, rule-set version): a change to any of them is simply a miss.
+Each entry is a small JSON file under <cache_dir>/<key[:2]>/<key>.json,
+written atomically, so concurrent workers (wcag_site.py) can share one cache.
+When the cache grows past max_bytes the least recently used entries are
+evicted.
+
+Environment:
+  WCAG_HUNT_CACHE_DIR      cache location (default tools/__reports/hunt/.cache)
+  WCAG_HUNT_CACHE_MAX_MB   size budget before eviction (default 64)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Anchored to the tools directory, so callers in any cwd share one cache
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "__reports" / "hunt" / ".cache"
+DEFAULT_MAX_MB = 64
+# After eviction the cache is trimmed to this fraction of its budget
+EVICT_TO = 0.8
+
+
+def page_digest(content: Union[str, bytes]) -> str:
+    """sha256 of a page's content"""
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'surrogatepass')
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_digest(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """sha256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(*parts: Any) -> str:
+    """Stable key for a tuple of JSON-serializable parts"""
+    return hashlib.sha256(json.dumps(parts, separators=(',', ':')).encode('utf-8')).hexdigest()
+
+
+class HuntResultCache:
+    """On-disk hunter report cache with size-based LRU eviction"""
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or os.getenv('WCAG_HUNT_CACHE_DIR', DEFAULT_CACHE_DIR))
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv('WCAG_HUNT_CACHE_MAX_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes: Optional[int] = None
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached report for a key, or None"""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                report = json.load(f)
+            # Touch on read so eviction drops the least recently used entries
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return report
+
+    def put(self, key: str, report: Dict[str, Any]):
+        """Store a report atomically, evicting old entries if over budget"""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = json.dumps(report, separators=(',', ':')).encode('utf-8')
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+
+        if self._bytes is None:
+            self._bytes = self.size()
+        else:
+            self._bytes += len(data)
+        if self._bytes > self.max_bytes:
+            self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        if not self.cache_dir.is_dir():
+            return entries
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        """Total bytes of cached reports"""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, max_bytes: Optional[int] = None) -> int:
+        """Drop least recently used entries until under budget; returns entries removed"""
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = budget * EVICT_TO if total > budget else total
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                # Another worker got there first
+                pass
+            total -= size
+            removed += 1
+        self._bytes = total
+        return removed
+
+    def clear(self) -> int:
+        """Remove every cached report"""
+        return self.evict(0)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+NEXUS WCAG Template-Dedup Audit
+Audits layout fragments shared across a batch of pages only once
+
+Template-driven sites repeat identical headers, navs and footers on every
+page. Each page's subtrees are fingerprinted bottom-up by a structural hash
+(tag, attributes, text and child hashes). The first time a fragment is seen
+its element-level findings (contrast, alt text) are recorded; wherever the
+same fragment appears on a later page those findings are attributed to that
+page without re-evaluating its elements. Only the page-unique remainder is
+hunted.
+
+Reuse is exact: element-scoped rules depend only on an element, its subtree
+and its parent, and a fragment's root (whose parent lies outside it) is
+always re-evaluated. Document-scoped rules (landmarks, lang, heading order)
+still see every element of every page.
+
+Usage: wcag_site.py <dir|glob> ... --dedup
+"""
+
+import hashlib
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import Tag
+
+from hunt_cache import HuntResultCache
+from wcag_hunters import BaseWcagHunter, HuntDocument, HuntRuleEngine, WcagHunterOrchestrator
+
+# Smaller subtrees are cheaper to re-hunt than to fingerprint and splice
+MIN_FRAGMENT_ELEMENTS = 3
+# Upper bound on remembered fragments; the first pages of a batch define the templates
+MAX_FRAGMENTS = 200_000
+
+# hunter class name -> (hits of the page the fragment was first audited on, start, end)
+FragmentHits = Dict[str, Tuple[List[Tuple[None, Counter, List[Dict[str, Any]]]], int, int]]
+
+
+def subtree_fingerprints(document: HuntDocument) -> Tuple[Dict[int, bytes], Dict[int, int]]:
+    """Structural hash and element count of every subtree, keyed by id(element)"""
+    digests: Dict[int, bytes] = {}
+    sizes: Dict[int, int] = {}
+    # Reverse document order visits children before their parents
+    for element in reversed(document.elements):
+        parts = [element.name, element.attrs]
+        size = 1
+        for child in element.contents:
+            if isinstance(child, Tag):
+                parts.append(digests[id(child)])
+                size += sizes[id(child)]
+            else:
+                parts.append((type(child).__name__, str(child)))
+        digests[id(element)] = hashlib.blake2b(repr(parts).encode('utf-8', 'surrogatepass'),
+                                               digest_size=16).digest()
+        sizes[id(element)] = size
+    return digests, sizes
+
+
+class FragmentIndex:
+    """Audited fragments shared by every page of a batch"""
+
+    def __init__(self, min_elements: int = MIN_FRAGMENT_ELEMENTS, max_fragments: int = MAX_FRAGMENTS):
+        self.min_elements = min_elements
+        self.max_fragments = max_fragments
+        self.fragments: Dict[bytes, FragmentHits] = {}
+        self.stats = Counter()
+        self.last_page = {"elements": 0, "elements_reused": 0}
+
+    def audit(self, engine: HuntRuleEngine, document: HuntDocument) -> Dict[str, Dict[str, Any]]:
+        """One traversal of a page that reuses known fragments; returns per-hunter reports"""
+        digests, sizes = subtree_fingerprints(document)
+        element_hunters: List[BaseWcagHunter] = [hunter for hunter in engine.hunters if hunter.element_scoped]
+        names = [hunter.__class__.__name__ for hunter in element_hunters]
+        elements = document.elements
+
+        engine.begin()
+        # marks[i]: number of hits per element-scoped hunter once element i is done
+        marks: List[Tuple[int, ...]] = []
+        new_roots: List[Tuple[bytes, int, int]] = []
+        reused = 0
+        index = 0
+        while index < len(elements):
+            element = elements[index]
+            engine.visit(element)
+            mark = tuple(len(hunter.hits) for hunter in element_hunters)
+            marks.append(mark)
+            size = sizes[id(element)]
+            if size < self.min_elements:
+                index += 1
+                continue
+
+            digest = digests[id(element)]
+            fragment = self.fragments.get(digest)
+            if fragment is None or any(name not in fragment for name in names):
+                new_roots.append((digest, index, size))
+                index += 1
+                continue
+
+            # Known fragment: attribute its recorded hits, run only document-level rules inside it
+            for hunter, name in zip(element_hunters, names):
+                page_hits, start, end = fragment[name]
+                for offset in range(start, end):
+                    hunter.hits[(index, offset)] = page_hits[offset]
+            for inner in elements[index + 1:index + size]:
+                engine.visit(inner, engine.document_dispatch, engine.document_attribute_dispatch)
+            after = tuple(len(hunter.hits) for hunter in element_hunters)
+            marks.extend([after] * (size - 1))
+            reused += size - 1
+            self.stats["fragments_reused"] += 1
+            index += size
+
+        self._register(element_hunters, names, marks, new_roots)
+        self.stats["pages"] += 1
+        self.stats["elements"] += len(elements)
+        self.stats["elements_reused"] += reused
+        self.last_page = {"elements": len(elements), "elements_reused": reused}
+        return engine.finish()
+
+    def _register(self, hunters: List[BaseWcagHunter], names: List[str],
+                  marks: List[Tuple[int, ...]], new_roots: List[Tuple[bytes, int, int]]):
+        """Remember this page's new fragments; their hits are slices of the page's hit list"""
+        # Drop element references so remembered hits do not keep the page's tree alive
+        page_hits = [[(None, counts, findings) for _, counts, findings in hunter.hits.values()]
+                     for hunter in hunters]
+        for digest, index, size in new_roots:
+            if len(self.fragments) >= self.max_fragments:
+                break
+            if digest in self.fragments:
+                continue
+            # Inner elements only: the root is re-evaluated on every page
+            start, end = marks[index], marks[index + size - 1]
+            self.fragments[digest] = {
+                name: (hits, start[k], end[k]) for k, (name, hits) in enumerate(zip(names, page_hits))
+            }
+            self.stats["fragments"] += 1
+
+
+class DedupWcagOrchestrator(WcagHunterOrchestrator):
+    """WcagHunterOrchestrator that shares audited fragments through a FragmentIndex"""
+
+    def __init__(self, html_content: str, fragments: FragmentIndex, verbose: bool = True,
+                 write_reports: bool = True, cache: Optional[HuntResultCache] = None,
+                 parser: Optional[str] = None):
+        super().__init__(html_content, verbose=verbose, write_reports=write_reports, cache=cache,
+                         parser=parser)
+        self.fragments = fragments
+        # Elements hunted vs. taken from known fragments (zero when served from the cache)
+        self.dedup = {"elements": 0, "elements_reused": 0}
+
+    def _hunt(self, hunters: List[BaseWcagHunter]) -> Dict[str, Dict[str, Any]]:
+        engine = self.engine if len(hunters) == len(self.hunters) else HuntRuleEngine(hunters)
+        reports = self.fragments.audit(engine, self._parse())
+        self.dedup = dict(self.fragments.last_page)
+        return reports
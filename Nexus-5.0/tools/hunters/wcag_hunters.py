@@ -0,0 +1,923 @@
+#!/usr/bin/env python3
+"""
+NEXUS WCAG HUNTER SYSTEM v2.0
+Enhanced with hunter-pack architectural patterns
+
+Based on hunter-pack brilliance:
+- Standardized JSON schema
+- Policy invariants
+- Unlock dependencies
+- ETA estimates
+- Static signal detection
+- In-process checker (WcagChecker) for structured scores without HTTP or text scraping
+- One parse per page: hunters share a HuntDocument (soup + element index)
+- One traversal per page: hunters register visitor rules with HuntRuleEngine
+- Streaming mode for very large pages (see wcag_stream.py)
+- Incremental re-hunt: after in-place fixes only touched elements are re-evaluated
+- Result cache: unchanged pages reuse reports keyed on content, thresholds and rules (see hunt_cache.py)
+- Pluggable parser backend (lxml when installed, else html.parser; see html_parsers.py)
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Any, Literal, Optional, Tuple
+from bs4 import BeautifulSoup, Tag
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
+from contrast_engine import (
+    DEFAULT_CANVAS, RGBA, background_layers, composite, contrast_ratio, parse_declarations, parse_color
+)
+from html_parsers import parse_html, resolve_parser, pop_parser_argument
+from rule_patterns import COLOR_STYLE, suspicious_alt_reason
+from hunt_cache import HuntResultCache, cache_key, page_digest
+
+CHECKER_VERSION = "2.2.0"
+# Bump whenever any rule's findings change; part of every result cache key
+RULESET_VERSION = "1"
+
+HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+LANDMARK_TAGS = ('main', 'nav', 'header', 'footer')
+
+
+class HuntDocument:
+    """A page parsed once, with an element index shared by every hunter
+    
+    The index is built in a single traversal: all elements in document order,
+    elements by tag name, elements carrying a style attribute, images and
+    headings (in document order).
+    """
+    
+    def __init__(self, html_content: Optional[str], soup: Optional[BeautifulSoup] = None,
+                 parser: Optional[str] = None):
+        self.html_content = html_content
+        self.parser = resolve_parser(parser)
+        self.soup = soup if soup is not None else parse_html(html_content, self.parser)
+        self.reindex()
+    
+    def reindex(self):
+        """(Re)build the element index, e.g. after the tree was fixed in place"""
+        self.elements: List[Tag] = []
+        self.by_tag: Dict[str, List[Tag]] = {}
+        self.styled: List[Tag] = []
+        self.headings: List[Tag] = []
+        for element in self.soup.find_all(True):
+            self.elements.append(element)
+            self.by_tag.setdefault(element.name, []).append(element)
+            if element.name in HEADING_TAGS:
+                self.headings.append(element)
+            if element.has_attr('style'):
+                self.styled.append(element)
+    
+    @property
+    def images(self) -> List[Tag]:
+        return self.by_tag.get('img', [])
+    
+    @property
+    def html_tag(self) -> Optional[Tag]:
+        tags = self.by_tag.get('html')
+        return tags[0] if tags else None
+
+
+class HuntRuleEngine:
+    """Dispatches every element of a page to the hunters' registered rules
+    
+    Hunters declare interest through `element_rules` (tag name → method name)
+    and `attribute_rules` (attribute name → method name). The engine builds one
+    dispatch table and walks the document once, so adding hunters adds rule
+    evaluations but never another traversal.
+    """
+    
+    def __init__(self, hunters: List['BaseWcagHunter']):
+        self.hunters = hunters
+        self.element_dispatch, self.attribute_dispatch = self._dispatch_tables(hunters)
+        # Rules of document-scoped hunters, re-run in full by incremental rescans
+        self.document_dispatch, self.document_attribute_dispatch = self._dispatch_tables(
+            [hunter for hunter in hunters if not hunter.element_scoped]
+        )
+        self.seen: Dict[int, Tag] = {}
+    
+    @staticmethod
+    def _dispatch_tables(hunters: List['BaseWcagHunter']):
+        element_dispatch: Dict[str, List[Callable[[Tag], None]]] = {}
+        attribute_dispatch: Dict[str, List[Callable[[Tag], None]]] = {}
+        for hunter in hunters:
+            for tag_name, method in hunter.element_rules.items():
+                element_dispatch.setdefault(tag_name, []).append(getattr(hunter, method))
+            for attribute, method in hunter.attribute_rules.items():
+                attribute_dispatch.setdefault(attribute, []).append(getattr(hunter, method))
+        return element_dispatch, attribute_dispatch
+    
+    def begin(self):
+        for hunter in self.hunters:
+            hunter.begin()
+    
+    def visit(self, element: Tag, element_dispatch=None, attribute_dispatch=None):
+        """Dispatch one element to every interested rule"""
+        if element_dispatch is None:
+            element_dispatch = self.element_dispatch
+        if attribute_dispatch is None:
+            attribute_dispatch = self.attribute_dispatch
+        for rule in element_dispatch.get(element.name, ()):
+            rule(element)
+        for attribute, rules in attribute_dispatch.items():
+            if element.has_attr(attribute):
+                for rule in rules:
+                    rule(element)
+    
+    def finish(self) -> Dict[str, Dict[str, Any]]:
+        return {hunter.__class__.__name__: hunter.finish() for hunter in self.hunters}
+    
+    def run(self, document: HuntDocument) -> Dict[str, Dict[str, Any]]:
+        """Single traversal; returns each hunter's report keyed by class name"""
+        self.begin()
+        for element in document.elements:
+            self.visit(element)
+        self.seen = {id(element): element for element in document.elements}
+        return self.finish()
+    
+    def rescan(self, document: HuntDocument, modified: Iterable[Tag]) -> Dict[str, Dict[str, Any]]:
+        """Incremental re-run after `modified` elements were edited in place
+        
+        Element-scoped hunters re-evaluate only the modified elements, their
+        ancestors (whose truncated markup may have changed), their children
+        (whose parent may have changed) and elements not seen by the last run;
+        every other element keeps its previous hits. Document-scoped hunters
+        (landmarks, lang, heading order) re-run in full. Call after
+        document.reindex().
+        """
+        dirty = set()
+        for element in modified:
+            node = element
+            while isinstance(node, Tag) and id(node) not in dirty:
+                dirty.add(id(node))
+                node = node.parent
+            dirty.update(id(child) for child in element.find_all(True, recursive=False))
+        
+        element_hunters = [hunter for hunter in self.hunters if hunter.element_scoped]
+        previous = [hunter.hits for hunter in element_hunters]
+        self.begin()
+        seen = self.seen
+        for element in document.elements:
+            key = id(element)
+            if key in dirty or seen.get(key) is not element:
+                self.visit(element)
+                continue
+            self.visit(element, self.document_dispatch, self.document_attribute_dispatch)
+            for hunter, hits in zip(element_hunters, previous):
+                hit = hits.get(key)
+                if hit is not None:
+                    hunter.hits[key] = hit
+        self.seen = {id(element): element for element in document.elements}
+        return self.finish()
+
+
+class BaseWcagHunter:
+    """Base hunter following hunter-pack patterns
+    
+    Subclasses register visitor rules (`element_rules`, `attribute_rules`),
+    reset their state in `begin()` and build the report in `finish()`.
+    Element-scoped hunters (results depend only on an element and its parent)
+    record results with `hit()` so incremental rescans can reuse them.
+    """
+    
+    element_rules: Dict[str, str] = {}
+    attribute_rules: Dict[str, str] = {}
+    element_scoped = False
+    
+    def __init__(self, html_content: Optional[str], report_dir: str = "__reports/hunt", verbose: bool = True,
+                 document: Optional[HuntDocument] = None, cache: Optional[HuntResultCache] = None):
+        # html_content=None builds a document-less hunter fed element by element (streaming mode)
+        if document is None and html_content is not None:
+            document = HuntDocument(html_content)
+        self.attach(document)
+        self.verbose = verbose
+        self.cache = cache
+        self.report_dir = Path(report_dir)
+        self.findings = []
+        
+        # Hunter configuration (override via env)
+        self.contrast_threshold_aa = float(os.getenv('CONTRAST_THRESHOLD_AA', '4.5'))
+        self.contrast_threshold_aaa = float(os.getenv('CONTRAST_THRESHOLD_AAA', '7.0'))
+    
+    def attach(self, document: Optional[HuntDocument]):
+        """Bind the hunter to a parsed page"""
+        self.document = document
+        self.html_content = document.html_content if document else None
+        self.soup = document.soup if document else None
+    
+    def cache_key(self, page_hash: str) -> str:
+        """Result cache key: page content, hunter, thresholds and rule-set version"""
+        return cache_key(page_hash, self.__class__.__name__,
+                         self.contrast_threshold_aa, self.contrast_threshold_aaa, RULESET_VERSION)
+    
+    def begin(self):
+        """Reset per-scan state before a traversal"""
+        self.findings = []
+        # id(element) -> (element, counter increments, findings), in document order
+        # (template-dedup audits splice in reused fragment hits under tuple keys)
+        self.hits: Dict[int, Tuple[Any, Counter, List[Dict[str, Any]]]] = {}
+    
+    def hit(self, element, *counters: str, finding: Optional[Dict[str, Any]] = None):
+        """Record an element-scoped rule result"""
+        key = id(element)
+        if key not in self.hits:
+            self.hits[key] = (element, Counter(), [])
+        _, counts, findings = self.hits[key]
+        counts.update(counters)
+        if finding is not None:
+            findings.append(finding)
+    
+    def element_results(self) -> Tuple[Counter, List[Dict[str, Any]]]:
+        """Counter totals and findings (document order) from recorded hits"""
+        totals = Counter()
+        findings = []
+        for _, counts, element_findings in self.hits.values():
+            totals.update(counts)
+            findings.extend(element_findings)
+        return totals, findings
+    
+    def finish(self) -> Dict[str, Any]:
+        """Build the hunter-pack report after a traversal"""
+        raise NotImplementedError
+    
+    def scan(self) -> Dict[str, Any]:
+        """Main scan method - returns hunter-pack compatible JSON (cached when a cache is set)"""
+        if self.cache is None or self.html_content is None:
+            return HuntRuleEngine([self]).run(self.document)[self.__class__.__name__]
+        key = self.cache_key(page_key(self.html_content, self.document.parser))
+        report = self.cache.get(key)
+        if report is None:
+            report = HuntRuleEngine([self]).run(self.document)[self.__class__.__name__]
+            self.cache.put(key, report)
+        return report
+    
+    def write_report(self, report: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Write standardized hunter JSON report (scanning first if not given one)"""
+        if report is None:
+            report = self.scan()
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        output_file = self.report_dir / f"{self.__class__.__name__.lower()}.json"
+        
+        with open(output_file, 'w') as f:
+            json.dump(report, f, indent=2)
+        
+        return report
+    
+    def element_ref(self, element, limit: int) -> Dict[str, Any]:
+        """How a finding points at its element: truncated markup, or a source location when streaming"""
+        location = getattr(element, 'source_location', None)
+        if location is not None:
+            return location
+        return {"element": str(element)[:limit]}
+    
+    def trace_issue(self, issue_data: Dict[str, Any]):
+        """Hunter-style issue tracing"""
+        if self.verbose:
+            print(f"🔍 {self.__class__.__name__}: {issue_data}")
+
+
+class ColorContrastHunter(BaseWcagHunter):
+    """WCAG 1.4.3 Color Contrast Hunter"""
+    
+    attribute_rules = {'style': 'visit_styled'}
+    element_scoped = True
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Per-page interning: each distinct color string is parsed once and
+        # each distinct (fg, bg) pair is computed once
+        self._colors: Dict[str, Optional[RGBA]] = {}
+        self._ratios: Dict[Tuple[str, str], Optional[float]] = {}
+    
+    def visit_styled(self, element: Tag):
+        """Hunt for inline style contrast issues"""
+        style = element.get('style', '')
+        if not COLOR_STYLE.search(style):
+            return
+        fg_color = bg_color = None
+        for prop, value, _ in parse_declarations(style):
+            if prop == 'color':
+                fg_color = value
+            elif prop in ('background', 'background-color'):
+                bg_color = value
+        
+        if fg_color and bg_color:
+            contrast_ratio = self._calculate_contrast_ratio(fg_color, bg_color)
+            
+            if contrast_ratio and contrast_ratio < self.contrast_threshold_aaa:
+                self.hit(element, "insufficient_aaa", finding={
+                    **self.element_ref(element, 100),
+                    "fg_color": fg_color,
+                    "bg_color": bg_color,
+                    "contrast_ratio": round(contrast_ratio, 2),
+                    "required_aaa": self.contrast_threshold_aaa,
+                    "issue": "Insufficient contrast for AAA compliance"
+                })
+            
+            if contrast_ratio and contrast_ratio < self.contrast_threshold_aa:
+                self.hit(element, "insufficient_aa", "low_contrast_elements")
+                self.trace_issue({
+                    "class": "low-contrast",
+                    **self.element_ref(element, 50),
+                    "contrast": contrast_ratio,
+                    "severity": "critical" if contrast_ratio < 3.0 else "warn"
+                })
+    
+    def finish(self) -> Dict[str, Any]:
+        counts, self.findings = self.element_results()
+        issues = counts["low_contrast_elements"]
+        status = "pass" if issues == 0 else "warn"
+        
+        return {
+            "schemaVersion": 1,
+            "module": "wcag_color_contrast",
+            "status": status,
+            "issues": issues,
+            "affected_elements": issues,
+            "counts": {
+                "low_contrast_elements": counts["low_contrast_elements"],
+                "insufficient_aa": counts["insufficient_aa"],
+                "insufficient_aaa": counts["insufficient_aaa"]
+            },
+            "findings": self.findings,
+            "actions": [
+                "Ensure color contrast of at least 4.5:1 for normal text (AA)",
+                "Aim for 7:1 contrast for enhanced readability (AAA)",
+                "Use automated tools to verify contrast ratios",
+                "Test with users with visual impairments"
+            ],
+            "policy_invariants": [
+                "counts.insufficient_aa == 0",
+                "counts.low_contrast_elements == 0"
+            ],
+            "eta_minutes": 45,
+            "unlocks": ["wcag_images", "wcag_typography"]
+        }
+    
+    def _color(self, value: str) -> Optional[RGBA]:
+        """Parse a color string once per page"""
+        if value not in self._colors:
+            self._colors[value] = parse_color(value)
+        return self._colors[value]
+    
+    def _calculate_contrast_ratio(self, fg_color: str, bg_color: str) -> Optional[float]:
+        """WCAG contrast ratio of an inline fg/bg pair (None if either can't be resolved)
+        
+        The background is composited over the canvas and the foreground over
+        the background; gradients are checked against their worst color stop.
+        """
+        key = (fg_color.lower().strip(), bg_color.lower().strip())
+        if key in self._ratios:
+            return self._ratios[key]
+        
+        ratio = None
+        fg = self._color(key[0])
+        base, stops = background_layers(key[1])
+        if fg is not None and (base is not None or stops):
+            backdrop = composite(base, DEFAULT_CANVAS) if base is not None else DEFAULT_CANVAS
+            backgrounds = [composite(stop, backdrop) for stop in stops] or [backdrop]
+            ratio = min(contrast_ratio(composite(fg, bg), bg) for bg in backgrounds)
+        
+        self._ratios[key] = ratio
+        return ratio
+
+
+class ImageAccessibilityHunter(BaseWcagHunter):
+    """WCAG 1.1.1 Image Alt Text Hunter"""
+    
+    element_rules = {'img': 'visit_img'}
+    element_scoped = True
+    
+    def visit_img(self, img: Tag):
+        alt_text = img.get('alt')
+        
+        # Missing alt attribute
+        if alt_text is None:
+            self.trace_issue({
+                "class": "missing-alt",
+                **self.element_ref(img, 50),
+                "severity": "critical"
+            })
+            self.hit(img, "missing_alt", finding={
+                **self.element_ref(img, 100),
+                "issue": "Missing alt attribute",
+                "fix": "Add alt text or empty alt for decorative images",
+                "severity": "critical"
+            })
+        
+        # Empty alt for potentially meaningful images
+        elif alt_text == "" and self._is_potentially_meaningful(img):
+            self.hit(img, "empty_alt_decorative", finding={
+                **self.element_ref(img, 100),
+                "issue": "Empty alt on potentially meaningful image",
+                "fix": "Add descriptive alt text or confirm image is decorative",
+                "severity": "warning"
+            })
+        
+        # Suspicious alt text (filename, etc.)
+        elif alt_text and self._is_suspicious_alt(alt_text):
+            self.hit(img, "suspicious_alt", finding={
+                **self.element_ref(img, 100),
+                "alt_text": alt_text,
+                "issue": "Suspicious alt text detected",
+                "fix": "Use descriptive, meaningful alt text",
+                "severity": "warning"
+            })
+    
+    def finish(self) -> Dict[str, Any]:
+        counts, self.findings = self.element_results()
+        issues = counts["missing_alt"] + counts["empty_alt_decorative"] + counts["suspicious_alt"]
+        status = "pass" if issues == 0 else "warn"
+        
+        return {
+            "schemaVersion": 1,
+            "module": "wcag_images",
+            "status": status,
+            "issues": issues,
+            "affected_elements": issues,
+            "counts": {
+                "missing_alt": counts["missing_alt"],
+                "empty_alt_decorative": counts["empty_alt_decorative"],
+                "suspicious_alt": counts["suspicious_alt"]
+            },
+            "findings": self.findings,
+            "actions": [
+                "Add alt text to all images missing alt attributes",
+                "Use empty alt='' for purely decorative images",
+                "Ensure alt text describes image content and function",
+                "Avoid using filenames or placeholder text as alt"
+            ],
+            "policy_invariants": [
+                "counts.missing_alt == 0",
+                "counts.suspicious_alt == 0"
+            ],
+            "eta_minutes": 30,
+            "unlocks": ["wcag_semantic_html", "wcag_aria"]
+        }
+    
+    def _is_potentially_meaningful(self, img) -> bool:
+        """Heuristic to detect if image might be meaningful"""
+        # Images with certain attributes might be meaningful
+        src = img.get('src', '').lower()
+        if any(keyword in src for keyword in ['chart', 'graph', 'diagram', 'map', 'photo']):
+            return True
+        if img.parent and img.parent.name in ['figure', 'a', 'button']:
+            return True
+        return False
+    
+    def _is_suspicious_alt(self, alt_text: str) -> bool:
+        """Detect suspicious alt text patterns (filename, numbered placeholder, hash)"""
+        return suspicious_alt_reason(alt_text) is not None
+
+
+class SemanticHtmlHunter(BaseWcagHunter):
+    """WCAG 1.3.1 Semantic HTML Hunter"""
+    
+    element_rules = {
+        'html': 'visit_html',
+        **{landmark: 'visit_landmark' for landmark in LANDMARK_TAGS},
+        **{heading: 'visit_heading' for heading in HEADING_TAGS},
+    }
+    
+    def begin(self):
+        super().begin()
+        self.html_tag = None
+        self.found_landmarks = set()
+        self.current_heading_level = None
+        self.heading_skip = None
+    
+    def visit_html(self, element: Tag):
+        if self.html_tag is None:
+            self.html_tag = element
+    
+    def visit_landmark(self, element: Tag):
+        self.found_landmarks.add(element.name)
+    
+    def visit_heading(self, element: Tag):
+        """Check heading order incrementally (shouldn't skip levels); first skip only"""
+        level = int(element.name[1])
+        if self.heading_skip is not None:
+            return
+        if self.current_heading_level is not None and level > self.current_heading_level + 1:
+            self.heading_skip = (self.current_heading_level, level)
+            return
+        self.current_heading_level = level
+    
+    def finish(self) -> Dict[str, Any]:
+        missing_landmarks = 0
+        bad_heading_order = 0
+        generic_containers = 0
+        missing_document_language = 0
+        
+        # Check for essential landmarks
+        for landmark in LANDMARK_TAGS:
+            if landmark not in self.found_landmarks:
+                missing_landmarks += 1
+                self.trace_issue({
+                    "class": "missing-landmark",
+                    "landmark": landmark,
+                    "severity": "warn"
+                })
+                self.findings.append({
+                    "issue": f"Missing <{landmark}> landmark",
+                    "fix": f"Add <{landmark}> element for proper document structure",
+                    "severity": "warning"
+                })
+        
+        # Check heading hierarchy
+        if self.heading_skip is not None:
+            bad_heading_order += 1
+            current_level, level = self.heading_skip
+            self.findings.append({
+                "issue": f"Heading hierarchy skips level: h{current_level} to h{level}",
+                "fix": "Use proper heading hierarchy (h1 → h2 → h3)",
+                "severity": "warning"
+            })
+        
+        # Check for document language
+        if not self.html_tag or not self.html_tag.get('lang'):
+            missing_document_language += 1
+            self.trace_issue({
+                "class": "missing-lang",
+                "severity": "critical"
+            })
+            self.findings.append({
+                "issue": "Missing lang attribute on <html> element",
+                "fix": "Add lang='en' or appropriate language code to <html>",
+                "severity": "critical"
+            })
+        
+        issues = missing_landmarks + bad_heading_order + missing_document_language
+        status = "pass" if issues == 0 else "warn"
+        
+        return {
+            "schemaVersion": 1,
+            "module": "wcag_semantic_html",
+            "status": status,
+            "issues": issues,
+            "affected_elements": issues,
+            "counts": {
+                "missing_landmarks": missing_landmarks,
+                "bad_heading_order": bad_heading_order,
+                "generic_containers": generic_containers,
+                "missing_document_language": missing_document_language
+            },
+            "findings": self.findings,
+            "actions": [
+                "Add missing HTML5 landmark elements (main, nav, header, footer)",
+                "Ensure proper heading hierarchy (h1 → h2 → h3)",
+                "Add lang attribute to html element",
+                "Use semantic elements instead of generic divs"
+            ],
+            "policy_invariants": [
+                "counts.missing_document_language == 0",
+                "counts.bad_heading_order == 0"
+            ],
+            "eta_minutes": 25,
+            "unlocks": ["wcag_keyboard", "wcag_aria"]
+        }
+
+
+def page_key(html_content: str, parser: str) -> str:
+    """Cache identity of a page: its content and the backend that parses it"""
+    return cache_key(page_digest(html_content), parser)
+
+
+class WcagHunterOrchestrator:
+    """Master orchestrator following hunter-pack patterns
+    
+    With a HuntResultCache, hunters whose report is cached for this exact
+    page content are skipped; a page that is fully cached is never parsed.
+    """
+    
+    def __init__(self, html_content: Optional[str], verbose: bool = True, write_reports: bool = True,
+                 document: Optional[HuntDocument] = None, cache: Optional[HuntResultCache] = None,
+                 parser: Optional[str] = None):
+        self.html_content = html_content
+        self.verbose = verbose
+        self.write_reports = write_reports
+        self.parser = resolve_parser(parser)
+        # Pages fixed in place (document given, no source text) are never cached
+        self.cache = cache if html_content is not None else None
+        self.page_hash = page_key(html_content, self.parser) if self.cache else None
+        # With a cache, parsing is deferred until a hunter actually misses
+        self.document = document or (None if self.cache else HuntDocument(html_content, parser=self.parser))
+        self.hunters = [
+            ColorContrastHunter(None, verbose=verbose, document=self.document),
+            ImageAccessibilityHunter(None, verbose=verbose, document=self.document),
+            SemanticHtmlHunter(None, verbose=verbose, document=self.document)
+        ]
+        self.engine = HuntRuleEngine(self.hunters)
+        self.all_reports = {}
+    
+    def run_all_hunts(self) -> Dict[str, Any]:
+        """Run all hunters in one traversal and collect reports"""
+        if self.verbose:
+            print("🎯 NEXUS WCAG Hunter System Starting...")
+            print("=" * 60)
+        
+        self._collect(self._hunt_cached())
+        
+        if self.verbose:
+            print("=" * 60)
+        return self.generate_master_report()
+    
+    def rerun_hunts(self, modified: Iterable[Tag]) -> Dict[str, Any]:
+        """Re-hunt after in-place fixes, re-evaluating only what the fixes touched"""
+        self.document.reindex()
+        self._collect(self.engine.rescan(self.document, modified))
+        return self.generate_master_report()
+    
+    def _parse(self) -> HuntDocument:
+        """The page's document, parsing it on first use"""
+        if self.document is None:
+            self.document = HuntDocument(self.html_content, parser=self.parser)
+            for hunter in self.hunters:
+                hunter.attach(self.document)
+        return self.document
+    
+    def _hunt(self, hunters: List[BaseWcagHunter]) -> Dict[str, Dict[str, Any]]:
+        """One traversal of the page by the given hunters"""
+        self._parse()
+        engine = self.engine if len(hunters) == len(self.hunters) else HuntRuleEngine(hunters)
+        return engine.run(self.document)
+    
+    def _hunt_cached(self) -> Dict[str, Dict[str, Any]]:
+        """Cached reports where available; one traversal by the hunters that missed"""
+        if self.cache is None:
+            return self._hunt(self.hunters)
+        keys = {hunter.__class__.__name__: hunter.cache_key(self.page_hash) for hunter in self.hunters}
+        reports = {}
+        for name, key in keys.items():
+            report = self.cache.get(key)
+            if report is not None:
+                reports[name] = report
+        missing = [hunter for hunter in self.hunters if hunter.__class__.__name__ not in reports]
+        if missing:
+            fresh = self._hunt(missing)
+            for name, report in fresh.items():
+                self.cache.put(keys[name], report)
+            reports.update(fresh)
+        return reports
+    
+    def _collect(self, reports: Dict[str, Dict[str, Any]]):
+        for hunter in self.hunters:
+            report = reports[hunter.__class__.__name__]
+            if self.write_reports:
+                hunter.write_report(report)
+            self.all_reports[hunter.__class__.__name__] = report
+            if self.verbose:
+                status_icon = "✅" if report['status'] == 'pass' else "⚠️"
+                print(f"{status_icon} {report['module']}: {report['status']} ({report['issues']} issues)")
+    
+    def generate_master_report(self) -> Dict[str, Any]:
+        """Generate master report combining all hunters"""
+        total_issues = sum(report['issues'] for report in self.all_reports.values())
+        critical_hunters = [
+            name for name, report in self.all_reports.items()
+            if report['status'] in ['critical', 'warn'] and report['issues'] > 0
+        ]
+        
+        master_status = "pass" if total_issues == 0 else "warn"
+        
+        master_report = {
+            "schemaVersion": 1,
+            "module": "wcag_master",
+            "status": master_status,
+            "total_issues": total_issues,
+            "hunters_run": len(self.hunters),
+            "critical_hunters": critical_hunters,
+            "hunter_reports": self.all_reports,
+            "summary": {
+                "wcag_a_compliance": self.calculate_compliance_level('A'),
+                "wcag_aa_compliance": self.calculate_compliance_level('AA'),
+                "estimated_fix_time_minutes": sum(
+                    report.get('eta_minutes', 0)
+                    for report in self.all_reports.values()
+                )
+            },
+            "next_actions": self.generate_next_actions()
+        }
+        
+        # Write master report
+        if self.write_reports:
+            report_dir = Path("__reports/hunt")
+            report_dir.mkdir(parents=True, exist_ok=True)
+            with open(report_dir / "wcag_master.json", 'w') as f:
+                json.dump(master_report, f, indent=2)
+        
+        return master_report
+    
+    def calculate_compliance_level(self, level: str) -> str:
+        """Calculate WCAG compliance level"""
+        # Simplified - in reality would check specific criteria per level
+        total_issues = sum(report['issues'] for report in self.all_reports.values())
+        
+        if total_issues == 0:
+            return "fully-compliant"
+        elif total_issues <= 5:
+            return "mostly-compliant"
+        else:
+            return "needs-work"
+    
+    def generate_next_actions(self) -> List[str]:
+        """Generate prioritized next actions from all hunters"""
+        all_actions = []
+        for report in self.all_reports.values():
+            if report['issues'] > 0:
+                all_actions.extend(report.get('actions', []))
+        
+        # Remove duplicates and prioritize
+        return list(dict.fromkeys(all_actions))[:5]  # Top 5 unique actions
+
+
+def compliance_score(total_issues: int) -> int:
+    """0-100 score, same formula as WcagHunterService.toIntelligenceData"""
+    return 100 if total_issues == 0 else max(0, 100 - total_issues * 10)
+
+
+def threat_level(total_issues: int) -> str:
+    """Threat level, same thresholds as WcagHunterService.toIntelligenceData"""
+    if total_issues == 0:
+        return "low"
+    return "medium" if total_issues <= 5 else "high"
+
+
+class WcagChecker:
+    """In-process WCAG checker - replaces the check-wcag.sh HTTP round trip
+    
+    Returns the same shape as the runtime's WcagCheckResult (wcag_report,
+    intelligence_data, compliance_summary, personality_analysis) without
+    printing, writing report files or touching the network. One instance can
+    score a page before and after fixing within the same process; session()
+    does so incrementally on a tree that is fixed in place. An optional
+    HuntResultCache makes re-checking unchanged pages free.
+    """
+    
+    def __init__(self, cache: Optional[HuntResultCache] = None, parser: Optional[str] = None):
+        self.cache = cache
+        self.parser = parser
+    
+    def check(self, html_content: str) -> Dict[str, Any]:
+        """Full structured check result for a page"""
+        orchestrator = WcagHunterOrchestrator(html_content, verbose=False, write_reports=False, cache=self.cache,
+                                              parser=self.parser)
+        return self.result(orchestrator.run_all_hunts())
+    
+    def result(self, master: Dict[str, Any]) -> Dict[str, Any]:
+        """Structured check result from a master report"""
+        total = master['total_issues']
+        findings = [
+            finding
+            for report in master['hunter_reports'].values()
+            for finding in report.get('findings', [])
+        ]
+        return {
+            "checker_version": CHECKER_VERSION,
+            "wcag_report": master,
+            "personality_analysis": analyze_with_personalities(master),
+            "intelligence_data": {
+                "source": "wcag_hunters",
+                "confidence": 1.0 if total == 0 else 0.8 if total <= 5 else 0.6,
+                "threatLevel": threat_level(total),
+                "wcagLevel": "AA",
+                "complianceScore": compliance_score(total),
+                "module": "wcag_master",
+                "findings": findings
+            },
+            "compliance_summary": {
+                "level_a": master['summary']['wcag_a_compliance'],
+                "level_aa": master['summary']['wcag_aa_compliance'],
+                "estimated_fix_time_minutes": master['summary']['estimated_fix_time_minutes']
+            }
+        }
+    
+    def score(self, html_content: str) -> Dict[str, Any]:
+        """Compact before/after score for a page"""
+        return self.summarize(self.check(html_content))
+    
+    def session(self, soup: BeautifulSoup) -> 'CheckSession':
+        """Incremental before/after scoring of an already-parsed page"""
+        return CheckSession(self, soup)
+    
+    @staticmethod
+    def summarize(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "total_issues": result['wcag_report']['total_issues'],
+            "compliance_score": result['intelligence_data']['complianceScore'],
+            "level_aa": result['compliance_summary']['level_aa'],
+            "threat_level": result['intelligence_data']['threatLevel']
+        }
+
+
+class CheckSession:
+    """Scores one parsed page, then re-scores it after in-place fixes
+    
+    The second score re-evaluates only the elements the fixer touched (plus
+    document-level rules) instead of re-parsing and re-scanning the page.
+    """
+    
+    def __init__(self, checker: WcagChecker, soup: BeautifulSoup):
+        self.checker = checker
+        self.orchestrator = WcagHunterOrchestrator(
+            None, verbose=False, write_reports=False, document=HuntDocument(None, soup=soup)
+        )
+    
+    def score(self) -> Dict[str, Any]:
+        return self.checker.summarize(self.checker.result(self.orchestrator.run_all_hunts()))
+    
+    def rescore(self, modified: Iterable[Tag]) -> Dict[str, Any]:
+        return self.checker.summarize(self.checker.result(self.orchestrator.rerun_hunts(modified)))
+
+
+def analyze_with_personalities(wcag_report: Dict[str, Any]) -> Dict[str, str]:
+    """Have NEXUS personalities analyze WCAG findings"""
+    total_issues = wcag_report['total_issues']
+    est_time = wcag_report['summary']['estimated_fix_time_minutes']
+    
+    return {
+        "guardian": f"🛡️  Found {total_issues} accessibility issues. Critical items must be addressed to ensure all users can access content. This affects usability for vision-impaired and motor-impaired users.",
+        "pragmatist": f"🔧 WCAG compliance impacts SEO and legal requirements. Estimated fix time: {est_time} minutes. Focus on Level AA for industry standard compliance.",
+        "architect": f"🏗️  Build accessibility into component patterns. {len(wcag_report['critical_hunters'])} areas need architectural attention. Consider baking WCAG checks into CSS Engine generation.",
+        "visionary": f"🚀 Accessibility enhances design for everyone. Color contrast and semantic structure improve user experience. Future: AI-powered alt text generation and real-time WCAG validation."
+    }
+
+
+# CLI Interface
+if __name__ == "__main__":
+    import sys
+    
+    # Reports for unchanged pages come from the result cache unless --no-cache;
+    # --json writes nothing to disk, so there the cache is opt-in (--cache)
+    use_cache = '--cache' in sys.argv if '--json' in sys.argv else '--no-cache' not in sys.argv
+    cache = HuntResultCache() if use_cache else None
+    args, parser = pop_parser_argument([arg for arg in sys.argv if arg not in ('--cache', '--no-cache')])
+    
+    if len(args) < 2:
+        print("Usage: python wcag_hunters.py <html_file>")
+        print("   or: python wcag_hunters.py --test")
+        print("   or: python wcag_hunters.py --json <html_file>   (structured check result, no report files;")
+        print("                                                    add --cache to use the result cache)")
+        print("   or: python wcag_hunters.py --stream <html_file> (bounded-memory scan for very large pages)")
+        print("   or: python wcag_site.py <dir|glob> ...         (parallel site audit, aggregated report)")
+        print("   Add --no-cache to bypass the result cache (tools/__reports/hunt/.cache)")
+        print("   Add --parser auto|lxml|html5lib|html.parser to pick the HTML backend (default auto)")
+        sys.exit(1)
+    
+    if args[1] == "--json":
+        with open(args[2], 'r', encoding='utf-8') as f:
+            print(json.dumps(WcagChecker(cache=cache, parser=parser).check(f.read()), indent=2))
+        sys.exit(0)
+    
+    if args[1] == "--stream":
+        from wcag_stream import StreamingWcagOrchestrator
+        orchestrator = StreamingWcagOrchestrator(args[2], cache=cache)
+    elif args[1] == "--test":
+        # Test with sample HTML
+        test_html = """
+        <!DOCTYPE html>
+        <html>
+            <body>
+                <div style="color: lightgray; background: white;">Low contrast text</div>
+                <img src="chart.png">
+                <div onclick="doSomething()">Clickable div</div>
+                <h1>Main heading</h1>
+                <h3>Jumped to h3</h3>
+            </body>
+        </html>
+        """
+        html_content = test_html
+    else:
+        # Read from file
+        with open(args[1], 'r') as f:
+            html_content = f.read()
+    
+    # Run hunters
+    if args[1] != "--stream":
+        orchestrator = WcagHunterOrchestrator(html_content, cache=None if args[1] == "--test" else cache,
+                                              parser=parser)
+    results = orchestrator.run_all_hunts()
+    
+    print("\n" + "="*60)
+    print("NEXUS WCAG HUNTER SYSTEM - MASTER REPORT")
+    print("="*60)
+    print(f"Status: {results['status'].upper()}")
+    print(f"Total Issues: {results['total_issues']}")
+    print(f"Critical Areas: {', '.join(results['critical_hunters']) if results['critical_hunters'] else 'None'}")
+    print(f"WCAG AA Compliance: {results['summary']['wcag_aa_compliance']}")
+    print(f"Estimated Fix Time: {results['summary']['estimated_fix_time_minutes']} minutes")
+    
+    print("\n🎭 Personality Analysis:")
+    analysis = analyze_with_personalities(results)
+    for personality, insight in analysis.items():
+        print(f"\n   {personality.upper()}:")
+        print(f"   {insight}")
+    
+    print("\n📋 Next Actions:")
+    for i, action in enumerate(results['next_actions'], 1):
+        print(f"   {i}. {action}")
+    
+    print("\n✅ Reports saved to __reports/hunt/")
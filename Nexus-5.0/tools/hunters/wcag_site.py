@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+NEXUS WCAG Site Hunt
+Audits whole sites (directories and/or globs) across a process pool
+
+- Pages fan out to one worker per core; each worker runs the hunters in-process
+- Every page gets its own report under <reports>/pages/ (unique, collision-free
+  names), so concurrent runs never overwrite a shared wcag_master.json
+- Counts, policy invariants, compliance levels and fix-time estimates are
+  merged into one aggregated <reports>/wcag_site_master.json
+- Workers share one result cache (<reports>/.cache), so pages unchanged since
+  the last run are not re-hunted
+- --dedup audits layout fragments shared between pages (headers, navs,
+  footers) once per worker and attributes their findings to every page that
+  includes them (see wcag_dedup.py)
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
+from html_parsers import pop_parser_argument, resolve_parser
+from hunt_cache import HuntResultCache
+from wcag_hunters import CHECKER_VERSION, WcagHunterOrchestrator
+
+DEFAULT_REPORT_DIR = "__reports/hunt"
+SITE_MASTER_FILENAME = "wcag_site_master.json"
+WORST_PAGES_LIMIT = 20
+
+INVARIANT_PATTERN = re.compile(r'counts\.(\w+)\s*==\s*(\d+)$')
+
+# Per-worker settings, set by the pool initializer
+_REPORT_DIR: Optional[Path] = None
+_STREAM = False
+_CACHE: Optional[HuntResultCache] = None
+_FRAGMENTS = None
+_PARSER: Optional[str] = None
+
+
+def discover_pages(targets: List[str]) -> List[Path]:
+    """HTML files from directories (recursive) and glob patterns, de-duplicated"""
+    pages = set()
+    for target in targets:
+        if os.path.isdir(target):
+            for root, _dirs, names in os.walk(target):
+                for name in names:
+                    if name.endswith(('.html', '.htm')):
+                        pages.add(Path(root) / name)
+        else:
+            for match in glob.glob(target, recursive=True):
+                if os.path.isfile(match):
+                    pages.add(Path(match))
+    return sorted(pages)
+
+
+def page_report_name(html_file: Path) -> str:
+    """Readable, collision-free report filename for a page"""
+    resolved = str(Path(html_file).resolve())
+    digest = hashlib.sha1(resolved.encode('utf-8')).hexdigest()[:10]
+    stem = re.sub(r'[^\w.-]+', '_', str(html_file).strip('./'))[-80:]
+    return f"{stem}.{digest}.json"
+
+
+def evaluate_invariant(report: Dict[str, Any], invariant: str) -> Optional[bool]:
+    """Evaluate a hunter policy invariant like 'counts.missing_alt == 0'"""
+    match = INVARIANT_PATTERN.match(invariant.strip())
+    if not match:
+        return None
+    return report.get('counts', {}).get(match.group(1), 0) == int(match.group(2))
+
+
+def _init_worker(report_dir: str, stream: bool, use_cache: bool, dedup: bool, parser: str):
+    global _REPORT_DIR, _STREAM, _CACHE, _FRAGMENTS, _PARSER
+    _REPORT_DIR = Path(report_dir) / "pages"
+    _REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    _STREAM = stream
+    _PARSER = parser
+    _CACHE = HuntResultCache(Path(report_dir) / ".cache") if use_cache else None
+    if dedup and not stream:
+        # One fragment index per worker; pages arrive in sorted chunks, so
+        # pages sharing a template mostly land on the same worker
+        from wcag_dedup import FragmentIndex
+        _FRAGMENTS = FragmentIndex()
+
+
+def hunt_page(html_file: str) -> Dict[str, Any]:
+    """Hunt one page, write its report, return a compact record; never raises"""
+    start = time.time()
+    record: Dict[str, Any] = {"file": html_file}
+    try:
+        if _STREAM:
+            from wcag_stream import StreamingWcagOrchestrator
+            orchestrator = StreamingWcagOrchestrator(html_file, verbose=False, write_reports=False,
+                                                     cache=_CACHE)
+        elif _FRAGMENTS is not None:
+            from wcag_dedup import DedupWcagOrchestrator
+            with open(html_file, 'r', encoding='utf-8', errors='replace') as f:
+                orchestrator = DedupWcagOrchestrator(f.read(), _FRAGMENTS, verbose=False,
+                                                     write_reports=False, cache=_CACHE, parser=_PARSER)
+        else:
+            with open(html_file, 'r', encoding='utf-8', errors='replace') as f:
+                orchestrator = WcagHunterOrchestrator(f.read(), verbose=False, write_reports=False,
+                                                      cache=_CACHE, parser=_PARSER)
+        master = orchestrator.run_all_hunts()
+        if _FRAGMENTS is not None and not _STREAM:
+            record["dedup"] = orchestrator.dedup
+
+        report_path = _REPORT_DIR / page_report_name(Path(html_file))
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump({"file": html_file, **master}, f, indent=2)
+
+        record.update({
+            "report": str(report_path),
+            "status": master['status'],
+            "total_issues": master['total_issues'],
+            "wcag_aa_compliance": master['summary']['wcag_aa_compliance'],
+            "estimated_fix_time_minutes": master['summary']['estimated_fix_time_minutes'],
+            "hunters": {
+                name: {
+                    "module": report['module'],
+                    "issues": report['issues'],
+                    "counts": report['counts'],
+                    "failed_invariants": [
+                        invariant for invariant in report.get('policy_invariants', [])
+                        if evaluate_invariant(report, invariant) is False
+                    ],
+                }
+                for name, report in master['hunter_reports'].items()
+            },
+        })
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.time() - start, 4)
+    return record
+
+
+class SiteHuntAggregator:
+    """Merges per-page records into one site-level master report"""
+
+    def __init__(self):
+        self.pages = 0
+        self.errors: List[Dict[str, str]] = []
+        self.total_issues = 0
+        self.fix_minutes = 0
+        self.compliance = Counter()
+        self.hunter_issues = Counter()
+        self.hunter_counts: Dict[str, Counter] = {}
+        self.hunter_pages_with_issues = Counter()
+        self.invariant_failures: Dict[str, Counter] = {}
+        self.modules: Dict[str, str] = {}
+        self.page_issues: List[Dict[str, Any]] = []
+        self.dedup: Optional[Counter] = None
+
+    def add(self, record: Dict[str, Any]):
+        self.pages += 1
+        if record["status"] == "error":
+            self.errors.append({"file": record["file"], "error": record["error"]})
+            return
+        self.total_issues += record["total_issues"]
+        self.fix_minutes += record["estimated_fix_time_minutes"]
+        self.compliance[record["wcag_aa_compliance"]] += 1
+        self.page_issues.append({"file": record["file"], "issues": record["total_issues"],
+                                 "report": record["report"]})
+        if "dedup" in record:
+            if self.dedup is None:
+                self.dedup = Counter()
+            self.dedup.update(record["dedup"])
+        for name, hunter in record["hunters"].items():
+            self.modules[name] = hunter["module"]
+            self.hunter_issues[name] += hunter["issues"]
+            if hunter["issues"]:
+                self.hunter_pages_with_issues[name] += 1
+            self.hunter_counts.setdefault(name, Counter()).update(hunter["counts"])
+            failures = self.invariant_failures.setdefault(name, Counter())
+            for invariant in hunter["failed_invariants"]:
+                failures[invariant] += 1
+
+    def master_report(self) -> Dict[str, Any]:
+        audited = self.pages - len(self.errors)
+        worst = sorted(self.page_issues, key=lambda p: p["issues"], reverse=True)[:WORST_PAGES_LIMIT]
+        return {
+            "schemaVersion": 1,
+            "module": "wcag_site_master",
+            "checker_version": CHECKER_VERSION,
+            "status": "pass" if self.total_issues == 0 and not self.errors else "warn",
+            "pages": self.pages,
+            "pages_audited": audited,
+            "pages_failed": len(self.errors),
+            "total_issues": self.total_issues,
+            "average_issues_per_page": round(self.total_issues / audited, 2) if audited else 0,
+            "compliance_distribution": dict(self.compliance),
+            "hunters": {
+                name: {
+                    "module": self.modules[name],
+                    "issues": self.hunter_issues[name],
+                    "pages_with_issues": self.hunter_pages_with_issues[name],
+                    "counts": dict(self.hunter_counts[name]),
+                    "policy_invariants": {
+                        invariant: {"pages_failing": count}
+                        for invariant, count in self.invariant_failures[name].items()
+                    },
+                }
+                for name in self.modules
+            },
+            "summary": {
+                "fully_compliant_pages": self.compliance.get("fully-compliant", 0),
+                "estimated_fix_time_minutes": self.fix_minutes,
+            },
+            "worst_pages": worst,
+            "errors": self.errors,
+            **({"template_dedup": dict(self.dedup)} if self.dedup is not None else {}),
+        }
+
+
+class SiteHunter:
+    """Fans pages out across a process pool and aggregates their reports"""
+
+    def __init__(self, targets: List[str], workers: Optional[int] = None,
+                 report_dir: str = DEFAULT_REPORT_DIR, stream: bool = False, chunksize: int = 8,
+                 use_cache: bool = True, dedup: bool = False, parser: Optional[str] = None):
+        self.targets = targets
+        self.workers = workers or os.cpu_count() or 1
+        self.report_dir = Path(report_dir)
+        self.stream = stream
+        self.use_cache = use_cache
+        self.dedup = dedup
+        self.parser = resolve_parser(parser)
+        self.chunksize = chunksize
+        self.aggregator = SiteHuntAggregator()
+        self.master_path = self.report_dir / SITE_MASTER_FILENAME
+
+    def run(self) -> Iterator[Dict[str, Any]]:
+        """Yield per-page records as workers finish; writes the site master at the end"""
+        pages = [str(p) for p in discover_pages(self.targets)]
+        if pages:
+            with Pool(self.workers, initializer=_init_worker,
+                      initargs=(str(self.report_dir), self.stream, self.use_cache, self.dedup,
+                                self.parser)) as pool:
+                for record in pool.imap_unordered(hunt_page, pages, chunksize=self.chunksize):
+                    self.aggregator.add(record)
+                    yield record
+
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.master_path, 'w', encoding='utf-8') as f:
+            json.dump(self.aggregator.master_report(), f, indent=2)
+
+
+def main():
+    targets, workers, report_dir = [], None, DEFAULT_REPORT_DIR
+    cli_args, parser = pop_parser_argument(sys.argv[1:])
+    argv = iter(cli_args)
+    for arg in argv:
+        if arg == '--workers':
+            workers = int(next(argv))
+        elif arg == '--reports':
+            report_dir = next(argv)
+        elif not arg.startswith('--'):
+            targets.append(arg)
+
+    if not targets:
+        print("Usage: wcag_site.py <dir|glob> [<dir|glob> ...] [--workers N] [--reports DIR] "
+              "[--stream] [--dedup] [--no-cache] [--parser NAME] [--quiet]")
+        sys.exit(1)
+
+    quiet = '--quiet' in sys.argv
+    hunter = SiteHunter(targets, workers=workers, report_dir=report_dir, stream='--stream' in sys.argv,
+                        use_cache='--no-cache' not in sys.argv, dedup='--dedup' in sys.argv,
+                        parser=parser)
+
+    print("🎯 NEXUS WCAG SITE HUNT")
+    print(f"   Parser: {hunter.parser}")
+    print("=" * 60)
+    start = time.time()
+    for record in hunter.run():
+        if quiet:
+            continue
+        if record["status"] == "error":
+            print(f"⚠️  [{hunter.aggregator.pages}] {record['file']} ({record['error']})")
+        else:
+            icon = "✅" if record["total_issues"] == 0 else "🔍"
+            print(f"{icon} [{hunter.aggregator.pages}] {record['file']} ({record['total_issues']} issues)")
+    elapsed = time.time() - start
+
+    master = hunter.aggregator.master_report()
+    print("=" * 60)
+    print("📈 Site Summary:")
+    print(f"   Pages: {master['pages']} (failed: {master['pages_failed']})")
+    print(f"   Total Issues: {master['total_issues']} ({master['average_issues_per_page']}/page)")
+    print(f"   Fully Compliant Pages: {master['summary']['fully_compliant_pages']}")
+    for name, hunter_summary in master['hunters'].items():
+        print(f"   {hunter_summary['module']}: {hunter_summary['issues']} issues on "
+              f"{hunter_summary['pages_with_issues']} pages")
+    print(f"   Estimated Fix Time: {master['summary']['estimated_fix_time_minutes']} minutes")
+    if 'template_dedup' in master and master['template_dedup'].get('elements'):
+        dedup = master['template_dedup']
+        print(f"   Template Dedup: {dedup['elements_reused']}/{dedup['elements']} elements "
+              f"taken from shared fragments")
+    if master['pages']:
+        print(f"   Throughput: {master['pages'] / max(elapsed, 1e-9):.1f} pages/sec "
+              f"({hunter.workers} workers, {elapsed:.1f}s)")
+    print(f"\n📋 Site master report: {hunter.master_path}")
+    print(f"📁 Page reports: {hunter.report_dir / 'pages'}/")
+
+    sys.exit(1 if master['pages_failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
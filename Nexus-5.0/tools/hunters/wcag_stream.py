@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+NEXUS WCAG Streaming Scan
+Bounded-memory hunting for very large (tens of MB) generated pages
+
+The page is read in chunks and fed to an incremental html.parser tokenizer.
+Every start tag becomes a lightweight StreamElement that is dispatched to the
+regular hunters through HuntRuleEngine, so alt, lang, landmark, heading-order
+and inline-contrast rules are evaluated on the fly. Only the stack of open
+elements is kept; no tree and no full copy of the document.
+
+Findings carry {"tag", "line", "offset"} (offset is the byte offset of the
+start tag in the file) instead of serialized markup. With a result cache the
+file is hashed first (also in chunks) and unchanged pages are not re-streamed.
+"""
+
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional
+
+from hunt_cache import HuntResultCache, file_digest
+from wcag_hunters import (
+    BaseWcagHunter, ColorContrastHunter, HuntRuleEngine, ImageAccessibilityHunter,
+    SemanticHtmlHunter, WcagHunterOrchestrator
+)
+
+CHUNK_SIZE = 1 << 16
+
+VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+})
+
+
+def _utf8(value: Optional[str]) -> str:
+    """Undo the latin-1 byte mapping for an attribute value"""
+    if value is None:
+        return ''
+    try:
+        return value.encode('latin-1').decode('utf-8')
+    except UnicodeError:
+        return value
+
+
+class StreamElement:
+    """Start tag seen by the streaming tokenizer; quacks like a bs4 Tag for the hunters"""
+
+    __slots__ = ('name', 'attrs', 'parent', 'line', 'offset', 'source')
+
+    def __init__(self, name: str, attrs: Dict[str, str], parent: Optional['StreamElement'],
+                 line: int, offset: int, source: str):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.line = line
+        self.offset = offset
+        self.source = source
+
+    def get(self, key: str, default=None):
+        return self.attrs.get(key, default)
+
+    def has_attr(self, key: str) -> bool:
+        return key in self.attrs
+
+    @property
+    def source_location(self) -> Dict[str, Any]:
+        return {"tag": self.name, "line": self.line, "offset": self.offset}
+
+    def __str__(self) -> str:
+        return self.source
+
+
+class StreamingHuntParser(HTMLParser):
+    """Incremental tokenizer that dispatches start tags to a HuntRuleEngine
+
+    Input is decoded as latin-1 so every character is exactly one byte: the
+    tokenizer's positions are then byte offsets, whatever the page encoding.
+    Attribute values are mapped back to UTF-8 before the rules see them.
+    """
+
+    def __init__(self, engine: HuntRuleEngine):
+        super().__init__(convert_charrefs=True)
+        self.engine = engine
+        self.open_elements: List[StreamElement] = []
+        self.elements_seen = 0
+        self._fed = 0
+        self._base = 0
+        self._position = 0
+
+    def feed(self, data: str):
+        # rawdata indices seen by updatepos() are relative to this base
+        self._base = self._fed - len(self.rawdata)
+        self._fed += len(data)
+        super().feed(data)
+
+    def close(self):
+        self._base = self._fed - len(self.rawdata)
+        super().close()
+
+    def updatepos(self, i: int, j: int) -> int:
+        # goahead() always advances to a tag's start before parsing it
+        self._position = self._base + j
+        return super().updatepos(i, j)
+
+    def handle_starttag(self, tag: str, attrs):
+        parent = self.open_elements[-1] if self.open_elements else None
+        element = StreamElement(
+            tag,
+            {name: _utf8(value) for name, value in attrs},
+            parent,
+            self.getpos()[0],
+            self._position,
+            _utf8(self.get_starttag_text())
+        )
+        self.elements_seen += 1
+        self.engine.visit(element)
+        if tag not in VOID_ELEMENTS:
+            self.open_elements.append(element)
+
+    def handle_endtag(self, tag: str):
+        # Tolerate unclosed children: pop back to the nearest matching open element
+        for index in range(len(self.open_elements) - 1, -1, -1):
+            if self.open_elements[index].name == tag:
+                del self.open_elements[index:]
+                return
+
+
+class StreamingWcagOrchestrator(WcagHunterOrchestrator):
+    """WcagHunterOrchestrator over a file stream instead of a parsed document"""
+
+    def __init__(self, html_path: str, verbose: bool = True, write_reports: bool = True,
+                 chunk_size: int = CHUNK_SIZE, cache: Optional[HuntResultCache] = None):
+        self.html_path = Path(html_path)
+        self.html_content = None
+        self.document = None
+        self.verbose = verbose
+        self.write_reports = write_reports
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.page_hash = file_digest(self.html_path, chunk_size) if cache else None
+        self.hunters = [
+            ColorContrastHunter(None, verbose=verbose),
+            ImageAccessibilityHunter(None, verbose=verbose),
+            SemanticHtmlHunter(None, verbose=verbose)
+        ]
+        self.engine = HuntRuleEngine(self.hunters)
+        self.all_reports = {}
+        self.elements_seen = 0
+
+    def stream(self, source: BinaryIO, engine: Optional[HuntRuleEngine] = None) -> Dict[str, Dict[str, Any]]:
+        """Feed a binary stream through the tokenizer; returns per-hunter reports"""
+        engine = engine or self.engine
+        engine.begin()
+        parser = StreamingHuntParser(engine)
+        for chunk in iter(lambda: source.read(self.chunk_size), b''):
+            parser.feed(chunk.decode('latin-1'))
+        parser.close()
+        self.elements_seen = parser.elements_seen
+        return engine.finish()
+
+    def _hunt(self, hunters: List[BaseWcagHunter]) -> Dict[str, Dict[str, Any]]:
+        engine = self.engine if len(hunters) == len(self.hunters) else HuntRuleEngine(hunters)
+        with open(self.html_path, 'rb') as f:
+            return self.stream(f, engine)
+
+    def run_all_hunts(self) -> Dict[str, Any]:
+        """Stream the page through all hunters and collect reports"""
+        if self.verbose:
+            print(f"🎯 NEXUS WCAG Hunter System Starting (streaming {self.html_path})...")
+            print("=" * 60)
+
+        self._collect(self._hunt_cached())
+
+        if self.verbose:
+            print("=" * 60)
+        return self.generate_master_report()
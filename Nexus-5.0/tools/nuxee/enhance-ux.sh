@@ -16,7 +16,7 @@ MAGENTA='\033[0;35m'
 NC='\033[0m'
 
 if [ $# -lt 1 ]; then
-    echo "Usage: $0 <input.html>"
+    echo "Usage: $0 <input.html> [--write-json]"
     echo ""
     echo "Example: $0 docs/my-page.html"
     echo ""
@@ -25,10 +25,17 @@ if [ $# -lt 1 ]; then
     echo "  2. Analyze with adaptive intelligence"
     echo "  3. Apply selected patterns"
     echo "  4. Verify AAA compliance"
+    echo ""
+    echo "Stages 1-3 run in one Python process; --write-json also keeps their"
+    echo "intermediate opportunities/enhancements JSON files."
     exit 1
 fi
 
 INPUT_FILE="$1"
+WRITE_JSON=0
+if [ "${2:-}" = "--write-json" ]; then
+    WRITE_JSON=1
+fi
 BASENAME=$(basename "$INPUT_FILE" .html)
 DIRNAME=$(dirname "$INPUT_FILE")
 
@@ -47,54 +54,27 @@ echo -e "${BLUE}📄 Input: $INPUT_FILE${NC}"
 echo -e "${BLUE}📊 Output: $OUTPUT_FILE${NC}"
 echo ""
 
-# Stage 1: Detect Opportunities
-echo "═══════════════════════════════════════════════════════════════"
-echo -e "${CYAN}Stage 1: Detecting UX Opportunities${NC}"
-echo "═══════════════════════════════════════════════════════════════"
-echo ""
-
-python3 "$SCRIPT_DIR/generate-opportunities.py" "$INPUT_FILE"
-
-if [ ! -f "$OPPORTUNITIES_FILE" ]; then
-    echo -e "${RED}✗ Failed to generate opportunities file${NC}"
-    exit 1
-fi
-
-TOTAL_OPP=$(jq -r '.total_opportunities' "$OPPORTUNITIES_FILE")
-echo -e "${GREEN}✅ Found $TOTAL_OPP UX opportunities${NC}"
-echo ""
-
-# Stage 2: Intelligent Analysis
+# Stages 1-3: Detect, Analyze, Apply (one in-process engine run)
 echo "═══════════════════════════════════════════════════════════════"
-echo -e "${CYAN}Stage 2: Adaptive Intelligence Analysis${NC}"
+echo -e "${CYAN}Stages 1-3: Detect → Analyze → Apply${NC}"
 echo "═══════════════════════════════════════════════════════════════"
 echo ""
 
-python3 "$SCRIPT_DIR/nexus-ux-analyzer.py" "$INPUT_FILE" "$OPPORTUNITIES_FILE"
-
-if [ ! -f "$ENHANCEMENTS_FILE" ]; then
-    echo -e "${RED}✗ Failed to generate enhancements file${NC}"
-    exit 1
+ENGINE_ARGS=("$INPUT_FILE" --json)
+if [ "$WRITE_JSON" = "1" ]; then
+    ENGINE_ARGS+=(--write-json)
 fi
 
-PATTERNS_SELECTED=$(jq -r '.summary.patterns_selected' "$ENHANCEMENTS_FILE")
-APPLICATIONS=$(jq -r '.summary.total_applications' "$ENHANCEMENTS_FILE")
-echo -e "${GREEN}✅ Selected $PATTERNS_SELECTED patterns ($APPLICATIONS applications)${NC}"
-echo ""
-
-# Stage 3: Apply Patterns
-echo "═══════════════════════════════════════════════════════════════"
-echo -e "${CYAN}Stage 3: Applying UX Patterns${NC}"
-echo "═══════════════════════════════════════════════════════════════"
-echo ""
-
-python3 "$SCRIPT_DIR/nexus-ux-applier.py" "$INPUT_FILE" "$ENHANCEMENTS_FILE"
-
-if [ ! -f "$OUTPUT_FILE" ]; then
+if ! SUMMARY=$(python3 "$SCRIPT_DIR/nexus-ux-enhance.py" "${ENGINE_ARGS[@]}") || [ ! -f "$OUTPUT_FILE" ]; then
     echo -e "${RED}✗ Failed to generate enhanced HTML${NC}"
     exit 1
 fi
 
+TOTAL_OPP=$(jq -r '.total_opportunities' <<< "$SUMMARY")
+PATTERNS_SELECTED=$(jq -r '.patterns_selected' <<< "$SUMMARY")
+APPLICATIONS=$(jq -r '.total_applications' <<< "$SUMMARY")
+echo -e "${GREEN}✅ Found $TOTAL_OPP UX opportunities${NC}"
+echo -e "${GREEN}✅ Selected $PATTERNS_SELECTED patterns ($APPLICATIONS applications)${NC}"
 echo -e "${GREEN}✅ Patterns successfully applied${NC}"
 echo ""
 
@@ -137,8 +117,10 @@ if [ -f "$AAA_REPORT" ]; then
 fi
 echo ""
 echo -e "${BLUE}📁 Generated Files:${NC}"
-echo -e "   • $OPPORTUNITIES_FILE"
-echo -e "   • $ENHANCEMENTS_FILE"
+if [ "$WRITE_JSON" = "1" ]; then
+    echo -e "   • $OPPORTUNITIES_FILE"
+    echo -e "   • $ENHANCEMENTS_FILE"
+fi
 echo -e "   • $OUTPUT_FILE"
 if [ -f "$AAA_REPORT" ]; then
     echo -e "   • $AAA_REPORT"
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+NEXUS HTML Patching
+Offset-based edits to the original markup, without a parse/serialize round trip
+
+UXPatternApplier only adds a <style>/<link> to the head and a few attributes
+(data-scroll-reveal, lazy-fade, data-count-up). Rather than building a
+BeautifulSoup tree and re-serializing every byte, iter_tags streams just the
+tags involved (skipping comments and script/style contents) and HTMLPatch
+splices the edits into the original string. Untouched markup comes out byte
+for byte as it went in, and the Python work scales with the tags asked for.
+tag_at picks up a tag at a known offset, so callers holding an element index
+(ux_opportunities) edit those tags without searching at all.
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from rule_patterns import RAW_TEXT_END, TAG_ATTRIBUTE_TEXT
+
+# The name ends where the attributes (or '>') begin, so it can't backtrack into them
+TAG_NAME = r'[a-zA-Z][a-zA-Z0-9:-]*(?![a-zA-Z0-9:-])'
+TAG_ATTRIBUTES = r'(?P<attrs>' + TAG_ATTRIBUTE_TEXT + ')'
+# One attribute in a start tag's attribute text (quoted values consumed whole)
+ATTRIBUTE = re.compile(
+    r'(?P<name>[^\s"\'>/=]+)(?:\s*=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<bare>[^\s"\'>]*)))?'
+)
+DOCTYPE = re.compile(r'\s*<!doctype[^>]*>', re.IGNORECASE)
+# Elements that never have content (no end tag)
+VOID_ELEMENTS = frozenset({'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+                           'source', 'track', 'wbr'})
+
+
+@lru_cache(maxsize=None)
+def _tag_token(names: Optional[Tuple[str, ...]]) -> re.Pattern:
+    """Comments, plus start/end tags of the given names (None = every tag)"""
+    if names is None:
+        name = TAG_NAME
+    else:
+        name = '(?:' + '|'.join(sorted(set(names) | set(RAW_TEXT_END))) + r')(?=[\s/>])'
+    return re.compile(r'<!--.*?-->|<(?P<close>/)?(?P<name>' + name + ')' + TAG_ATTRIBUTES + '>',
+                      re.IGNORECASE | re.DOTALL)
+
+
+@dataclass
+class Tag:
+    """One start or end tag, located by offsets into the page"""
+    name: str
+    start: int
+    end: int
+    attrs: str
+    closing: bool = False
+
+    @property
+    def attrs_start(self) -> int:
+        return self.end - 1 - len(self.attrs)
+
+    @property
+    def insert_at(self) -> int:
+        """Where new attributes go: before '>' (or before a self-closing '/')"""
+        attrs = self.attrs
+        if attrs.endswith('/'):
+            attrs = attrs[:-1].rstrip()
+        return self.attrs_start + len(attrs)
+
+    def attribute(self, name: str) -> Optional[Tuple[str, int, int]]:
+        """(value, start, end) of the first `name` attribute, offsets into the page"""
+        for match in ATTRIBUTE.finditer(self.attrs):
+            if match.group('name').lower() == name:
+                value = next((v for v in match.group('dq', 'sq', 'bare') if v is not None), '')
+                return value, self.attrs_start + match.start(), self.attrs_start + match.end()
+        return None
+
+    def classes(self) -> str:
+        found = self.attribute('class')
+        return found[0] if found else ''
+
+
+def iter_tags(html: str, names: Optional[Iterable[str]] = None, start: int = 0) -> Iterator[Tag]:
+    """
+    Start and end tags of the given names (None = all), in document order
+    Comments and script/style contents are skipped.
+    """
+    token = _tag_token(None if names is None else tuple(sorted(names)))
+    wanted = None if names is None else frozenset(names)
+    position = start
+    while True:
+        match = token.search(html, position)
+        if match is None:
+            return
+        position = match.end()
+        name = match.group('name')
+        if name is None:
+            continue
+        name = name.lower()
+        closing = match.group('close') is not None
+        if not closing and name in RAW_TEXT_END:
+            end = RAW_TEXT_END[name].search(html, position)
+            position = end.end() if end else len(html)
+        if wanted is None or name in wanted:
+            yield Tag(name, match.start(), match.end(), match.group('attrs'), closing)
+
+
+def tag_at(html: str, offset: int) -> Optional[Tag]:
+    """The start tag beginning exactly at offset (e.g. from an element index), or None"""
+    match = _tag_token(None).match(html, offset)
+    if match is None or match.group('name') is None or match.group('close') is not None:
+        return None
+    return Tag(match.group('name').lower(), match.start(), match.end(), match.group('attrs'))
+
+
+class HTMLPatch:
+    """Insertions and replacements against the original markup, spliced in one go"""
+
+    def __init__(self, html: str):
+        self.html = html
+        self.edits: List[Tuple[int, int, int, str]] = []
+
+    def insert(self, offset: int, text: str):
+        self.replace(offset, offset, text)
+
+    def replace(self, start: int, end: int, text: str):
+        self.edits.append((start, end, len(self.edits), text))
+
+    def set_attribute(self, tag: Tag, name: str, value: str):
+        """Set (or overwrite) one attribute of a start tag"""
+        found = tag.attribute(name)
+        if found is None:
+            self.insert(tag.insert_at, f' {name}="{_quote(value)}"')
+        else:
+            _, start, end = found
+            self.replace(start, end, f'{self.html[start:start + len(name)]}="{_quote(value)}"')
+
+    def add_class(self, tag: Tag, class_name: str):
+        """Append a class to a start tag's class list"""
+        found = tag.attribute('class')
+        if found is None:
+            self.set_attribute(tag, 'class', class_name)
+        else:
+            value = found[0].strip()
+            self.set_attribute(tag, 'class', f"{value} {class_name}" if value else class_name)
+
+    def head_insertion_point(self) -> Tuple[int, bool]:
+        """
+        (offset, inside_head) for content that belongs at the end of <head>
+        Without </head> that is before <body>; without any head, right after
+        <html> (or the doctype) with inside_head False so the caller wraps
+        its content in <head>...</head>.
+        """
+        html_tag, head_open = None, False
+        for tag in iter_tags(self.html, ('html', 'head', 'body')):
+            if tag.closing:
+                if tag.name == 'head':
+                    return tag.start, True
+            elif tag.name == 'head':
+                head_open = True
+            elif tag.name == 'body':
+                if head_open:
+                    return tag.start, True
+                break
+            elif html_tag is None:
+                html_tag = tag
+        if head_open:
+            return len(self.html), True
+        if html_tag is not None:
+            return html_tag.end, False
+        doctype = DOCTYPE.match(self.html)
+        return (doctype.end() if doctype else 0), False
+
+    def apply(self) -> str:
+        """The patched markup"""
+        if not self.edits:
+            return self.html
+        parts, position = [], 0
+        for start, end, _, text in sorted(self.edits):
+            parts.append(self.html[position:start])
+            parts.append(text)
+            position = max(position, end)
+        parts.append(self.html[position:])
+        return "".join(parts)
+
+
+def start_tag(name: str, attributes: Dict[str, str]) -> str:
+    """Markup for a new start tag"""
+    return f"<{name}" + "".join(f' {key}="{_quote(value)}"' for key, value in attributes.items()) + ">"
+
+
+def _quote(value: str) -> str:
+    return value.replace('"', '&quot;')
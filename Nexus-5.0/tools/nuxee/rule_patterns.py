@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+NEXUS Compiled Rule Patterns
+Module-level registry of the regexes shared across the WCAG/UX toolchain
+
+Every pattern is compiled once at import. Related checks are folded into a
+single alternation with named groups, so one scan answers several rules:
+`match.lastgroup` says which rule fired.
+"""
+
+import re
+from typing import Dict, Optional
+
+# -- alt text / images ---------------------------------------------------------
+
+# Alt text that is a filename, a numbered placeholder or a hash (matched lowercased)
+SUSPICIOUS_ALT = re.compile(
+    r'(?P<filename>\.(?:jpg|jpeg|png|gif|webp)$)'
+    r'|(?P<placeholder>^(?:image|img|picture)\d*$)'
+    r'|(?P<hash>^[0-9a-f]{8,}$)'
+)
+
+IMAGE_EXTENSION = re.compile(r'\.(jpg|jpeg|png|gif|svg|webp)$', re.IGNORECASE)
+IMG_TAG = re.compile(r'<img\b(?P<attrs>[^>]*?)\s*/?>', re.IGNORECASE)
+SRC_ATTRIBUTE = re.compile(r'src=["\']([^"\']+)["\']', re.IGNORECASE)
+ALT_ATTRIBUTE = re.compile(r'\balt\s*=', re.IGNORECASE)
+
+# -- landmarks -----------------------------------------------------------------
+
+# A div whose class/id suggests it is really a landmark
+LANDMARK_DIVS: Dict[str, re.Pattern] = {
+    landmark: re.compile(r'<div[^>]*(?:class|id)=["\'].*?(?:' + keywords + r')[^"\']*["\'][^>]*>', re.IGNORECASE)
+    for landmark, keywords in (
+        ('nav', 'nav|menu|navigation'),
+        ('header', 'header'),
+        ('footer', 'footer'),
+    )
+}
+
+# -- inline styles -------------------------------------------------------------
+
+COLOR_STYLE = re.compile(r'color|background')
+INLINE_COLOR = re.compile(r'(^|;)(\s*)color\s*:[^;]*', re.IGNORECASE)
+
+# -- markup tokenizer ----------------------------------------------------------
+
+# A start tag's attribute text up to its closing '>', quoted values consumed
+# whole. Written as an unrolled loop (each character can only be matched one
+# way) so a tag with an unterminated quote fails in linear time without the
+# 3.11-only possessive quantifiers.
+TAG_ATTRIBUTE_TEXT = r'[^>"\']*(?:(?:"[^"]*"|\'[^\']*\')[^>"\']*)*'
+
+# One token per comment, landmark end tag, start tag the opportunity scanner
+# counts by name (plus landmarks, and script/style, whose contents are skipped)
+# or other start tag carrying a class attribute. Every other tag is skipped
+# inside the regex engine.
+LANDMARK_TAGS = ('nav', 'form', 'header', 'main', 'aside', 'footer')
+SCANNED_TAGS = ('a', 'button', 'textarea', 'select', 'article', 'nav', 'form', 'img', 'section',
+                'input', 'script', 'style', 'header', 'main', 'aside', 'footer')
+OPPORTUNITY_TOKEN = re.compile(
+    r'<!--.*?-->'
+    r'|</(?P<close>' + '|'.join(LANDMARK_TAGS) + r')\s*>'
+    r'|<(?P<name>' + '|'.join(SCANNED_TAGS) + r')(?=[\s/>])(?P<attrs>' + TAG_ATTRIBUTE_TEXT + r')>'
+    r'|<[a-zA-Z][a-zA-Z0-9:-]*(?=\s)'
+    r'(?P<classed>[^>"\'c]*(?:(?:"[^"]*"|\'[^\']*\'|c(?!lass\b))[^>"\'c]*)*class\b' + TAG_ATTRIBUTE_TEXT + r')>',
+    re.IGNORECASE | re.DOTALL
+)
+# Single attribute lookups within a tag's attribute text
+ATTRIBUTE_VALUE = {
+    name: re.compile(r'(?:^|[\s"\'])' + name + r'\s*=\s*(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<bare>[^\s"\'>]+))',
+                     re.IGNORECASE)
+    for name in ('class', 'type')
+}
+START_TAG_NAME = re.compile(r'<([a-zA-Z][a-zA-Z0-9:-]*)')
+HREF_ATTRIBUTE = re.compile(r'(?:^|[\s"\'])href(?=[\s=/>]|$)', re.IGNORECASE)
+# Elements whose content is raw text, not markup
+RAW_TEXT_END = {name: re.compile(rf'</{name}\s*>', re.IGNORECASE) for name in ('script', 'style')}
+
+# -- page context --------------------------------------------------------------
+
+# Keywords ContextAnalyzer looks for in the lowercased page
+DESIGN_STYLE_KEYWORDS = {
+    "minimal": ("clean", "simple", "minimalist", "sans-serif"),
+    "material": ("elevation", "shadow", "card", "material"),
+    "corporate": ("professional", "business", "enterprise"),
+    "playful": ("colorful", "fun", "creative", "vibrant"),
+}
+PAGE_INTENT_KEYWORDS = {
+    "conversion": ("book", "buy", "subscribe", "sign up", "pricing", "charter", "reserve"),
+    "information": ("about", "learn", "guide", "documentation", "information"),
+    "entertainment": ("gallery", "showcase", "portfolio", "explore"),
+    "utility": ("calculator", "tool", "dashboard", "search"),
+}
+EXISTING_PATTERN_KEYWORDS = {
+    "transitions": ("transition",),
+    "transforms": ("transform",),
+    "animations": ("@keyframes", "animation"),
+    "shadows": ("box-shadow",),
+    "hover_states": ("hover",),
+}
+# Every keyword above, each checked once per page
+CONTEXT_KEYWORDS = tuple(dict.fromkeys(
+    keyword for table in (DESIGN_STYLE_KEYWORDS, PAGE_INTENT_KEYWORDS, EXISTING_PATTERN_KEYWORDS)
+    for keywords in table.values() for keyword in keywords
+))
+# One pass counts every element and, in group 1, the content tags used for layout density
+ELEMENT_OPEN = re.compile(r'<(?:((?i:div|section|article|aside|nav))|[a-zA-Z])')
+HEX_COLOR = re.compile(r'#[0-9a-fA-F]{6}')
+
+
+def suspicious_alt_reason(alt_text: str) -> Optional[str]:
+    """Which suspicious-alt rule an alt text trips ('filename', 'placeholder', 'hash'), if any"""
+    match = SUSPICIOUS_ALT.search(alt_text.lower())
+    return match.lastgroup if match else None
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Applier - Pattern Application Engine
+Injects intelligent UX enhancements into HTML while maintaining AAA compliance
+
+Importable stage behind nexus-ux-applier.py and nexus-ux-enhance.py. Edits
+are spliced into the original markup (html_patch): only the injected CSS and
+the touched start tags change, so apply time follows the number of edits and
+the rest of the page is left byte for byte as it was. The tags to touch come
+straight from the opportunity scan's element index when the enhancements
+carry one (and it still fits the markup); otherwise they are searched for.
+"""
+
+import re
+from itertools import islice
+from typing import Collection, Dict, Iterable, List, Optional
+
+from html_patch import VOID_ELEMENTS, HTMLPatch, Tag, iter_tags, start_tag, tag_at
+from ux_css import (
+    ENHANCEMENTS_HEADER, MOTION_SAFETY_HEADER, PATTERNS_ATTRIBUTE, PatternCSS, compile_pattern,
+    compile_pattern_css
+)
+from ux_opportunities import ELEMENT_COLUMNS
+
+STAT_CLASS = re.compile(r'stat')
+STAT_NUMBER_CLASS = re.compile(r'number|count')
+# Sections that get data-scroll-reveal
+SCROLL_REVEAL_LIMIT = 4
+# Element-index category and tag name of the elements each pattern edits
+PATTERN_ELEMENTS = {
+    "scroll_reveal": ("sections", "section"),
+    "image_lazy_fade": ("images", "img"),
+    "stat_count_up": ("statistics", None),
+}
+
+
+class UXPatternApplier:
+    """Applies UX patterns to HTML with surgical precision"""
+    
+    def __init__(self, pattern_library: Dict, enhancements: Dict,
+                 pattern_css: Optional[PatternCSS] = None, stylesheet_href: Optional[str] = None):
+        self.patterns = pattern_library["patterns"]
+        self.enhancements = enhancements
+        self.pattern_css = pattern_css or compile_pattern_css(pattern_library)
+        # Link this shared stylesheet (ux_css.PatternCSS.stylesheet) instead of inlining CSS
+        self.stylesheet_href = stylesheet_href
+        self.applied_count = 0
+        self.applied_ids = []
+        self.css_blocks = []
+        
+    def apply_enhancements(self, html_content: str) -> str:
+        """Apply all selected enhancements to HTML"""
+        patch = HTMLPatch(html_content)
+        
+        # Build CSS from selected patterns
+        self._build_css()
+        
+        # Inject CSS into head
+        self._inject_css(patch)
+        
+        # Apply element-specific enhancements
+        self._apply_to_elements(patch)
+        
+        return patch.apply()
+    
+    def _build_css(self):
+        """Assemble the compiled CSS blocks of all selected patterns"""
+        css_parts = []
+        
+        # Add motion safety first
+        if self.pattern_css.motion_safety:
+            css_parts.append(f"{MOTION_SAFETY_HEADER}{self.pattern_css.motion_safety}")
+        
+        css_parts.append(ENHANCEMENTS_HEADER)
+        
+        selections = self.enhancements.get("selections", {})
+        
+        for opp_type, selection_data in selections.items():
+            for sel in selection_data.get("selected_patterns", []):
+                pattern = sel["pattern"]
+                score = sel["score"]
+                
+                css = self._pattern_css(pattern)
+                if css:
+                    css_parts.append(f"\n/* {pattern['name']} (Score: {score:.1f}/100) */")
+                    css_parts.append(css)
+                    self.applied_count += 1
+                    self.applied_ids.append(pattern["id"])
+        
+        self.css_blocks = css_parts
+    
+    def _pattern_css(self, pattern: Dict) -> str:
+        """Compiled CSS for a selected pattern (compiled here if it isn't the library's)"""
+        pattern_id = pattern.get("id")
+        if pattern_id in self.pattern_css.inline and self.patterns.get(pattern_id) == pattern:
+            return self.pattern_css.inline[pattern_id]
+        return compile_pattern(pattern)
+    
+    def _inject_css(self, patch: HTMLPatch):
+        """Inject generated CSS (or the shared stylesheet link) at the end of the head"""
+        html_tag = None
+        if self.stylesheet_href:
+            html_tag = next((tag for tag in iter_tags(patch.html, ('html',)) if not tag.closing), None)
+        
+        if html_tag is not None:
+            # Scoped rules in the shared sheet apply to the patterns listed on <html>
+            patterns = [pid for pid in dict.fromkeys(self.applied_ids) if pid in self.pattern_css.scoped]
+            if patterns:
+                patch.set_attribute(html_tag, PATTERNS_ATTRIBUTE, " ".join(patterns))
+            markup = start_tag('link', {'rel': 'stylesheet', 'href': self.stylesheet_href,
+                                        'data-nexus-ux': 'adaptive'})
+        else:
+            markup = (start_tag('style', {'data-nexus-ux': 'adaptive'})
+                      + "\n" + "\n".join(self.css_blocks) + "\n</style>")
+        
+        offset, inside_head = patch.head_insertion_point()
+        patch.insert(offset, markup if inside_head else f"<head>{markup}</head>")
+    
+    def _apply_to_elements(self, patch: HTMLPatch):
+        """Apply element-specific modifications (classes, attributes)"""
+        selections = self.enhancements.get("selections", {})
+        pattern_ids = {sel["pattern"]["id"]
+                       for selection_data in selections.values()
+                       for sel in selection_data.get("selected_patterns", [])}
+        html = patch.html
+        index = self._element_index(html, {PATTERN_ELEMENTS[pid][0] for pid in pattern_ids
+                                           if pid in PATTERN_ELEMENTS})
+        
+        if "scroll_reveal" in pattern_ids:
+            # Add scroll-reveal attribute to the first sections
+            for section in islice(self._elements(html, index, "scroll_reveal"), SCROLL_REVEAL_LIMIT):
+                patch.set_attribute(section, 'data-scroll-reveal', 'true')
+        
+        if "image_lazy_fade" in pattern_ids:
+            # Add lazy-load class to images
+            for img in self._elements(html, index, "image_lazy_fade"):
+                patch.add_class(img, 'lazy-fade')
+        
+        if "stat_count_up" in pattern_ids and "stat" in html:
+            self._mark_stat_numbers(patch, None if index is None else index.get("statistics", []))
+    
+    def _element_index(self, html: str, categories: Collection[str]) -> Optional[Dict[str, List[Tag]]]:
+        """
+        Start tags of the indexed elements in these categories, in document order
+        None without an index, or when any of them no longer sits at its offset.
+        """
+        elements = self.enhancements.get("elements")
+        if not categories or not elements or elements.get("columns") != ELEMENT_COLUMNS:
+            return None
+        index: Dict[str, List[Tag]] = {category: [] for category in categories}
+        # Rows are OpportunityElement fields in ELEMENT_COLUMNS order
+        for offset, end, name, _, element_categories, _, _ in elements["rows"]:
+            wanted = [category for category in element_categories if category in index]
+            if not wanted:
+                continue
+            tag = tag_at(html, offset)
+            if tag is None or tag.end != end or tag.name != name:
+                return None
+            for category in wanted:
+                index[category].append(tag)
+        return index
+    
+    def _elements(self, html: str, index: Optional[Dict[str, List[Tag]]], pattern_id: str) -> Iterable[Tag]:
+        """Start tags a pattern edits: from the element index, or searched for without one"""
+        category, tag_name = PATTERN_ELEMENTS[pattern_id]
+        if index is not None:
+            return index[category]
+        return (tag for tag in iter_tags(html, (tag_name,)) if not tag.closing)
+    
+    def _mark_stat_numbers(self, patch: HTMLPatch, stats: Optional[List[Tag]] = None):
+        """
+        data-count-up on the first number/count descendant of every stat element
+        With the indexed stat elements the walk only spans them; without, every
+        tag is checked for a stat class.
+        """
+        stat_starts, last = None, None
+        start = 0
+        if stats is not None:
+            stat_starts = {tag.start for tag in stats
+                           if tag.name not in VOID_ELEMENTS and STAT_CLASS.search(tag.classes())}
+            if not stat_starts:
+                return
+            start, last = min(stat_starts), max(stat_starts)
+        
+        # [tag name, open depth] of stat elements still looking for their number
+        pending = []
+        for tag in iter_tags(patch.html, start=start):
+            if tag.closing:
+                if pending:
+                    for entry in pending:
+                        if entry[0] == tag.name:
+                            entry[1] -= 1
+                    pending = [entry for entry in pending if entry[1] > 0]
+                continue
+            if not pending and last is not None and tag.start > last:
+                break
+            
+            classes = tag.classes() if 'class' in tag.attrs.lower() else ''
+            if pending:
+                for entry in pending:
+                    if entry[0] == tag.name:
+                        entry[1] += 1
+                if STAT_NUMBER_CLASS.search(classes):
+                    # First match for every open stat element at once
+                    patch.set_attribute(tag, 'data-count-up', 'true')
+                    pending = []
+            if stat_starts is None:
+                is_stat = STAT_CLASS.search(classes) and tag.name not in VOID_ELEMENTS
+            else:
+                is_stat = tag.start in stat_starts
+            if is_stat:
+                pending.append([tag.name, 1])
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Opportunity Scanner
+Counts every UX opportunity category in a single pass over the markup
+
+One tokenizer walk (rule_patterns.OPPORTUNITY_TOKEN) classifies each start
+tag by its name and its type/href/class attributes. Tags that can never count
+are skipped inside the regex engine, comments and script/style contents are
+skipped, and nav links are links that actually sit inside a <nav>. No
+per-category regex scans over the whole document.
+
+Given a list, the same walk also builds the element index: one
+OpportunityElement per candidate element (offsets, tag, classes,
+categories, importance, enclosing landmark). The report carries it as
+compact rows plus each category's real class tokens, so scoring sees the
+page's classes and the applier patches these exact tags without searching.
+"""
+
+import re
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from rule_patterns import (
+    ATTRIBUTE_VALUE, HREF_ATTRIBUTE, LANDMARK_TAGS, OPPORTUNITY_TOKEN, RAW_TEXT_END, START_TAG_NAME
+)
+
+TEXT_INPUT_TYPES = frozenset({'text', 'email', 'tel', 'password'})
+BUTTON_INPUT_TYPES = frozenset({'submit'})
+
+# report category -> (count property, patterns, priority)
+REPORT_CATEGORIES = {
+    "buttons": ("buttons", ["button_smooth_hover"], "high"),
+    "links": ("links", ["link_underline_slide"], "medium"),
+    "form_inputs": ("form_inputs", ["input_focus_glow"], "high"),
+    "cards": ("total_cards", ["card_elevation"], "medium"),
+    "navigation": ("nav_links", ["nav_item_highlight"], "medium"),
+    "sections": ("sections", ["scroll_reveal"], "medium"),
+    "statistics": ("stats", ["stat_count_up"], "high"),
+    "testimonials": ("testimonials", ["testimonial_fade_slide"], "medium"),
+    "prices": ("prices", ["price_highlight"], "medium"),
+}
+
+# Counter field -> element index category (report categories, plus images for image_lazy_fade)
+FIELD_CATEGORIES = {
+    'buttons': 'buttons', 'links': 'links', 'nav_links': 'navigation', 'text_inputs': 'form_inputs',
+    'textareas': 'form_inputs', 'selects': 'form_inputs', 'cards': 'cards', 'articles': 'cards',
+    'sections': 'sections', 'stats': 'statistics', 'testimonials': 'testimonials', 'prices': 'prices',
+    'images': 'images',
+}
+# Default element importance: its category's report priority
+CATEGORY_IMPORTANCE = {category: priority for category, (_, _, priority) in REPORT_CATEGORIES.items()}
+CATEGORY_IMPORTANCE['images'] = 'low'
+# Class keywords that make an element the primary one of its kind
+PRIMARY_CLASS = re.compile(r'primary|cta|hero', re.IGNORECASE)
+# Distinct class tokens per category handed to scoring
+CLASS_CONTEXT_LIMIT = 24
+
+
+@dataclass
+class OpportunityCounts:
+    """Per-category element counts for one page"""
+    buttons: int = 0
+    links: int = 0
+    text_inputs: int = 0
+    textareas: int = 0
+    selects: int = 0
+    cards: int = 0
+    articles: int = 0
+    nav_areas: int = 0
+    nav_links: int = 0
+    forms: int = 0
+    images: int = 0
+    sections: int = 0
+    stats: int = 0
+    testimonials: int = 0
+    prices: int = 0
+
+    @property
+    def form_inputs(self) -> int:
+        return self.text_inputs + self.textareas + self.selects
+
+    @property
+    def total_cards(self) -> int:
+        return self.cards + self.articles
+
+    @property
+    def total(self) -> int:
+        return (self.buttons + self.links + self.form_inputs + self.total_cards + self.nav_links
+                + self.images + self.sections + self.stats + self.testimonials + self.prices)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass
+class OpportunityElement:
+    """One candidate element: its start tag's offsets into the page and its context"""
+    offset: int
+    end: int
+    tag: str
+    classes: str
+    categories: Tuple[str, ...]
+    importance: str
+    # Nearest enclosing landmark element ("" at top level)
+    landmark: str
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> 'OpportunityElement':
+        offset, end, tag, classes, categories, importance, landmark = row
+        return cls(offset, end, tag, classes, tuple(categories), importance, landmark)
+
+    def row(self) -> List[Any]:
+        return [self.offset, self.end, self.tag, self.classes, list(self.categories), self.importance,
+                self.landmark]
+
+
+ELEMENT_COLUMNS = [f.name for f in fields(OpportunityElement)]
+
+
+# Class keywords → counter field (substring match, so 'stat' also counts 'stats-grid')
+CLASS_KEYWORD_FIELDS = {'card': 'cards', 'stat': 'stats', 'testimonial': 'testimonials', 'price': 'prices'}
+
+# Tag name → counter field for tags counted on their own
+TAG_FIELDS = {
+    'button': 'buttons', 'textarea': 'textareas', 'select': 'selects', 'article': 'articles',
+    'nav': 'nav_areas', 'form': 'forms', 'img': 'images', 'section': 'sections',
+}
+
+
+def _attribute(name: str, attrs: str) -> Optional[str]:
+    """Value of one attribute in a tag's attribute text, or None"""
+    match = ATTRIBUTE_VALUE[name].search(attrs)
+    if match is None:
+        return None
+    value = match.group('dq')
+    if value is None:
+        value = match.group('sq')
+    if value is None:
+        value = match.group('bare')
+    return value
+
+
+def scan_opportunities(html: str, elements: Optional[List[OpportunityElement]] = None) -> OpportunityCounts:
+    """
+    Count all opportunity categories in one tokenizer pass
+    With an elements list, also appends an OpportunityElement for every
+    element that counted, in document order.
+    """
+    counts = dict.fromkeys((f.name for f in fields(OpportunityCounts)), 0)
+    keyword_fields = tuple(CLASS_KEYWORD_FIELDS.items())
+    indexing = elements is not None
+    # Open landmark elements, innermost last (only tracked when indexing)
+    landmarks: List[str] = []
+    hits: List[str] = []
+    nav_depth = 0
+    position = 0
+    search = OPPORTUNITY_TOKEN.search
+    while True:
+        token = search(html, position)
+        if token is None:
+            break
+        position = token.end()
+
+        name = token.group('name')
+        if name is None:
+            close = token.group('close')
+            if close:
+                close = close.lower()
+                if close == 'nav' and nav_depth:
+                    nav_depth -= 1
+                if indexing and close in landmarks:
+                    del landmarks[len(landmarks) - 1 - landmarks[::-1].index(close)]
+                continue
+            attrs = token.group('classed')
+            if attrs is None:
+                # comment
+                continue
+        else:
+            name = name.lower()
+            attrs = token.group('attrs')
+            field = TAG_FIELDS.get(name)
+            if field:
+                counts[field] += 1
+                if indexing and field in FIELD_CATEGORIES:
+                    hits.append(field)
+                if name == 'nav':
+                    nav_depth += 1
+            elif name == 'a':
+                if HREF_ATTRIBUTE.search(attrs):
+                    counts['links'] += 1
+                    if indexing:
+                        hits.append('links')
+                    if nav_depth:
+                        counts['nav_links'] += 1
+                        if indexing:
+                            hits.append('nav_links')
+            elif name == 'input':
+                # Only an explicit type counts, as in the original type="..." scan
+                input_type = (_attribute('type', attrs) or '').lower()
+                if input_type in TEXT_INPUT_TYPES:
+                    counts['text_inputs'] += 1
+                    if indexing:
+                        hits.append('text_inputs')
+                elif input_type in BUTTON_INPUT_TYPES:
+                    counts['buttons'] += 1
+                    if indexing:
+                        hits.append('buttons')
+            elif name in RAW_TEXT_END:
+                end = RAW_TEXT_END[name].search(html, position)
+                position = end.end() if end else len(html)
+                continue
+            if indexing and name in LANDMARK_TAGS:
+                landmarks.append(name)
+            if 'lass' not in attrs and 'LASS' not in attrs:
+                if hits:
+                    elements.append(_element(token, name, '', hits, landmarks))
+                    hits = []
+                continue
+
+        class_value = _attribute('class', attrs)
+        if class_value:
+            lowered = class_value.lower()
+            for keyword, keyword_field in keyword_fields:
+                if keyword in lowered:
+                    counts[keyword_field] += 1
+                    if indexing:
+                        hits.append(keyword_field)
+        if hits:
+            elements.append(_element(token, name, class_value or '', hits, landmarks))
+            hits = []
+
+    return OpportunityCounts(**counts)
+
+
+def _element(token, name: Optional[str], classes: str, hits: List[str], landmarks: List[str]) -> OpportunityElement:
+    """Index record for a counted start tag"""
+    if name is None:
+        name = START_TAG_NAME.match(token.group()).group(1).lower()
+    if len(hits) == 1:
+        categories = (FIELD_CATEGORIES[hits[0]],)
+    else:
+        categories = tuple(dict.fromkeys(FIELD_CATEGORIES[field] for field in hits))
+    if classes and PRIMARY_CLASS.search(classes):
+        importance = "primary"
+    else:
+        importance = CATEGORY_IMPORTANCE[categories[0]]
+    return OpportunityElement(token.start(), token.end(), name, classes, categories, importance,
+                              landmarks[-1] if landmarks else "")
+
+
+def category_classes(elements: List[OpportunityElement]) -> Dict[str, List[str]]:
+    """Distinct lower-cased class tokens of each category's elements (first CLASS_CONTEXT_LIMIT)"""
+    classes: Dict[str, Dict[str, None]] = {}
+    for element in elements:
+        if not element.classes:
+            continue
+        tokens = element.classes.lower().split()
+        for category in element.categories:
+            seen = classes.setdefault(category, {})
+            for token in tokens:
+                if len(seen) < CLASS_CONTEXT_LIMIT:
+                    seen.setdefault(token, None)
+    return {category: sorted(seen) for category, seen in classes.items()}
+
+
+def opportunity_report(html_file: str, counts: OpportunityCounts, timestamp: Optional[str] = None,
+                       elements: Optional[List[OpportunityElement]] = None) -> Dict[str, Any]:
+    """
+    The <page>-ux-opportunities.json document consumed by nexus-ux-analyzer.py
+    With the element index, each category also lists its elements' class
+    tokens and the index itself is included as rows under ELEMENT_COLUMNS.
+    """
+    report = {
+        "file": html_file,
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "total_opportunities": counts.total,
+        "opportunities": {
+            category: {
+                "count": getattr(counts, attribute),
+                "patterns": patterns,
+                "priority": priority,
+            }
+            for category, (attribute, patterns, priority) in REPORT_CATEGORIES.items()
+        },
+    }
+    if elements is not None:
+        for category, classes in category_classes(elements).items():
+            if category in report["opportunities"]:
+                report["opportunities"][category]["classes"] = classes
+        report["elements"] = {"columns": ELEMENT_COLUMNS, "rows": [element.row() for element in elements]}
+    return report
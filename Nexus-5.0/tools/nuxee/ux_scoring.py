@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Batch Pattern Scoring
+PatternScorer's five dimensions for many pages at once, in NumPy
+
+Pattern features never change between pages, so the library is reduced once
+to numeric columns (complexity, impact, aaa_safe/requires_js via the
+technical score, subtle/shadow/elevation flags, effectiveness) plus an
+element-match row per opportunity type and element classes. With an
+effectiveness store the effectiveness column becomes one row per
+page-context bucket, rebuilt only when the store has new outcomes. Page
+contexts become rows (design style, density, intent), and each page's
+opportunities against their candidate patterns form one (cells x
+candidates) matrix scored by a single vectorized expression. Terms are
+added in PatternScorer's order, so the scores are bit-for-bit equal to
+score_pattern's.
+
+Requires NumPy; AdaptiveSelector.select_batch falls back to per-page
+scoring without it.
+"""
+
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from ux_effectiveness import context_bucket
+
+# Score-breakdown keys in PatternScorer.score_pattern order
+DIMENSIONS = ("element_match", "layout_fit", "intent_alignment", "technical", "effectiveness")
+
+
+class PatternFeatureMatrix:
+    """Numeric features of every library pattern, computed once"""
+
+    def __init__(self, patterns: Dict[str, Dict], scorer):
+        self.scorer = scorer
+        self.ids = list(patterns)
+        self.index = {pattern_id: i for i, pattern_id in enumerate(self.ids)}
+        rows = [patterns[pattern_id] for pattern_id in self.ids]
+        self.rows = rows
+
+        self.low_complexity = np.array([p.get("complexity") == "low" for p in rows], dtype=bool)
+        self.high_impact = np.array([p.get("impact") == "high" for p in rows], dtype=bool)
+        self.subtle = np.array(["subtle" in p.get("description", "").lower() for p in rows], dtype=bool)
+        self.hover_shadow = np.array(["shadow" in p.get("css", {}).get("hover", "") for p in rows], dtype=bool)
+        self.elevation = np.array(["elevation" in p.get("name", "").lower() for p in rows], dtype=bool)
+        # Page-independent dimensions, already weighted
+        self.technical = np.array([scorer._score_technical(p) for p in rows], dtype=float) * 0.15
+        self.effectiveness = np.array([p.get("effectiveness", 0.5) for p in rows], dtype=float) * 0.10
+        self._element_match: Dict[Tuple[str, Tuple[str, ...]], np.ndarray] = {}
+        self._learned: Dict[str, np.ndarray] = {}
+        self._learned_version = None
+
+    def element_match(self, opp_type: str, element_classes: Tuple[str, ...] = ()) -> np.ndarray:
+        """Weighted target-match score of every pattern for an opportunity type and its element classes"""
+        key = (opp_type, element_classes)
+        row = self._element_match.get(key)
+        if row is None:
+            context = {"type": opp_type, "classes": [opp_type], "element_classes": element_classes}
+            row = np.array([self.scorer._score_element_match(p, context) for p in self.rows],
+                           dtype=float) * 0.30
+            self._element_match[key] = row
+        return row
+
+    def learned_effectiveness(self, buckets: List[str]) -> np.ndarray:
+        """Weighted store effectiveness of every pattern, one row per context bucket"""
+        store = self.scorer.effectiveness
+        if self._learned_version != store.version:
+            self._learned, self._learned_version = {}, store.version
+        for bucket in buckets:
+            if bucket not in self._learned:
+                self._learned[bucket] = np.array([store.effectiveness(p, bucket) for p in self.rows],
+                                                 dtype=float) * 0.10
+        return np.stack([self._learned[bucket] for bucket in buckets])
+
+
+class BatchPatternScorer:
+    """Scores many pages' opportunities against their candidate patterns in one NumPy pass"""
+
+    def __init__(self, features: PatternFeatureMatrix):
+        self.features = features
+
+    def score(self, page_contexts: List[Dict], kinds: List[Tuple[str, Tuple[str, ...], str, bool, List[int]]],
+              cell_pages: Sequence[int], cell_kinds: Sequence[int],
+              confidence_threshold: float) -> Iterator[Tuple[int, List[float], List[List[float]]]]:
+        """
+        (cell, total per candidate, weighted breakdown per candidate) for every
+        cell - one opportunity on one page - with a candidate at or above the
+        threshold, as plain floats in cell order
+        kinds: (opp_type, element classes, purpose, primary importance,
+        candidate pattern rows);
+        cell_pages/cell_kinds: each cell's page and kind. Candidate slots past
+        a kind's own candidates score -inf.
+        """
+        f = self.features
+        width = max(len(rows) for _, _, _, _, rows in kinds)
+        kind_rows = np.zeros((len(kinds), width), dtype=np.intp)
+        kind_valid = np.zeros((len(kinds), width), dtype=bool)
+        for k, (_, _, _, _, rows) in enumerate(kinds):
+            kind_rows[k, :len(rows)] = rows
+            kind_valid[k, :len(rows)] = True
+        kind_element = np.stack([f.element_match(opp_type, classes)[kind_rows[k]]
+                                 for k, (opp_type, classes, _, _, _) in enumerate(kinds)])
+        kind_cta = np.array([purpose == "cta" for _, _, purpose, _, _ in kinds], dtype=bool)
+        kind_primary = np.array([primary for _, _, _, primary, _ in kinds], dtype=bool)
+
+        # Page features per cell, kind features per cell, pattern features per candidate slot
+        cell_pages = np.asarray(cell_pages, dtype=np.intp)
+        cell_kinds = np.asarray(cell_kinds, dtype=np.intp)
+        style = np.array([c.get("design_style", "balanced") for c in page_contexts])[cell_pages][:, None]
+        density = np.array([c.get("layout_density", 0.5) for c in page_contexts],
+                           dtype=float)[cell_pages][:, None]
+        intent = np.array([c.get("page_intent", "information") for c in page_contexts])[cell_pages][:, None]
+        cta = kind_cta[cell_kinds][:, None]
+        primary = kind_primary[cell_kinds][:, None]
+        rows = kind_rows[cell_kinds]
+        if self.features.scorer.effectiveness is None:
+            effectiveness = f.effectiveness[rows]
+        else:
+            page_buckets = [context_bucket(c) for c in page_contexts]
+            buckets = sorted(set(page_buckets))
+            position = {bucket: i for i, bucket in enumerate(buckets)}
+            bucket_index = np.array([position[bucket] for bucket in page_buckets], dtype=np.intp)
+            effectiveness = f.learned_effectiveness(buckets)[bucket_index[cell_pages][:, None], rows]
+        low = f.low_complexity[rows]
+        high_impact = f.high_impact[rows]
+
+        minimal = style == "minimal"
+        material = style == "material"
+        layout = 0.5 + np.where(minimal & low, 0.3, 0.0)
+        layout = layout + np.where(minimal & f.subtle[rows], 0.2, 0.0)
+        layout = layout + np.where(material & f.hover_shadow[rows], 0.3, 0.0)
+        layout = layout + np.where(material & f.elevation[rows], 0.2, 0.0)
+        layout = layout + np.where(density > 0.7, np.where(low, 0.2, -0.3), 0.0)
+
+        conversion = intent == "conversion"
+        intent_score = 0.5 + np.where(conversion & high_impact, 0.3, 0.0)
+        intent_score = intent_score + np.where(conversion & cta, 0.2, 0.0)
+        intent_score = intent_score + np.where((intent == "information") & low, 0.3, 0.0)
+        intent_score = intent_score + np.where(primary & high_impact, 0.2, 0.0)
+
+        breakdown = np.stack([
+            kind_element[cell_kinds],
+            np.minimum(layout, 1.0) * 0.25,
+            np.minimum(intent_score, 1.0) * 0.20,
+            f.technical[rows],
+            effectiveness,
+        ], axis=-1)
+        # Same summation order as score_pattern
+        total = breakdown[..., 0] + breakdown[..., 1]
+        for column in range(2, len(DIMENSIONS)):
+            total = total + breakdown[..., column]
+        total = np.where(kind_valid[cell_kinds], total * 100, -np.inf)
+
+        kept = np.flatnonzero((total >= confidence_threshold).any(axis=1))
+        return zip(kept.tolist(), total[kept].tolist(), breakdown[kept].tolist())
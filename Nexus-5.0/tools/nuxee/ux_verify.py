@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Pattern Verification
+AAA checks of what each applied pattern does to the elements it targets
+
+The WCAG hunters read inline styles, while UX patterns add stylesheet rules,
+classes and data attributes, so a hunter score comes out the same whichever
+patterns were applied. PatternVerifier checks every applied pattern's own
+CSS, state by state, on the elements its target selects in the original page
+(colors resolved through the page's cascade by contrast_engine):
+
+  contrast  a state's color/background leaves text under 7:1 (1.4.6) and
+            lower than the element had without the pattern
+  focus     :focus drops the outline without a border/shadow indicator of
+            3:1 against the element's background, or declares an outline
+            that doesn't reach 3:1 (2.4.7, 2.4.13)
+  hidden    the base state hides content until a script adds .visible or
+            .loaded, and the page has no script that could
+  motion    movement without the prefers-reduced-motion guard (2.3.3), or
+            an infinite animation that can't be paused (2.2.2)
+
+A pattern that fails none of them on the elements it touched passes.
+Requires BeautifulSoup (contrast_engine).
+"""
+
+import os
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
+from contrast_engine import (
+    RGB, RGBA, CascadeContrastEngine, background_layers, compile_selector, composite, contrast_ratio, matches,
+    parse_color, parse_declarations
+)
+from ux_css import split_selectors
+
+AAA_CONTRAST = float(os.getenv('CONTRAST_THRESHOLD_AAA', '7.0'))
+FOCUS_INDICATOR_CONTRAST = 3.0
+# Pattern states that style the element itself (pseudo-elements and @keyframes aside)
+ELEMENT_STATES = ("base", "hover", "active", "focus", "visible", "loaded")
+# States only a script puts an element in
+SCRIPT_STATES = ("visible", "loaded")
+MOTION_GUARD = "prefers-reduced-motion"
+# Pseudo-classes the cascade matcher can't evaluate (:not(), :hover); dropping
+# them over-approximates the elements a target selects
+PSEUDO_CLASS = re.compile(r'(?<!:):[\w-]+(?:\([^)]*\))?')
+COLOR_TOKEN = re.compile(r'#[0-9a-fA-F]{3,8}\b|(?:rgba?|hsla?)\([^)]*\)|\b[a-zA-Z]+\b')
+NO_OUTLINE = re.compile(r'(?:none|0(?:px)?)(?:\s|$)', re.IGNORECASE)
+# Ratios this close count as unchanged
+EPSILON = 0.005
+
+Declarations = Dict[str, Dict[str, str]]
+
+
+@dataclass
+class PatternCheck:
+    """Outcome of one applied pattern's checks on one page"""
+    pattern_id: str
+    elements: int = 0
+    failures: Counter = field(default_factory=Counter)
+
+    @property
+    def passed(self) -> bool:
+        return not self.failures
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"elements": self.elements, "failures": dict(self.failures)}
+
+
+def state_declarations(pattern: Dict[str, Any]) -> Declarations:
+    """state -> {property: value} for the pattern states that style the element"""
+    css = pattern.get("css", {})
+    return {
+        state: {prop: value for prop, value, _ in parse_declarations(css[state])}
+        for state in ELEMENT_STATES if state in css
+    }
+
+
+def _hidden(declared: Dict[str, str]) -> bool:
+    try:
+        if float(declared.get("opacity", "1")) == 0:
+            return True
+    except ValueError:
+        pass
+    return declared.get("visibility", "").lower() == "hidden"
+
+
+def _moves(declarations: Declarations) -> bool:
+    return any(("transform" in declared and declared["transform"].lower() != "none") or "animation" in declared
+               for declared in declarations.values())
+
+
+def _infinite(declarations: Declarations) -> bool:
+    return any("infinite" in declared.get("animation", "").lower()
+               or declared.get("animation-iteration-count", "").lower() == "infinite"
+               for declared in declarations.values())
+
+
+def _ratio(fg: RGBA, backdrops: List[RGB]) -> float:
+    """Worst contrast of a foreground over any of the backdrops"""
+    return min(contrast_ratio(composite(fg, backdrop), backdrop) for backdrop in backdrops)
+
+
+class PatternVerifier:
+    """Runs the per-pattern AAA checks against one page at a time"""
+
+    def __init__(self, motion_guard: bool):
+        # Whether the injected CSS carries the prefers-reduced-motion block
+        self.motion_guard = motion_guard
+
+    def verify(self, html: str, patterns: Iterable[Dict[str, Any]]) -> Dict[str, PatternCheck]:
+        """Check each pattern against the elements its target selects in html (the original page)"""
+        engine = CascadeContrastEngine(html)
+        elements = engine.soup.find_all(True)
+        script_states = self._script_states(engine.soup)
+
+        checks = {}
+        for pattern in patterns:
+            check = PatternCheck(pattern["id"])
+            selectors = [compile_selector(PSEUDO_CLASS.sub('', selector) or '*')
+                         for selector in split_selectors(pattern.get("target", ""))]
+            selectors = [selector for selector in selectors if selector is not None]
+            declarations = state_declarations(pattern)
+            hides = self._hides_until_script(declarations, script_states)
+
+            for element in elements:
+                if not any(matches(element, selector) for selector in selectors):
+                    continue
+                check.elements += 1
+                style = engine.computed_style(element)
+                check.failures.update(self._element_failures(style.color, style.effective_background,
+                                                             declarations))
+                if hides:
+                    check.failures["hidden"] += 1
+
+            if check.elements and ((_moves(declarations) and not self.motion_guard) or _infinite(declarations)):
+                check.failures["motion"] += 1
+            checks[check.pattern_id] = check
+        return checks
+
+    @staticmethod
+    def _script_states(soup) -> Optional[Tuple[str, ...]]:
+        """SCRIPT_STATES an inline script mentions; None when an external script could add any"""
+        scripts = soup.find_all('script')
+        if any(script.get('src') for script in scripts):
+            return None
+        text = " ".join(script.get_text() for script in scripts)
+        return tuple(state for state in SCRIPT_STATES if state in text)
+
+    @staticmethod
+    def _hides_until_script(declarations: Declarations, script_states: Optional[Tuple[str, ...]]) -> bool:
+        """The base state hides the element and only states no script sets show it"""
+        if script_states is None or not _hidden(declarations.get("base", {})):
+            return False
+        reveals = [state for state in SCRIPT_STATES if state in declarations and not _hidden(declarations[state])]
+        return bool(reveals) and not any(state in script_states for state in reveals)
+
+    def _element_failures(self, fg: RGBA, backdrops: List[RGB], declarations: Declarations) -> List[str]:
+        failures = []
+        base_ratio = _ratio(fg, backdrops)
+        for declared in declarations.values():
+            color = declared.get("color")
+            background = declared.get("background", declared.get("background-color"))
+            if color is None and background is None:
+                continue
+            state_fg = fg
+            if color is not None and color.lower() not in ("inherit", "currentcolor"):
+                state_fg = parse_color(color) or fg
+            grounds = backdrops
+            if background is not None:
+                layer, stops = (state_fg, []) if background.lower() == "currentcolor" else background_layers(background)
+                if layer is not None:
+                    grounds = [composite(layer, ground) for ground in grounds]
+                if stops:
+                    grounds = [composite(stop, ground) for stop in stops for ground in grounds]
+            state_ratio = _ratio(state_fg, grounds)
+            if state_ratio < AAA_CONTRAST and state_ratio < base_ratio - EPSILON:
+                failures.append("contrast")
+                break
+
+        focus = declarations.get("focus")
+        if focus is not None and not self._focus_visible(fg, backdrops, focus):
+            failures.append("focus")
+        return failures
+
+    @staticmethod
+    def _focus_visible(fg: RGBA, backdrops: List[RGB], focus: Dict[str, str]) -> bool:
+        """The :focus indicator reaches 3:1 against every backdrop"""
+        removed = bool(NO_OUTLINE.match(focus.get("outline", ""))) \
+            or focus.get("outline-style", "").lower() == "none"
+        if removed:
+            indicators = [value for prop, value in focus.items() if prop.startswith(("border", "box-shadow"))]
+        else:
+            indicators = [value for prop, value in focus.items() if prop.startswith("outline")]
+            if not indicators:
+                # Outline left alone: the browser's default indicator
+                return True
+        for value in indicators:
+            for token in COLOR_TOKEN.findall(value):
+                color = fg if token.lower() == "currentcolor" else parse_color(token)
+                if color is not None and all(contrast_ratio(composite(color, backdrop), backdrop)
+                                             >= FOCUS_INDICATOR_CONTRAST for backdrop in backdrops):
+                    return True
+        return False
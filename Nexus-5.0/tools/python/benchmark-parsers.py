@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+NEXUS HTML Parser Benchmark
+Per-page parse and hunt times for every installed BeautifulSoup backend
+
+Usage: benchmark-parsers.py [html files or directories...]
+Defaults to the NUXEE demo pages when no corpus is given. Also checks that
+every backend yields the same hunter findings as html.parser.
+"""
+
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from html_parsers import available_parsers, parse_html, resolve_parser
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'hunters'))
+from wcag_hunters import HuntDocument, WcagHunterOrchestrator
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent.parent / "nuxee" / "demo"
+ROUNDS = 5
+
+
+def load_corpus(targets: List[str]) -> List[Tuple[str, str]]:
+    """(name, html) for every page in the given files/directories"""
+    paths = []
+    for target in targets or [str(DEFAULT_CORPUS)]:
+        if os.path.isdir(target):
+            paths.extend(sorted(Path(target).rglob("*.html")))
+        else:
+            paths.append(Path(target))
+    return [(str(p), p.read_text(encoding='utf-8', errors='replace')) for p in paths]
+
+
+def best_ms(fn) -> float:
+    """Best-of-rounds wall time in milliseconds"""
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+def hunt(html: str, parser: str) -> Dict:
+    document = HuntDocument(html, parser=parser)
+    return WcagHunterOrchestrator(None, verbose=False, write_reports=False, document=document).run_all_hunts()
+
+
+def findings_signature(master: Dict) -> Dict:
+    return {name: (report['counts'], report['findings']) for name, report in master['hunter_reports'].items()}
+
+
+def run_benchmark(targets: List[str]):
+    """Parse and hunt the corpus with every backend"""
+    print("🚀 NEXUS HTML PARSER BENCHMARK")
+    print("=" * 70)
+    corpus = load_corpus(targets)
+    parsers = available_parsers()
+    total_bytes = sum(len(html) for _, html in corpus)
+    print(f"  Corpus: {len(corpus)} pages, {total_bytes / 1024:.0f} KB (best of {ROUNDS} rounds)")
+    print(f"  Installed backends: {', '.join(parsers)} (auto → {resolve_parser('auto')})")
+    print()
+
+    parse_ms = {parser: [] for parser in parsers}
+    hunt_ms = {parser: [] for parser in parsers}
+    mismatches = {parser: [] for parser in parsers}
+    for name, html in corpus:
+        reference = findings_signature(hunt(html, 'html.parser'))
+        for parser in parsers:
+            parse_ms[parser].append(best_ms(lambda: parse_html(html, parser)))
+            hunt_ms[parser].append(best_ms(lambda: hunt(html, parser)))
+            if findings_signature(hunt(html, parser)) != reference:
+                mismatches[parser].append(name)
+
+    print("📊 Per-page times (parse only / parse + hunt)")
+    print("-" * 70)
+    print(f"  {'backend':12} {'mean parse':>12} {'median parse':>13} {'mean hunt':>11} {'speedup':>9}  findings")
+    baseline = statistics.mean(parse_ms['html.parser'])
+    for parser in parsers:
+        mean_parse = statistics.mean(parse_ms[parser])
+        speedup = baseline / mean_parse if mean_parse > 0 else 0
+        parity = "identical" if not mismatches[parser] else f"{len(mismatches[parser])} pages differ"
+        print(f"  {parser:12} {mean_parse:10.2f}ms {statistics.median(parse_ms[parser]):11.2f}ms "
+              f"{statistics.mean(hunt_ms[parser]):9.2f}ms {speedup:8.1f}x  {parity}")
+    print()
+
+    for parser, pages in mismatches.items():
+        for page in pages[:5]:
+            print(f"  ⚠️  {parser}: findings differ from html.parser on {page}")
+
+    print("✅ Benchmark complete!")
+
+
+if __name__ == "__main__":
+    try:
+        run_benchmark(sys.argv[1:])
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Benchmark interrupted")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+NEXUS Rule Pattern Benchmark
+Measure compiled rule registry gains against the legacy per-call regexes
+
+Opportunity counting is timed against ux_opportunities.scan_opportunities,
+the single-pass scanner the toolchain uses. Its counts are not compared:
+the scanner scopes nav links to <nav> and skips comments, so on purpose it
+disagrees with the legacy regexes.
+
+Usage: benchmark-rules.py [html files or directories...]
+Defaults to the NUXEE demo pages when no corpus is given.
+"""
+
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from rule_patterns import suspicious_alt_reason
+from ux_opportunities import scan_opportunities
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent.parent / "nuxee" / "demo"
+ROUNDS = 7
+
+ALT_ATTRIBUTE_VALUE = re.compile(r'alt="([^"]*)"', re.IGNORECASE)
+
+# Representative alt texts so every rule branch is exercised
+SAMPLE_ALTS = [
+    "Team photo at the 2024 offsite", "hero-banner.jpg", "image1", "IMG", "picture23",
+    "3f9a7c2e1b4d", "Company logo", "chart.png", "Product screenshot", "",
+]
+
+
+# -- legacy implementations (as they were before the registry) -----------------
+
+def legacy_is_suspicious_alt(alt_text: str) -> bool:
+    suspicious_patterns = [
+        r'\.(jpg|jpeg|png|gif|webp)$',
+        r'^image\d*$',
+        r'^img\d*$',
+        r'^picture\d*$',
+        r'^[0-9a-f]{8,}$'
+    ]
+    alt_lower = alt_text.lower()
+    return any(re.search(pattern, alt_lower) for pattern in suspicious_patterns)
+
+
+def legacy_opportunity_counts(html: str) -> Tuple[int, ...]:
+    return (
+        len(re.findall(r'<button', html, re.IGNORECASE)) + len(re.findall(r'type="submit"', html, re.IGNORECASE)),
+        len(re.findall(r'<a[^>]*href', html, re.IGNORECASE)),
+        len(re.findall(r'<input[^>]*type="(text|email|tel|password)"', html, re.IGNORECASE)),
+        len(re.findall(r'<textarea', html, re.IGNORECASE)),
+        len(re.findall(r'<select', html, re.IGNORECASE)),
+        len(re.findall(r'class="[^"]*card[^"]*"', html, re.IGNORECASE)),
+        len(re.findall(r'<article', html, re.IGNORECASE)),
+        len(re.findall(r'<nav', html, re.IGNORECASE)),
+        len(re.findall(r'nav.*?<a', html, re.IGNORECASE | re.DOTALL)),
+        len(re.findall(r'<form', html, re.IGNORECASE)),
+        len(re.findall(r'<img', html, re.IGNORECASE)),
+        len(re.findall(r'<section', html, re.IGNORECASE)),
+        len(re.findall(r'class="[^"]*stat', html, re.IGNORECASE)),
+        len(re.findall(r'class="[^"]*testimonial', html, re.IGNORECASE)),
+        len(re.findall(r'class="[^"]*price', html, re.IGNORECASE)),
+    )
+
+
+# -- registry implementations --------------------------------------------------
+
+def registry_is_suspicious_alt(alt_text: str) -> bool:
+    return suspicious_alt_reason(alt_text) is not None
+
+
+def registry_opportunity_counts(html: str) -> Tuple[int, ...]:
+    counts = scan_opportunities(html)
+    return (
+        counts.buttons, counts.links, counts.text_inputs, counts.textareas, counts.selects,
+        counts.cards, counts.articles, counts.nav_areas, counts.nav_links, counts.forms,
+        counts.images, counts.sections, counts.stats, counts.testimonials, counts.prices,
+    )
+
+
+# -- harness -------------------------------------------------------------------
+
+def load_corpus(targets: List[str]) -> List[Tuple[str, str]]:
+    """(name, html) for every page in the given files/directories"""
+    paths = []
+    for target in targets or [str(DEFAULT_CORPUS)]:
+        if os.path.isdir(target):
+            paths.extend(sorted(Path(target).rglob("*.html")))
+        else:
+            paths.append(Path(target))
+    return [(str(p), p.read_text(encoding='utf-8', errors='replace')) for p in paths]
+
+
+def time_ms(fn: Callable[[], object]) -> float:
+    """Best-of-rounds wall time in milliseconds"""
+    samples = []
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+def compare(title: str, legacy: Callable[[], object], registry: Callable[[], object],
+            same_results: bool = True) -> float:
+    if same_results and legacy() != registry():
+        raise AssertionError(f"{title}: registry results differ from legacy results")
+    legacy_ms = time_ms(legacy)
+    registry_ms = time_ms(registry)
+    speedup = legacy_ms / registry_ms if registry_ms > 0 else 0
+    print(f"  {title:34} {legacy_ms:9.2f}ms → {registry_ms:9.2f}ms   {speedup:5.1f}x")
+    return speedup
+
+
+def run_benchmark(targets: List[str]):
+    """Run the legacy vs. registry comparison over the corpus"""
+    print("🚀 NEXUS RULE PATTERN BENCHMARK")
+    print("=" * 70)
+    corpus = load_corpus(targets)
+    total_bytes = sum(len(html) for _, html in corpus)
+    print(f"  Corpus: {len(corpus)} pages, {total_bytes / 1024:.0f} KB (best of {ROUNDS} rounds)")
+    print()
+
+    alts = [alt for _, html in corpus for alt in ALT_ATTRIBUTE_VALUE.findall(html)]
+    alts = (alts + SAMPLE_ALTS) * max(1, 20000 // max(len(alts) + len(SAMPLE_ALTS), 1))
+
+    print("📊 Legacy → registry (alt results identical; opportunities from the scanner)")
+    print("-" * 70)
+    speedups = [
+        compare(f"Suspicious alt ({len(alts)} checks)",
+                lambda: [legacy_is_suspicious_alt(a) for a in alts],
+                lambda: [registry_is_suspicious_alt(a) for a in alts]),
+        compare("Opportunity counts (whole corpus)",
+                lambda: [legacy_opportunity_counts(html) for _, html in corpus],
+                lambda: [registry_opportunity_counts(html) for _, html in corpus],
+                same_results=False),
+    ]
+    print()
+
+    print("🎯 PERFORMANCE SUMMARY")
+    print("=" * 70)
+    print(f"  Mean speedup: {statistics.mean(speedups):.1f}x")
+    print()
+    print("✅ Benchmark complete!")
+
+
+if __name__ == "__main__":
+    try:
+        run_benchmark(sys.argv[1:])
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Benchmark interrupted")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+NEXUS Pattern Selection Benchmark
+Per-page AdaptiveSelector.select_patterns vs. one NumPy batch (select_batch)
+
+Usage: benchmark-selection.py [html files or directories...] [--pages N]
+Defaults to the NUXEE demo pages, cycled up to 10,000 page contexts. Also
+checks that both paths select exactly the same patterns with the same scores.
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from ux_analysis import AdaptiveSelector, BatchPatternScorer, ContextAnalyzer
+from ux_library import load_library
+from ux_opportunities import opportunity_report, scan_opportunities
+
+NUXEE_DIR = Path(__file__).resolve().parent.parent / "nuxee"
+DEFAULT_CORPUS = NUXEE_DIR / "demo"
+DEFAULT_PAGES = 10_000
+
+
+def load_corpus(targets: List[str]) -> List[Tuple[str, str]]:
+    """(name, html) for every page in the given files/directories"""
+    paths = []
+    for target in targets or [str(DEFAULT_CORPUS)]:
+        if os.path.isdir(target):
+            paths.extend(sorted(p for p in Path(target).rglob("*.html") if not p.name.endswith("-enhanced.html")))
+        else:
+            paths.append(Path(target))
+    return [(str(p), p.read_text(encoding='utf-8', errors='replace')) for p in paths]
+
+
+def page_inputs(corpus: List[Tuple[str, str]], count: int) -> List[Tuple[Dict, Dict]]:
+    """(opportunities, page_context) for `count` pages, cycling through the corpus"""
+    analyzer = ContextAnalyzer()
+    analyzed = [(opportunity_report(name, scan_opportunities(html))["opportunities"], analyzer.analyze_page(html))
+                for name, html in corpus]
+    return [analyzed[i % len(analyzed)] for i in range(count)]
+
+
+def run_benchmark(targets: List[str], count: int):
+    print("🚀 NEXUS PATTERN SELECTION BENCHMARK")
+    print("=" * 70)
+    library = load_library().document
+    corpus = load_corpus(targets)
+    pages = page_inputs(corpus, count)
+    print(f"  Corpus: {len(corpus)} pages cycled to {len(pages)} page contexts, "
+          f"{len(library['patterns'])} library patterns")
+    if BatchPatternScorer is None:
+        print("  ⚠️  NumPy not installed: select_batch falls back to per-page scoring")
+    print()
+
+    selector = AdaptiveSelector(library)
+    start = time.perf_counter()
+    per_page = [selector.select_patterns(opportunities, context) for opportunities, context in pages]
+    per_page_s = time.perf_counter() - start
+
+    # The first call also builds the pattern feature matrix
+    start = time.perf_counter()
+    batch = selector.select_batch(pages)
+    batch_s = time.perf_counter() - start
+
+    if json.dumps(per_page) != json.dumps(batch):
+        raise AssertionError("select_batch results differ from select_patterns results")
+
+    print("📊 Results identical; per-page → batch")
+    print("-" * 70)
+    speedup = per_page_s / batch_s if batch_s > 0 else 0
+    print(f"  {'Selection (' + str(len(pages)) + ' pages)':34} {per_page_s * 1000:9.1f}ms → "
+          f"{batch_s * 1000:9.1f}ms   {speedup:5.1f}x")
+    print(f"  {'Pages/sec':34} {len(pages) / per_page_s:9.0f}   → {len(pages) / batch_s:9.0f}")
+    print()
+    print("✅ Benchmark complete!")
+
+
+if __name__ == "__main__":
+    args, pages = [], DEFAULT_PAGES
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg == '--pages':
+            pages = int(next(argv))
+        else:
+            args.append(arg)
+    try:
+        run_benchmark(args, pages)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Benchmark interrupted")
@@ -0,0 +1,859 @@
+#!/usr/bin/env python3
+"""
+NEXUS Cascade-Aware Contrast Engine
+Computes effective foreground/background colors per text node
+
+Unlike the inline-style fixers, this builds a lightweight computed-style model:
+- <style> rules with class/id/element selector specificity
+- Inline styles and !important ordering
+- Custom property (var()) resolution with inheritance and fallbacks
+- Background inheritance and alpha compositing up the ancestor chain
+- Gradient backgrounds checked against every color stop
+"""
+
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from bs4 import BeautifulSoup, NavigableString, Comment, Tag
+
+from html_parsers import parse_html
+
+RGBA = Tuple[float, float, float, float]
+RGB = Tuple[float, float, float]
+
+DEFAULT_FOREGROUND: RGBA = (0.0, 0.0, 0.0, 1.0)
+DEFAULT_CANVAS: RGB = (255.0, 255.0, 255.0)
+
+# All 148 CSS named colors (CSS Color Module Level 4)
+NAMED_COLORS = {
+    'aliceblue': (240, 248, 255), 'antiquewhite': (250, 235, 215), 'aqua': (0, 255, 255),
+    'aquamarine': (127, 255, 212), 'azure': (240, 255, 255), 'beige': (245, 245, 220),
+    'bisque': (255, 228, 196), 'black': (0, 0, 0), 'blanchedalmond': (255, 235, 205),
+    'blue': (0, 0, 255), 'blueviolet': (138, 43, 226), 'brown': (165, 42, 42),
+    'burlywood': (222, 184, 135), 'cadetblue': (95, 158, 160), 'chartreuse': (127, 255, 0),
+    'chocolate': (210, 105, 30), 'coral': (255, 127, 80), 'cornflowerblue': (100, 149, 237),
+    'cornsilk': (255, 248, 220), 'crimson': (220, 20, 60), 'cyan': (0, 255, 255),
+    'darkblue': (0, 0, 139), 'darkcyan': (0, 139, 139), 'darkgoldenrod': (184, 134, 11),
+    'darkgray': (169, 169, 169), 'darkgreen': (0, 100, 0), 'darkgrey': (169, 169, 169),
+    'darkkhaki': (189, 183, 107), 'darkmagenta': (139, 0, 139), 'darkolivegreen': (85, 107, 47),
+    'darkorange': (255, 140, 0), 'darkorchid': (153, 50, 204), 'darkred': (139, 0, 0),
+    'darksalmon': (233, 150, 122), 'darkseagreen': (143, 188, 143), 'darkslateblue': (72, 61, 139),
+    'darkslategray': (47, 79, 79), 'darkslategrey': (47, 79, 79), 'darkturquoise': (0, 206, 209),
+    'darkviolet': (148, 0, 211), 'deeppink': (255, 20, 147), 'deepskyblue': (0, 191, 255),
+    'dimgray': (105, 105, 105), 'dimgrey': (105, 105, 105), 'dodgerblue': (30, 144, 255),
+    'firebrick': (178, 34, 34), 'floralwhite': (255, 250, 240), 'forestgreen': (34, 139, 34),
+    'fuchsia': (255, 0, 255), 'gainsboro': (220, 220, 220), 'ghostwhite': (248, 248, 255),
+    'gold': (255, 215, 0), 'goldenrod': (218, 165, 32), 'gray': (128, 128, 128),
+    'green': (0, 128, 0), 'greenyellow': (173, 255, 47), 'grey': (128, 128, 128),
+    'honeydew': (240, 255, 240), 'hotpink': (255, 105, 180), 'indianred': (205, 92, 92),
+    'indigo': (75, 0, 130), 'ivory': (255, 255, 240), 'khaki': (240, 230, 140),
+    'lavender': (230, 230, 250), 'lavenderblush': (255, 240, 245), 'lawngreen': (124, 252, 0),
+    'lemonchiffon': (255, 250, 205), 'lightblue': (173, 216, 230), 'lightcoral': (240, 128, 128),
+    'lightcyan': (224, 255, 255), 'lightgoldenrodyellow': (250, 250, 210),
+    'lightgray': (211, 211, 211), 'lightgreen': (144, 238, 144), 'lightgrey': (211, 211, 211),
+    'lightpink': (255, 182, 193), 'lightsalmon': (255, 160, 122), 'lightseagreen': (32, 178, 170),
+    'lightskyblue': (135, 206, 250), 'lightslategray': (119, 136, 153),
+    'lightslategrey': (119, 136, 153), 'lightsteelblue': (176, 196, 222),
+    'lightyellow': (255, 255, 224), 'lime': (0, 255, 0), 'limegreen': (50, 205, 50),
+    'linen': (250, 240, 230), 'magenta': (255, 0, 255), 'maroon': (128, 0, 0),
+    'mediumaquamarine': (102, 205, 170), 'mediumblue': (0, 0, 205), 'mediumorchid': (186, 85, 211),
+    'mediumpurple': (147, 112, 219), 'mediumseagreen': (60, 179, 113),
+    'mediumslateblue': (123, 104, 238), 'mediumspringgreen': (0, 250, 154),
+    'mediumturquoise': (72, 209, 204), 'mediumvioletred': (199, 21, 133),
+    'midnightblue': (25, 25, 112), 'mintcream': (245, 255, 250), 'mistyrose': (255, 228, 225),
+    'moccasin': (255, 228, 181), 'navajowhite': (255, 222, 173), 'navy': (0, 0, 128),
+    'oldlace': (253, 245, 230), 'olive': (128, 128, 0), 'olivedrab': (107, 142, 35),
+    'orange': (255, 165, 0), 'orangered': (255, 69, 0), 'orchid': (218, 112, 214),
+    'palegoldenrod': (238, 232, 170), 'palegreen': (152, 251, 152),
+    'paleturquoise': (175, 238, 238), 'palevioletred': (219, 112, 147),
+    'papayawhip': (255, 239, 213), 'peachpuff': (255, 218, 185), 'peru': (205, 133, 63),
+    'pink': (255, 192, 203), 'plum': (221, 160, 221), 'powderblue': (176, 224, 230),
+    'purple': (128, 0, 128), 'rebeccapurple': (102, 51, 153), 'red': (255, 0, 0),
+    'rosybrown': (188, 143, 143), 'royalblue': (65, 105, 225), 'saddlebrown': (139, 69, 19),
+    'salmon': (250, 128, 114), 'sandybrown': (244, 164, 96), 'seagreen': (46, 139, 87),
+    'seashell': (255, 245, 238), 'sienna': (160, 82, 45), 'silver': (192, 192, 192),
+    'skyblue': (135, 206, 235), 'slateblue': (106, 90, 205), 'slategray': (112, 128, 144),
+    'slategrey': (112, 128, 144), 'snow': (255, 250, 250), 'springgreen': (0, 255, 127),
+    'steelblue': (70, 130, 180), 'tan': (210, 180, 140), 'teal': (0, 128, 128),
+    'thistle': (216, 191, 216), 'tomato': (255, 99, 71), 'turquoise': (64, 224, 208),
+    'violet': (238, 130, 238), 'wheat': (245, 222, 179), 'white': (255, 255, 255),
+    'whitesmoke': (245, 245, 245), 'yellow': (255, 255, 0), 'yellowgreen': (154, 205, 50),
+}
+
+# Elements whose text is never rendered as page content
+NON_RENDERED_TAGS = {'script', 'style', 'head', 'title', 'noscript', 'template', 'meta', 'link'}
+
+# Pseudo-classes that describe static document structure we can evaluate
+STATIC_PSEUDO_CLASSES = {'root'}
+
+COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+DECLARATION_SPLIT = re.compile(r';(?![^(]*\))')
+COMPOUND_PATTERN = re.compile(
+    r'(?P<tag>\*|[a-zA-Z][\w-]*)?'
+    r'(?P<rest>(?:[.#][\w-]+|\[[^\]]+\]|::?[\w-]+(?:\([^)]*\))?)*)$'
+)
+SIMPLE_PART_PATTERN = re.compile(r'[.#][\w-]+|\[[^\]]+\]|::?[\w-]+(?:\([^)]*\))?')
+ATTRIBUTE_PATTERN = re.compile(r'\[\s*([\w-]+)\s*(?:([~|^$*]?=)\s*["\']?([^"\'\]]*)["\']?)?\s*\]')
+HEX_PATTERN = re.compile(r'#([0-9a-fA-F]{3,4}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})$')
+FUNC_COLOR_PATTERN = re.compile(r'(rgba?|hsla?)\(\s*([^)]*)\)$', re.IGNORECASE)
+GRADIENT_PATTERN = re.compile(r'(?:repeating-)?(?:linear|radial|conic)-gradient\(', re.IGNORECASE)
+
+MAX_VAR_DEPTH = 16
+
+
+# ---------------------------------------------------------------------------
+# Color math
+# ---------------------------------------------------------------------------
+
+def _channel(token: str, scale: float = 255.0) -> float:
+    token = token.strip()
+    if token.endswith('%'):
+        return max(0.0, min(scale, float(token[:-1]) * scale / 100.0))
+    return max(0.0, min(scale, float(token)))
+
+
+def _alpha(token: str) -> float:
+    token = token.strip()
+    if token.endswith('%'):
+        return max(0.0, min(1.0, float(token[:-1]) / 100.0))
+    return max(0.0, min(1.0, float(token)))
+
+
+def _hue(token: str) -> float:
+    token = token.strip().lower()
+    if token.endswith('deg'):
+        return float(token[:-3]) / 360.0
+    if token.endswith('turn'):
+        return float(token[:-4])
+    if token.endswith('rad'):
+        return float(token[:-3]) / (2 * 3.141592653589793)
+    return float(token) / 360.0
+
+
+def _hsl_to_rgb(h: float, s: float, l: float) -> RGB:
+    def hue_to_rgb(p: float, q: float, t: float) -> float:
+        t = t % 1.0
+        if t < 1 / 6:
+            return p + (q - p) * 6 * t
+        if t < 1 / 2:
+            return q
+        if t < 2 / 3:
+            return p + (q - p) * (2 / 3 - t) * 6
+        return p
+
+    if s == 0:
+        r = g = b = l
+    else:
+        q = l * (1 + s) if l < 0.5 else l + s - l * s
+        p = 2 * l - q
+        r = hue_to_rgb(p, q, h + 1 / 3)
+        g = hue_to_rgb(p, q, h)
+        b = hue_to_rgb(p, q, h - 1 / 3)
+    return r * 255.0, g * 255.0, b * 255.0
+
+
+def parse_color(value: str) -> Optional[RGBA]:
+    """Parse a CSS color (hex, rgb(a), hsl(a), named, transparent) to RGBA"""
+    if not value:
+        return None
+    value = value.strip().lower()
+
+    if value == 'transparent':
+        return (0.0, 0.0, 0.0, 0.0)
+
+    if value.startswith('#'):
+        match = HEX_PATTERN.match(value)
+        if not match:
+            return None
+        digits = match.group(1)
+        if len(digits) in (3, 4):
+            digits = ''.join(c * 2 for c in digits)
+        r, g, b = (int(digits[i:i + 2], 16) for i in (0, 2, 4))
+        a = int(digits[6:8], 16) / 255.0 if len(digits) == 8 else 1.0
+        return (float(r), float(g), float(b), a)
+
+    match = FUNC_COLOR_PATTERN.match(value)
+    if match:
+        func, args = match.group(1), match.group(2)
+        parts = [p for p in re.split(r'[\s,/]+', args.strip()) if p]
+        if len(parts) not in (3, 4):
+            return None
+        try:
+            alpha = _alpha(parts[3]) if len(parts) == 4 else 1.0
+            if func.startswith('rgb'):
+                r, g, b = (_channel(p) for p in parts[:3])
+            else:
+                h = _hue(parts[0])
+                s = _channel(parts[1], 1.0) if parts[1].endswith('%') else float(parts[1]) / 100.0
+                l = _channel(parts[2], 1.0) if parts[2].endswith('%') else float(parts[2]) / 100.0
+                r, g, b = _hsl_to_rgb(h, s, l)
+        except ValueError:
+            return None
+        return (r, g, b, alpha)
+
+    named = NAMED_COLORS.get(value)
+    if named:
+        return (float(named[0]), float(named[1]), float(named[2]), 1.0)
+    return None
+
+
+def composite(color: RGBA, backdrop: RGB) -> RGB:
+    """Alpha-composite a color over an opaque backdrop"""
+    r, g, b, a = color
+    if a >= 1.0:
+        return (r, g, b)
+    return (
+        r * a + backdrop[0] * (1 - a),
+        g * a + backdrop[1] * (1 - a),
+        b * a + backdrop[2] * (1 - a),
+    )
+
+
+def relative_luminance(rgb: RGB) -> float:
+    """Calculate relative luminance (WCAG formula)"""
+    def adjust(c: float) -> float:
+        c = c / 255.0
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    return 0.2126 * adjust(rgb[0]) + 0.7152 * adjust(rgb[1]) + 0.0722 * adjust(rgb[2])
+
+
+def contrast_ratio(fg: RGB, bg: RGB) -> float:
+    """Calculate WCAG contrast ratio between two opaque colors"""
+    l1, l2 = relative_luminance(fg), relative_luminance(bg)
+    return (max(l1, l2) + 0.05) / (min(l1, l2) + 0.05)
+
+
+def to_hex(rgb: RGB) -> str:
+    return '#' + ''.join(f'{int(round(max(0.0, min(255.0, c)))):02x}' for c in rgb[:3])
+
+
+def adjust_foreground(fg: RGB, bg: RGB, target_ratio: float) -> RGB:
+    """Shift fg lightness away from bg (keeping hue) until target_ratio is met
+
+    Binary-searches the blend towards black or white, whichever side of the
+    background the color already sits on; falls back to the other extreme
+    when that direction cannot reach the target.
+    """
+    if contrast_ratio(fg, bg) >= target_ratio:
+        return fg
+
+    def search(extreme: RGB) -> Optional[RGB]:
+        if contrast_ratio(extreme, bg) < target_ratio:
+            return None
+        low, high = 0.0, 1.0
+        for _ in range(20):
+            mid = (low + high) / 2
+            candidate = tuple(c + (e - c) * mid for c, e in zip(fg, extreme))
+            if contrast_ratio(candidate, bg) >= target_ratio:
+                high = mid
+            else:
+                low = mid
+        # Rounding to whole channels can land just under the target; nudge past it
+        while high <= 1.0:
+            candidate = tuple(float(round(c + (e - c) * high)) for c, e in zip(fg, extreme))
+            if contrast_ratio(candidate, bg) >= target_ratio:
+                return candidate
+            high += 0.005
+        return extreme
+
+    black, white = (0.0, 0.0, 0.0), (255.0, 255.0, 255.0)
+    darker_first = relative_luminance(fg) <= relative_luminance(bg)
+    for extreme in ((black, white) if darker_first else (white, black)):
+        adjusted = search(extreme)
+        if adjusted is not None and contrast_ratio(adjusted, bg) >= target_ratio:
+            return adjusted
+    return black if contrast_ratio(black, bg) >= contrast_ratio(white, bg) else white
+
+
+# ---------------------------------------------------------------------------
+# CSS parsing
+# ---------------------------------------------------------------------------
+
+def split_top_level(text: str, separator: str = ',') -> List[str]:
+    """Split on a separator that is not nested inside parentheses/brackets"""
+    parts, depth, current = [], 0, []
+    for ch in text:
+        if ch in '([':
+            depth += 1
+        elif ch in ')]':
+            depth = max(0, depth - 1)
+        if ch == separator and depth == 0:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(ch)
+    parts.append(''.join(current))
+    return [p.strip() for p in parts if p.strip()]
+
+
+def parse_declarations(block: str) -> List[Tuple[str, str, bool]]:
+    """Parse 'prop: value !important; ...' into (prop, value, important)"""
+    declarations = []
+    for chunk in DECLARATION_SPLIT.split(block):
+        if ':' not in chunk:
+            continue
+        prop, value = chunk.split(':', 1)
+        prop = prop.strip()
+        if not prop.startswith('--'):
+            prop = prop.lower()
+        value = value.strip()
+        important = False
+        if value.lower().endswith('!important'):
+            important = True
+            value = value[:-len('!important')].strip()
+        if prop and value:
+            declarations.append((prop, value, important))
+    return declarations
+
+
+def background_layers(value: str) -> Tuple[Optional[RGBA], List[RGBA]]:
+    """Extract (color, gradient stops) from a background(-color) value"""
+    color = parse_color(value)
+    if color is not None:
+        return color, []
+    stops: List[RGBA] = []
+    if GRADIENT_PATTERN.search(value):
+        for token in re.findall(r'#[0-9a-fA-F]{3,8}|(?:rgba?|hsla?)\([^)]*\)|\b[a-zA-Z]+\b', value):
+            parsed = parse_color(token)
+            if parsed is not None:
+                stops.append(parsed)
+    base = None
+    # Shorthand: the color layer is the final top-level token that parses
+    for token in reversed(split_top_level(value, ' ')):
+        if GRADIENT_PATTERN.search(token):
+            continue
+        parsed = parse_color(token)
+        if parsed is not None:
+            base = parsed
+            break
+    return base, stops
+
+
+def iter_style_rules(css: str):
+    """Yield (selector_text, declaration_block) for rules in a stylesheet
+
+    Nested @media blocks are flattened (print-only media is skipped); other
+    at-rules such as @keyframes and @font-face are ignored.
+    """
+    css = COMMENT_PATTERN.sub('', css)
+    i, n = 0, len(css)
+    while i < n:
+        brace = css.find('{', i)
+        if brace < 0:
+            return
+        prelude = css[i:brace].strip()
+        # Find the matching closing brace
+        depth, j = 1, brace + 1
+        while j < n and depth:
+            if css[j] == '{':
+                depth += 1
+            elif css[j] == '}':
+                depth -= 1
+            j += 1
+        body = css[brace + 1:j - 1]
+        # Statements such as @import/@charset end with ';' before the next block
+        if ';' in prelude and prelude.lstrip().startswith('@'):
+            prelude = prelude.rsplit(';', 1)[1].strip()
+        if prelude.startswith('@'):
+            lowered = prelude.lower()
+            if lowered.startswith('@media') and 'print' not in lowered:
+                yield from iter_style_rules(body)
+            elif lowered.startswith('@supports') or lowered.startswith('@layer'):
+                yield from iter_style_rules(body)
+        elif prelude:
+            yield prelude, body
+        i = j
+
+
+@dataclass(frozen=True)
+class Compound:
+    """One compound selector: tag#id.class[attr]:root"""
+    tag: Optional[str]
+    ids: Tuple[str, ...]
+    classes: Tuple[str, ...]
+    attributes: Tuple[Tuple[str, Optional[str], Optional[str]], ...]
+    root: bool
+
+
+@dataclass(frozen=True)
+class CompiledSelector:
+    """Selector compiled right-to-left: [(compound, combinator-to-left), ...]"""
+    text: str
+    parts: Tuple[Tuple[Compound, Optional[str]], ...]
+    specificity: Tuple[int, int, int]
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        """Bucket key from the rightmost compound, used to index rules"""
+        subject = self.parts[0][0]
+        if subject.ids:
+            return ('id', subject.ids[0])
+        if subject.classes:
+            return ('class', subject.classes[0])
+        if subject.tag:
+            return ('tag', subject.tag)
+        return ('any', '*')
+
+
+def _compile_compound(text: str) -> Optional[Compound]:
+    match = COMPOUND_PATTERN.match(text)
+    if not match:
+        return None
+    tag = match.group('tag')
+    ids, classes, attributes, root = [], [], [], False
+    for part in SIMPLE_PART_PATTERN.findall(match.group('rest') or ''):
+        if part.startswith('#'):
+            ids.append(part[1:])
+        elif part.startswith('.'):
+            classes.append(part[1:])
+        elif part.startswith('['):
+            attr = ATTRIBUTE_PATTERN.match(part)
+            if not attr:
+                return None
+            attributes.append((attr.group(1).lower(), attr.group(2), attr.group(3)))
+        else:
+            name = part.lstrip(':').split('(')[0].lower()
+            if part.startswith('::') or name not in STATIC_PSEUDO_CLASSES:
+                # Dynamic state (:hover) and pseudo-elements never match static text
+                return None
+            root = True
+    return Compound(
+        tag=None if tag in (None, '*') else tag.lower(),
+        ids=tuple(ids), classes=tuple(classes),
+        attributes=tuple(attributes), root=root,
+    )
+
+
+def compile_selector(text: str) -> Optional[CompiledSelector]:
+    """Compile a single complex selector; returns None if unsupported"""
+    tokens = re.split(r'\s*([>+~])\s*|\s+', text.strip())
+    compounds: List[Tuple[str, Optional[str]]] = []
+    combinator = None
+    for token in tokens:
+        if token is None or token == '':
+            continue
+        if token in ('>', '+', '~'):
+            combinator = token
+            continue
+        compounds.append((token, combinator if compounds else None))
+        combinator = ' '
+    if not compounds:
+        return None
+
+    parts = []
+    ids = classes = tags = 0
+    # Store right-to-left with the combinator joining each compound to its left neighbour
+    for index in range(len(compounds) - 1, -1, -1):
+        compound = _compile_compound(compounds[index][0])
+        if compound is None:
+            return None
+        left_combinator = compounds[index][1] if index > 0 else None
+        if left_combinator in ('+', '~'):
+            return None
+        parts.append((compound, left_combinator))
+        ids += len(compound.ids)
+        classes += len(compound.classes) + len(compound.attributes) + int(compound.root)
+        tags += int(compound.tag is not None)
+    return CompiledSelector(text=text.strip(), parts=tuple(parts), specificity=(ids, classes, tags))
+
+
+def _matches_compound(element: Tag, compound: Compound) -> bool:
+    if compound.tag and element.name != compound.tag:
+        return False
+    if compound.root and element.name != 'html':
+        return False
+    if compound.ids and element.get('id') not in compound.ids:
+        return False
+    if compound.classes:
+        element_classes = element.get('class') or []
+        if any(c not in element_classes for c in compound.classes):
+            return False
+    for name, op, expected in compound.attributes:
+        actual = element.get(name)
+        if actual is None:
+            return False
+        if op is None:
+            continue
+        if isinstance(actual, list):
+            actual = ' '.join(actual)
+        if op == '=' and actual != expected:
+            return False
+        if op == '~=' and expected not in actual.split():
+            return False
+        if op == '^=' and not actual.startswith(expected):
+            return False
+        if op == '$=' and not actual.endswith(expected):
+            return False
+        if op == '*=' and expected not in actual:
+            return False
+        if op == '|=' and not (actual == expected or actual.startswith(expected + '-')):
+            return False
+    return True
+
+
+def _ancestors(node: Tag) -> Iterator[Tag]:
+    """Element ancestors, nearest first (the BeautifulSoup object excluded)"""
+    parent = node.parent
+    while isinstance(parent, Tag) and parent.name != '[document]':
+        yield parent
+        parent = parent.parent
+
+
+def matches(element: Tag, selector: CompiledSelector) -> bool:
+    """
+    Right-to-left selector matching with descendant backtracking
+    Iterative (an explicit stack of (element, compound index) states, nearest
+    ancestor tried first), so deeply nested pages can't exhaust the
+    recursion limit; a state that already failed is not tried again.
+    """
+    parts = selector.parts
+    pending = [(element, 0)]
+    tried = set()
+    while pending:
+        node, index = pending.pop()
+        if (id(node), index) in tried:
+            continue
+        tried.add((id(node), index))
+        compound, combinator = parts[index]
+        if not _matches_compound(node, compound):
+            continue
+        if index + 1 == len(parts):
+            return True
+        if combinator == '>':
+            parent = next(_ancestors(node), None)
+            if parent is not None:
+                pending.append((parent, index + 1))
+        else:
+            pending.extend(reversed([(ancestor, index + 1) for ancestor in _ancestors(node)]))
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Computed style model
+# ---------------------------------------------------------------------------
+
+@dataclass
+class StyleRule:
+    selector: CompiledSelector
+    declarations: List[Tuple[str, str, bool]]
+    order: int
+
+
+@dataclass
+class ComputedStyle:
+    """Subset of computed style needed for contrast"""
+    custom_properties: Dict[str, str]
+    color: RGBA
+    color_source: str
+    background: Optional[RGBA]
+    background_stops: List[RGBA]
+    background_source: str
+    effective_background: List[RGB] = field(default_factory=list)
+
+
+@dataclass
+class TextContrast:
+    """Effective contrast for one rendered text node"""
+    element: Any
+    text: str
+    foreground: str
+    background: str
+    contrast_ratio: float
+    foreground_source: str
+    background_source: str
+
+
+class CascadeContrastEngine:
+    """Resolves the cascade for a document and reports per-text-node contrast"""
+
+    def __init__(self, html_or_soup: Any, default_foreground: RGBA = DEFAULT_FOREGROUND,
+                 canvas: RGB = DEFAULT_CANVAS):
+        if isinstance(html_or_soup, BeautifulSoup):
+            self.soup = html_or_soup
+        else:
+            self.soup = parse_html(html_or_soup)
+        self.default_foreground = default_foreground
+        self.canvas = canvas
+
+        # Caches: compiled selectors and matched element ids per selector text,
+        # computed style per element
+        self._selector_cache: Dict[str, Optional[CompiledSelector]] = {}
+        self._match_cache: Dict[Tuple[str, int], bool] = {}
+        self._style_cache: Dict[int, ComputedStyle] = {}
+        self._inline_cache: Dict[str, List[Tuple[str, str, bool]]] = {}
+
+        self.rules: List[StyleRule] = []
+        self._rule_index: Dict[Tuple[str, str], List[StyleRule]] = {}
+        self._load_stylesheets()
+
+    # -- stylesheet loading -------------------------------------------------
+
+    def _compile(self, selector_text: str) -> Optional[CompiledSelector]:
+        if selector_text not in self._selector_cache:
+            self._selector_cache[selector_text] = compile_selector(selector_text)
+        return self._selector_cache[selector_text]
+
+    def _load_stylesheets(self):
+        order = 0
+        for style_tag in self.soup.find_all('style'):
+            media = (style_tag.get('media') or '').lower()
+            if 'print' in media and 'screen' not in media:
+                continue
+            for selector_list, block in iter_style_rules(style_tag.get_text()):
+                declarations = parse_declarations(block)
+                if not declarations:
+                    continue
+                for selector_text in split_top_level(selector_list):
+                    compiled = self._compile(selector_text)
+                    if compiled is None:
+                        continue
+                    rule = StyleRule(compiled, declarations, order)
+                    order += 1
+                    self.rules.append(rule)
+                    self._rule_index.setdefault(compiled.key, []).append(rule)
+
+    def _candidate_rules(self, element: Tag) -> List[StyleRule]:
+        candidates = list(self._rule_index.get(('any', '*'), []))
+        candidates.extend(self._rule_index.get(('tag', element.name), []))
+        element_id = element.get('id')
+        if element_id:
+            candidates.extend(self._rule_index.get(('id', element_id), []))
+        for cls in element.get('class') or []:
+            candidates.extend(self._rule_index.get(('class', cls), []))
+        return candidates
+
+    def _matches(self, element: Tag, selector: CompiledSelector) -> bool:
+        key = (selector.text, id(element))
+        cached = self._match_cache.get(key)
+        if cached is None:
+            cached = matches(element, selector)
+            self._match_cache[key] = cached
+        return cached
+
+    # -- cascade --------------------------------------------------------------
+
+    def _cascaded_declarations(self, element: Tag) -> Dict[str, Tuple[str, str]]:
+        """Winning (value, source) per property for an element"""
+        winners: Dict[str, Tuple[Tuple, str, str]] = {}
+
+        def consider(prop: str, value: str, important: bool, inline: bool,
+                     specificity: Tuple[int, int, int], order: int, source: str):
+            if prop == 'background-color':
+                prop = 'background'
+            rank = (important, inline, specificity, order)
+            current = winners.get(prop)
+            if current is None or rank >= current[0]:
+                winners[prop] = (rank, value, source)
+
+        seen = set()
+        for rule in self._candidate_rules(element):
+            if id(rule) in seen:
+                continue
+            seen.add(id(rule))
+            if not self._matches(element, rule.selector):
+                continue
+            for prop, value, important in rule.declarations:
+                consider(prop, value, important, False, rule.selector.specificity,
+                         rule.order, rule.selector.text)
+
+        inline = element.get('style')
+        if inline:
+            if inline not in self._inline_cache:
+                self._inline_cache[inline] = parse_declarations(inline)
+            for prop, value, important in self._inline_cache[inline]:
+                consider(prop, value, important, True, (0, 0, 0), 0, 'inline')
+
+        return {prop: (value, source) for prop, (_, value, source) in winners.items()}
+
+    def resolve_vars(self, value: str, custom_properties: Dict[str, str], depth: int = 0) -> Optional[str]:
+        """Substitute var(--x, fallback) references; None if unresolvable"""
+        if 'var(' not in value:
+            return value
+        if depth > MAX_VAR_DEPTH:
+            return None
+        out, i = [], 0
+        while True:
+            start = value.find('var(', i)
+            if start < 0:
+                out.append(value[i:])
+                break
+            out.append(value[i:start])
+            depth_count, j = 1, start + 4
+            while j < len(value) and depth_count:
+                if value[j] == '(':
+                    depth_count += 1
+                elif value[j] == ')':
+                    depth_count -= 1
+                j += 1
+            inner = value[start + 4:j - 1]
+            name, _, fallback = inner.partition(',')
+            replacement = custom_properties.get(name.strip())
+            if replacement is None:
+                replacement = fallback.strip() if fallback.strip() else None
+            if replacement is None:
+                return None
+            resolved = self.resolve_vars(replacement, custom_properties, depth + 1)
+            if resolved is None:
+                return None
+            out.append(resolved)
+            i = j
+        return ''.join(out)
+
+    def computed_style(self, element: Tag) -> ComputedStyle:
+        """
+        Compute (and memoize) the contrast-relevant style for an element
+        Walks up to the nearest ancestor with a memoized style, then computes
+        the uncached chain from the top down, without recursing per ancestor.
+        """
+        cached = self._style_cache.get(id(element))
+        if cached is not None:
+            return cached
+
+        chain, parent_style = [element], None
+        for ancestor in _ancestors(element):
+            parent_style = self._style_cache.get(id(ancestor))
+            if parent_style is not None:
+                break
+            chain.append(ancestor)
+        for node in reversed(chain):
+            parent_style = self._style_cache[id(node)] = self._compute_style(node, parent_style)
+        return parent_style
+
+    def _compute_style(self, element: Tag, parent_style: Optional[ComputedStyle]) -> ComputedStyle:
+        """An element's style given its parent's (None at the root)"""
+        declared = self._cascaded_declarations(element)
+
+        custom = dict(parent_style.custom_properties) if parent_style else {}
+        for prop, (value, _) in declared.items():
+            if prop.startswith('--'):
+                custom[prop] = value
+
+        inherited_color = parent_style.color if parent_style else self.default_foreground
+        color, color_source = inherited_color, 'inherited' if parent_style else 'default'
+        if 'color' in declared:
+            raw, source = declared['color']
+            resolved = self.resolve_vars(raw, custom)
+            if resolved is not None and resolved.strip().lower() not in ('inherit', 'currentcolor'):
+                parsed = parse_color(resolved)
+                if parsed is not None:
+                    color, color_source = parsed, source
+
+        background, stops, background_source = None, [], 'none'
+        if 'background' in declared:
+            raw, source = declared['background']
+            resolved = self.resolve_vars(raw, custom)
+            if resolved is not None:
+                if resolved.strip().lower() == 'currentcolor':
+                    background = color
+                else:
+                    background, stops = background_layers(resolved)
+                if background is not None or stops:
+                    background_source = source
+        if 'background-image' in declared:
+            raw, source = declared['background-image']
+            resolved = self.resolve_vars(raw, custom)
+            if resolved and GRADIENT_PATTERN.search(resolved):
+                _, image_stops = background_layers(resolved)
+                if image_stops:
+                    stops, background_source = image_stops, source
+
+        # Effective background: this element's layers composited over its parent's
+        backdrops = parent_style.effective_background if parent_style else [self.canvas]
+        if background is not None:
+            backdrops = [composite(background, b) for b in backdrops]
+        if stops:
+            backdrops = [composite(stop, b) for stop in stops for b in backdrops]
+        if background is None and not stops and parent_style:
+            background_source = parent_style.background_source
+
+        return ComputedStyle(
+            custom_properties=custom,
+            color=color,
+            color_source=color_source,
+            background=background,
+            background_stops=stops,
+            background_source=background_source,
+            effective_background=backdrops,
+        )
+
+    def effective_colors(self, element: Tag) -> Tuple[RGB, RGB, float]:
+        """(foreground, worst-case background, ratio) for text inside element"""
+        style = self.computed_style(element)
+        worst_bg, worst_ratio, worst_fg = None, None, None
+        for backdrop in style.effective_background:
+            fg = composite(style.color, backdrop)
+            ratio = contrast_ratio(fg, backdrop)
+            if worst_ratio is None or ratio < worst_ratio:
+                worst_bg, worst_ratio, worst_fg = backdrop, ratio, fg
+        return worst_fg, worst_bg, worst_ratio
+
+    def invalidate(self, element: Tag):
+        """Drop memoized styles for an element and its subtree after a mutation"""
+        self._style_cache.pop(id(element), None)
+        for descendant in element.descendants:
+            if isinstance(descendant, Tag):
+                self._style_cache.pop(id(descendant), None)
+
+    def text_nodes(self):
+        """Yield (text, element) for every rendered, non-empty text node"""
+        for node in self.soup.find_all(string=True):
+            if isinstance(node, Comment) or not isinstance(node, NavigableString):
+                continue
+            text = node.strip()
+            if not text:
+                continue
+            element = node.parent
+            if not isinstance(element, Tag) or any(
+                p.name in NON_RENDERED_TAGS for p in [element, *element.parents] if isinstance(p, Tag)
+            ):
+                continue
+            yield text, element
+
+    def text_contrasts(self) -> List[TextContrast]:
+        """Effective fg/bg/ratio for every rendered, non-empty text node"""
+        results = []
+        for text, element in self.text_nodes():
+            fg, bg, ratio = self.effective_colors(element)
+            style = self.computed_style(element)
+            results.append(TextContrast(
+                element=element,
+                text=text[:60],
+                foreground=to_hex(fg),
+                background=to_hex(bg),
+                contrast_ratio=round(ratio, 2),
+                foreground_source=style.color_source,
+                background_source=style.background_source,
+            ))
+        return results
+
+    def failures(self, threshold: float = 4.5) -> List[TextContrast]:
+        """Text nodes whose effective contrast is below threshold"""
+        return [t for t in self.text_contrasts() if t.contrast_ratio < threshold]
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: contrast_engine.py <input.html> [--threshold 4.5]")
+        sys.exit(1)
+
+    threshold = 4.5
+    if '--threshold' in sys.argv:
+        threshold = float(sys.argv[sys.argv.index('--threshold') + 1])
+
+    with open(sys.argv[1], 'r', encoding='utf-8') as f:
+        html = f.read()
+
+    engine = CascadeContrastEngine(html)
+    nodes = engine.text_contrasts()
+    failing = [t for t in nodes if t.contrast_ratio < threshold]
+
+    print(f"🎨 Analyzed {len(nodes)} text nodes against {len(engine.rules)} style rules")
+    for item in failing:
+        print(f"   ✗ {item.contrast_ratio:5.2f}:1  {item.foreground} on {item.background}  "
+              f"<{item.element.name}> \"{item.text}\"  (fg: {item.foreground_source}, bg: {item.background_source})")
+    print(f"\n   {len(failing)} text nodes below {threshold}:1")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+NEXUS HTML Parser Backends
+Pluggable BeautifulSoup backend selection for the WCAG/UX toolchain
+
+'auto' picks the fastest installed backend: lxml (C), else the stdlib
+html.parser. html5lib (browser-exact, pure Python, slower than html.parser)
+is used only when asked for explicitly. The choice can be pinned per run with
+--parser or globally with NEXUS_HTML_PARSER.
+"""
+
+import importlib.util
+import os
+from typing import List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+# backend name -> module that must be importable
+BACKENDS = {
+    'lxml': 'lxml',
+    'html5lib': 'html5lib',
+    'html.parser': None,
+}
+AUTO_PREFERENCE = ('lxml', 'html.parser')
+
+
+def available_parsers() -> List[str]:
+    """Installed backends, fastest first"""
+    return [name for name, module in BACKENDS.items()
+            if module is None or importlib.util.find_spec(module) is not None]
+
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """Concrete backend for a requested name ('auto'/None honours NEXUS_HTML_PARSER)"""
+    name = name or os.getenv('NEXUS_HTML_PARSER') or 'auto'
+    installed = available_parsers()
+    if name == 'auto':
+        return next(backend for backend in AUTO_PREFERENCE if backend in installed)
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser '{name}' (choose from auto, {', '.join(BACKENDS)})")
+    if name not in installed:
+        raise ValueError(f"HTML parser '{name}' is not installed (available: {', '.join(installed)})")
+    return name
+
+
+def parse_html(markup: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse markup with the requested (or auto-selected) backend"""
+    return BeautifulSoup(markup, resolve_parser(parser))
+
+
+def pop_parser_argument(argv: List[str]) -> Tuple[List[str], Optional[str]]:
+    """Split '--parser NAME' out of an argument list; returns (remaining args, name)"""
+    remaining, parser = [], None
+    args = iter(argv)
+    for arg in args:
+        if arg == '--parser':
+            parser = next(args, None)
+        elif arg.startswith('--parser='):
+            parser = arg.split('=', 1)[1]
+        else:
+            remaining.append(arg)
+    return remaining, parser
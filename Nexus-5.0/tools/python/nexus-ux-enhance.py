@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Enhance - In-Process Enhancement Pipeline
+Detect, analyze, select and apply for one or more pages in a single run
+
+Usage: nexus-ux-enhance.py <input.html> [<input.html> ...] [--library PATH]
+                           [--write-json] [--json]
+                           [--stylesheet PATH] [--effectiveness PATH]
+
+Writes <page>-enhanced.html next to each input. --write-json also writes the
+<page>-ux-opportunities.json / <page>-ux-enhancements.json stage outputs;
+--json prints one summary object per page on stdout instead of the report.
+--stylesheet writes one shared CSS file (e.g. nexus-ux.css) that every page
+links instead of inlining its pattern CSS. --effectiveness selects with the
+outcomes learned by ux_site.py (e.g. __reports/ux/ux_effectiveness.json).
+"""
+
+import json
+import sys
+
+from ux_effectiveness import EffectivenessStore
+from ux_engine import DEFAULT_LIBRARY, UXEnhancementEngine, load_pattern_library, output_paths
+from ux_library import LibrarySchemaError
+
+
+def main():
+    targets, library, stylesheet, effectiveness = [], DEFAULT_LIBRARY, None, None
+    cli_args = sys.argv[1:]
+    argv = iter(cli_args)
+    for arg in argv:
+        if arg == '--library':
+            library = next(argv)
+        elif arg == '--stylesheet':
+            stylesheet = next(argv)
+        elif arg == '--effectiveness':
+            effectiveness = EffectivenessStore(next(argv))
+        elif not arg.startswith('--'):
+            targets.append(arg)
+
+    if not targets:
+        print("Usage: python3 nexus-ux-enhance.py <input.html> [...] [--library PATH] "
+              "[--write-json] [--json] [--stylesheet PATH] [--effectiveness PATH]")
+        sys.exit(1)
+
+    as_json = '--json' in cli_args
+    try:
+        engine = UXEnhancementEngine(load_pattern_library(library), stylesheet=stylesheet,
+                                     effectiveness=effectiveness)
+    except LibrarySchemaError as e:
+        print(f"❌ Invalid pattern library: {e}")
+        sys.exit(1)
+    stylesheet_path = engine.write_stylesheet()
+
+    if not as_json:
+        print("\n" + "="*70)
+        print("🚀 NEXUS UX Enhance - In-Process Enhancement Pipeline")
+        print(f"   Library: {library}")
+        if stylesheet_path:
+            print(f"   Shared stylesheet: {stylesheet_path}")
+        print("="*70 + "\n")
+
+    for result in engine.enhance_files(targets, write_json='--write-json' in cli_args):
+        html_file = result.html_file
+        summary = result.summary()
+        if as_json:
+            print(json.dumps(summary))
+            continue
+
+        timings = " | ".join(f"{stage} {ms:.1f}ms" for stage, ms in result.timings.items())
+        print(f"📄 {html_file}")
+        print(f"   Opportunities: {summary['total_opportunities']} | "
+              f"Patterns: {summary['patterns_selected']} | Applications: {summary['total_applications']}")
+        print(f"   {timings} (total {result.elapsed_ms:.1f}ms)")
+        print(f"   💾 {output_paths(html_file)['output']}")
+
+    if not as_json:
+        print("\n" + "="*70)
+        print(f"✅ Enhanced {len(targets)} page(s)")
+        print("="*70 + "\n")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
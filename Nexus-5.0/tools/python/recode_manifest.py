@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+NEXUS Recode Manifest - Content-Addressed Skip Cache
+Records what produced each -accessible.html / -wcag-report.json output
+
+An entry is keyed by the input's SHA-256 plus the fixer/checker versions, the
+HTML parser backend and configured thresholds. When none of those changed and the recorded outputs
+still exist, the page can be skipped and its previous outputs reused.
+
+recode-html.sh and batch-recode.sh share one manifest per tree: the nearest
+.wcag-recode-manifest.json at or above the page (or batch root), else a new
+one there. A batch run folds manifests left in its subdirectories into its
+own, so the shell helper finds the same entries afterwards.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+
+MANIFEST_FILENAME = ".wcag-recode-manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def find_manifest(directory: Path) -> Optional[Path]:
+    """Nearest existing manifest in directory or one of its parents"""
+    directory = Path(directory).resolve()
+    for candidate in (directory, *directory.parents):
+        path = candidate / MANIFEST_FILENAME
+        if path.is_file():
+            return path
+    return None
+
+
+def toolchain_versions(parser: Optional[str] = None) -> Dict[str, str]:
+    """Fixer/checker versions and parser backend; a change in any invalidates every entry"""
+    from html_parsers import resolve_parser
+    from wcag_pipeline import FIXER_VERSION
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'hunters'))
+    from wcag_hunters import CHECKER_VERSION
+    return {"fixer": FIXER_VERSION, "checker": CHECKER_VERSION, "parser": resolve_parser(parser)}
+
+
+def current_thresholds(contrast_target: float = 7.0) -> Dict[str, float]:
+    """Thresholds that change fixer/checker output"""
+    return {
+        "contrast_target": contrast_target,
+        "contrast_threshold_aa": float(os.getenv('CONTRAST_THRESHOLD_AA', '4.5')),
+        "contrast_threshold_aaa": float(os.getenv('CONTRAST_THRESHOLD_AAA', '7.0')),
+    }
+
+
+class RecodeManifest:
+    """JSON manifest of recode inputs → outputs, keyed relative to its directory"""
+
+    def __init__(self, manifest_path: Path, versions: Dict[str, str], thresholds: Dict[str, float]):
+        self.path = Path(manifest_path)
+        self.root = self.path.parent.resolve()
+        self.versions = versions
+        self.thresholds = thresholds
+        self.entries: Dict[str, Dict[str, Any]] = self._read(self.path)
+        self.dirty = False
+        # Nested manifests merged into this one, removed once it is saved
+        self.absorbed: List[Path] = []
+
+    @classmethod
+    def locate(cls, directory: Path, versions: Dict[str, str],
+               thresholds: Dict[str, float]) -> 'RecodeManifest':
+        """The manifest covering a directory: the nearest one at or above it, else a new one in it"""
+        return cls(find_manifest(directory) or Path(directory) / MANIFEST_FILENAME, versions, thresholds)
+
+    @staticmethod
+    def _read(path: Path) -> Dict[str, Dict[str, Any]]:
+        if not path.exists():
+            return {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return {}
+        if data.get("schemaVersion") != MANIFEST_SCHEMA_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def absorb_nested(self, directory: Path):
+        """Merge manifests in subdirectories of directory into this one (existing entries win)"""
+        for path in sorted(Path(directory).resolve().rglob(MANIFEST_FILENAME)):
+            if path == self.path.resolve():
+                continue
+            for key, entry in self._read(path).items():
+                entry = dict(entry, outputs=[
+                    dict(output, path=self.key(path.parent / output["path"]))
+                    for output in entry.get("outputs", [])
+                ])
+                self.entries.setdefault(self.key(path.parent / key), entry)
+            self.absorbed.append(path)
+            self.dirty = True
+
+    def key(self, input_path: Path) -> str:
+        try:
+            return str(Path(input_path).resolve().relative_to(self.root))
+        except ValueError:
+            return str(Path(input_path).resolve())
+
+    def lookup(self, input_path: Path, input_hash: str) -> Optional[Dict[str, Any]]:
+        """The recorded entry if inputs are unchanged and outputs still exist"""
+        entry = self.entries.get(self.key(input_path))
+        if not entry:
+            return None
+        if (entry.get("input_sha256") != input_hash
+                or entry.get("versions") != self.versions
+                or entry.get("thresholds") != self.thresholds):
+            return None
+        for output in entry.get("outputs", []):
+            output_path = self.root / output["path"]
+            if not output_path.exists() or output_path.stat().st_size != output["size"]:
+                return None
+        return entry
+
+    def record(self, input_path: Path, input_hash: str, outputs: List[Path], result: Dict[str, Any]):
+        """Store the inputs that produced a page's outputs"""
+        self.entries[self.key(input_path)] = {
+            "input_sha256": input_hash,
+            "versions": self.versions,
+            "thresholds": self.thresholds,
+            "outputs": [
+                {"path": self.key(p), "size": Path(p).stat().st_size}
+                for p in outputs if Path(p).exists()
+            ],
+            "result": result,
+        }
+        self.dirty = True
+
+    def save(self):
+        """Atomically write the manifest (tmp file + rename)"""
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + f".{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"schemaVersion": MANIFEST_SCHEMA_VERSION, "entries": self.entries}, f, indent=1)
+        os.replace(tmp, self.path)
+        self.dirty = False
+        for path in self.absorbed:
+            path.unlink(missing_ok=True)
+        self.absorbed = []
+
+
+def main():
+    """Shell helper for recode-html.sh: `fresh <file>` / `record <file> <outputs...>`"""
+    if len(sys.argv) < 3 or sys.argv[1] not in ('fresh', 'record'):
+        print("Usage: recode_manifest.py fresh <input.html>")
+        print("   or: recode_manifest.py record <input.html> [output files...]")
+        sys.exit(2)
+
+    command, input_path = sys.argv[1], Path(sys.argv[2])
+    manifest = RecodeManifest.locate(
+        input_path.resolve().parent, toolchain_versions(), current_thresholds()
+    )
+    input_hash = file_sha256(input_path)
+
+    if command == 'fresh':
+        sys.exit(0 if manifest.lookup(input_path, input_hash) else 1)
+
+    # Same result shape as wcag_batch records, so either entry point can skip the page
+    manifest.record(input_path, input_hash, [Path(p) for p in sys.argv[3:]],
+                    {"status": "improved", "source": "recode-html.sh"})
+    manifest.save()
+
+
+if __name__ == '__main__':
+    main()
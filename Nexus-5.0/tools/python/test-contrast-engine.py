@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test the Cascade Contrast Engine
+
+Checks the cascade (specificity, source order, !important, inline styles),
+var() resolution, background compositing and very deep documents
+"""
+
+from contrast_engine import CascadeContrastEngine, contrast_ratio, to_hex
+
+
+def style_of(html, element_id):
+    engine = CascadeContrastEngine(html)
+    return engine, engine.computed_style(engine.soup.find(id=element_id))
+
+
+def color_of(html, element_id):
+    return to_hex(style_of(html, element_id)[1].color[:3])
+
+
+print("🧪 Testing the Cascade Contrast Engine")
+print("=" * 60)
+
+# The most specific selector wins; ties go to the later rule
+print("\n🎯 Specificity and source order:")
+cascade = """<style>
+    p { color: #111111 }
+    #t { color: #333333 }
+    .a { color: #222222 }
+    p.a.b { color: #444444 }
+    .b { color: #555555 }
+    .c { color: #666666 }
+    .d { color: #777777 }
+</style>
+<p id="t" class="a b">id beats classes</p>
+<p id="u" class="a b">two classes and a tag</p>
+<p id="v" class="c d">later rule</p>"""
+assert color_of(cascade, "t") == "#333333", "an id selector must beat classes"
+assert color_of(cascade, "u") == "#444444", "p.a.b must beat the later .b"
+assert color_of(cascade, "v") == "#777777", "equal specificity: the later rule must win"
+print("   specificity and source order resolved")
+
+# !important beats specificity and inline styles; inline !important beats it
+print("\n❗ !important and inline styles:")
+important = """<style>
+    .imp { color: #111111 !important }
+    #i1, #i2, #i3 { color: #222222 }
+</style>
+<p id="i1" class="imp">important class</p>
+<p id="i2" class="imp" style="color: #333333">inline loses</p>
+<p id="i3" class="imp" style="color: #444444 !important">inline important</p>
+<p id="i4" style="color: #555555">plain inline</p>"""
+assert color_of(important, "i1") == "#111111", "!important must beat a more specific rule"
+assert color_of(important, "i2") == "#111111", "!important must beat an inline style"
+assert color_of(important, "i3") == "#444444", "inline !important must beat stylesheet !important"
+assert color_of(important, "i4") == "#555555", "an inline style must apply"
+print("   !important ordering resolved")
+
+# Custom properties inherit; var() falls back, and an unresolvable value is ignored
+print("\n🧮 var() resolution:")
+variables = """<style>
+    :root { --fg: #123456 }
+    .box { --fg: #654321 }
+    .use { color: var(--fg) }
+    .fallback { color: var(--missing, #abcdef) }
+    .nested { color: var(--missing, var(--fg)) }
+    .broken { color: var(--missing) }
+</style>
+<body style="color: #0a0a0a">
+<p id="v1" class="use">root value</p>
+<div class="box"><p id="v2" class="use">inherited override</p></div>
+<p id="v3" class="fallback">fallback</p>
+<p id="v4" class="nested">nested fallback</p>
+<p id="v5" class="broken">unresolvable</p>
+</body>"""
+assert color_of(variables, "v1") == "#123456", "var() must read the :root custom property"
+assert color_of(variables, "v2") == "#654321", "custom properties must inherit the nearest definition"
+assert color_of(variables, "v3") == "#abcdef", "var() must use its fallback"
+assert color_of(variables, "v4") == "#123456", "a fallback may itself be a var()"
+engine, style = style_of(variables, "v5")
+assert to_hex(style.color[:3]) == "#0a0a0a" and style.color_source == "inherited", \
+    "an unresolvable var() must leave the inherited color"
+print("   var() and fallbacks resolved")
+
+# Translucent backgrounds composite over the ancestors'; gradients count every stop
+print("\n🖌️  Background compositing:")
+backgrounds = """<body style="background: #000000; color: #ffffff">
+<div style="background: rgba(255, 255, 255, 0.5)"><p id="b1">half white over black</p></div>
+<div style="background-color: transparent"><p id="b2">transparent</p></div>
+<div style="background: linear-gradient(#ffffff, #000000)"><p id="b3">gradient</p></div>
+</body>"""
+engine, style = style_of(backgrounds, "b1")
+assert style.effective_background == [(127.5, 127.5, 127.5)], "rgba must composite over the parent background"
+assert style_of(backgrounds, "b2")[1].effective_background == [(0.0, 0.0, 0.0)], \
+    "a transparent background must show the parent's"
+engine, style = style_of(backgrounds, "b3")
+assert sorted(style.effective_background) == [(0.0, 0.0, 0.0), (255.0, 255.0, 255.0)], \
+    "every gradient stop must be a backdrop"
+foreground, background, ratio = engine.effective_colors(engine.soup.find(id="b3"))
+assert background == (255.0, 255.0, 255.0) and ratio == contrast_ratio(foreground, background) == 1.0, \
+    "the worst gradient stop must set the ratio"
+print("   rgba, transparent and gradient backgrounds composited")
+
+# Styles and selector matching walk ancestors without recursion
+print("\n🪆 Deep documents:")
+depth = 3000
+deep = ("<style>body .x > .x p { color: #767676 } .x { background: #ffffff }</style><body>"
+        + '<div class="x">' * depth + "<p>deep text</p>" + "</div>" * depth + "</body>")
+contrasts = CascadeContrastEngine(deep).text_contrasts()
+assert len(contrasts) == 1 and contrasts[0].foreground == "#767676", "the deep rule must match"
+assert contrasts[0].contrast_ratio == 4.54, f"unexpected ratio {contrasts[0].contrast_ratio}"
+print(f"   {depth} nested elements: {contrasts[0].contrast_ratio}:1 via {contrasts[0].foreground_source}")
+
+print("\n✅ Cascade Contrast Engine Working!")
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Test the WCAG Recode Manifest
+
+Checks when a recorded page may be skipped: same content, fixer/checker
+versions, parser backend, thresholds and outputs - and that the batch
+recoder and the recode-html.sh helper honour the same entries
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from html_parsers import available_parsers
+from recode_manifest import (
+    MANIFEST_FILENAME, RecodeManifest, current_thresholds, file_sha256, toolchain_versions
+)
+from wcag_batch import BatchRecoder, output_paths
+
+TOOL_DIR = Path(__file__).resolve().parent
+
+pages = {
+    "compliant.html": """<!DOCTYPE html>
+<html lang="en"><head><title>Compliant</title></head>
+<body><nav><a href="/">Home</a></nav><header><h1>Compliant</h1></header>
+<main><p>Plain text</p></main><footer><p>Footer</p></footer></body></html>""",
+    "broken.html": """<html><head><title>Broken</title></head>
+<body><h1>Broken</h1><p style="color: #999; background: #fff;">Low contrast</p>
+<img src="team-photo.jpg"><p>© 2024 Example</p></body></html>""",
+    "sub dir/nested page.html": """<html><body><h2>Nested</h2><h4>Skipped</h4><img src="x.png"></body></html>""",
+}
+
+
+def write_site(root: Path):
+    for name, html in pages.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html, encoding='utf-8')
+
+
+def run_batch(root: Path, **options) -> dict:
+    recoder = BatchRecoder(root, workers=1, **options)
+    for _ in recoder.run():
+        pass
+    return recoder.summary
+
+
+print("🧪 Testing the WCAG Recode Manifest")
+print("=" * 60)
+
+# An entry matches only its exact inputs, and only while its outputs are intact
+print("\n🔑 Entry lookup:")
+versions = toolchain_versions()
+thresholds = current_thresholds()
+with tempfile.TemporaryDirectory() as workdir:
+    root = Path(workdir)
+    write_site(root)
+    page = root / "broken.html"
+    output = root / "broken-accessible.html"
+    output.write_text("fixed", encoding='utf-8')
+    page_hash = file_sha256(page)
+
+    manifest = RecodeManifest.locate(root, versions, thresholds)
+    manifest.record(page, page_hash, [output], {"status": "improved"})
+    manifest.save()
+    assert RecodeManifest.locate(root, versions, thresholds).lookup(page, page_hash), \
+        "an unchanged page must be skipped"
+    assert not manifest.lookup(page, file_sha256(root / "compliant.html")), "changed content must miss"
+
+    invalidating = {
+        "fixer version": (dict(versions, fixer="0.0.0"), thresholds),
+        "checker version": (dict(versions, checker="0.0.0"), thresholds),
+        "parser": (dict(versions, parser="other-parser"), thresholds),
+        "contrast target": (versions, current_thresholds(4.5)),
+        "AA threshold": (versions, dict(thresholds, contrast_threshold_aa=3.0)),
+        "AAA threshold": (versions, dict(thresholds, contrast_threshold_aaa=4.5)),
+    }
+    for change, (changed_versions, changed_thresholds) in invalidating.items():
+        reread = RecodeManifest.locate(root, changed_versions, changed_thresholds)
+        assert reread.lookup(page, page_hash) is None, f"a different {change} must miss"
+        print(f"   {change} change: miss")
+
+    output.write_text("fixed, then edited", encoding='utf-8')
+    assert manifest.lookup(page, page_hash) is None, "a resized output must miss"
+    output.unlink()
+    assert manifest.lookup(page, page_hash) is None, "a deleted output must miss"
+    print("   changed or missing outputs: miss")
+
+# The versions and thresholds really come from the toolchain and environment
+print("\n🧭 Manifest keys:")
+parsers = available_parsers()
+assert len({toolchain_versions(parser)["parser"] for parser in parsers}) == len(parsers), \
+    "each parser backend must key its own entries"
+os.environ["CONTRAST_THRESHOLD_AA"] = "3.0"
+try:
+    assert current_thresholds()["contrast_threshold_aa"] == 3.0, "CONTRAST_THRESHOLD_AA must be keyed"
+finally:
+    del os.environ["CONTRAST_THRESHOLD_AA"]
+assert current_thresholds(5.0)["contrast_target"] == 5.0, "the contrast target must be keyed"
+print(f"   versions {sorted(versions)}; parsers {parsers}; thresholds {sorted(thresholds)}")
+
+# A rerun skips every page; any keyed change reprocesses them all, an edit only that page
+print("\n🔁 Batch reruns:")
+with tempfile.TemporaryDirectory() as workdir:
+    root = Path(workdir)
+    write_site(root)
+    summary = run_batch(root)
+    assert summary["processed"] == len(pages) and not summary["failed"], f"first run: {summary}"
+    for name in pages:
+        assert output_paths(root / name)["report"].exists(), f"{name}: no report written"
+
+    summary = run_batch(root)
+    assert summary["skipped_unchanged"] == len(pages) and summary["processed"] == 0, f"rerun: {summary}"
+    print(f"   unchanged rerun: {summary['skipped_unchanged']} pages skipped")
+
+    summary = run_batch(root, contrast_target=4.5)
+    assert summary["processed"] == len(pages), f"new contrast target: {summary}"
+    print(f"   new contrast target: {summary['processed']} pages reprocessed")
+
+    other_parser = next((parser for parser in parsers if parser != "html.parser"), None)
+    if other_parser:
+        run_batch(root, parser="html.parser")
+        summary = run_batch(root, parser=other_parser)
+        assert summary["processed"] == len(pages), f"new parser: {summary}"
+        print(f"   html.parser → {other_parser}: {summary['processed']} pages reprocessed")
+
+    run_batch(root)  # back to the default parser's entries
+    edited = root / "sub dir" / "nested page.html"
+    edited.write_text(pages["sub dir/nested page.html"].replace("Nested", "Edited"), encoding='utf-8')
+    summary = run_batch(root)
+    assert summary["processed"] == 1 and summary["skipped_unchanged"] == len(pages) - 1, f"one edit: {summary}"
+    print("   one edited page: 1 reprocessed, the rest skipped")
+
+    # One manifest at the batch root, which recode-html.sh's helper also finds
+    assert [p.relative_to(root) for p in root.rglob(MANIFEST_FILENAME)] == [Path(MANIFEST_FILENAME)], \
+        "the batch must keep a single manifest at its root"
+    fresh = subprocess.run([sys.executable, str(TOOL_DIR / "recode_manifest.py"), "fresh", str(edited)])
+    assert fresh.returncode == 0, "the shell helper must see the batch's entry"
+    edited.write_text("<html><body>Edited again</body></html>", encoding='utf-8')
+    fresh = subprocess.run([sys.executable, str(TOOL_DIR / "recode_manifest.py"), "fresh", str(edited)])
+    assert fresh.returncode == 1, "the shell helper must miss an edited page"
+    print("   recode_manifest.py fresh: shares the batch's entries")
+
+print("\n✅ WCAG Recode Manifest Working!")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test the NUXEE Enhancement Pipeline
+
+Checks the in-process engine against the three-script chain it replaced
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+TOOL_DIR = os.path.dirname(os.path.abspath(__file__))
+DEMO_PAGE = os.path.join(TOOL_DIR, '..', 'nuxee', 'demo', 'deep-blue-fishing.html')
+
+from ux_engine import DEFAULT_LIBRARY, UXEnhancementEngine, load_pattern_library
+
+print("🧪 Testing the NUXEE Enhancement Pipeline")
+print("=" * 60)
+
+engine = UXEnhancementEngine(load_pattern_library(DEFAULT_LIBRARY))
+
+# nexus-ux-enhance.py must write what generate-opportunities.py →
+# nexus-ux-analyzer.py → nexus-ux-applier.py wrote
+print("\n⛓️  In-process engine vs. three-script chain:")
+with tempfile.TemporaryDirectory() as workdir:
+    page = os.path.join(workdir, 'page.html')
+    shutil.copyfile(DEMO_PAGE, page)
+    for script, *args in (("generate-opportunities.py", page),
+                          ("nexus-ux-analyzer.py", page, page.replace(".html", "-ux-opportunities.json")),
+                          ("nexus-ux-applier.py", page, page.replace(".html", "-ux-enhancements.json"))):
+        subprocess.run([sys.executable, os.path.join(TOOL_DIR, script), *args], check=True,
+                       stdout=subprocess.DEVNULL)
+    with open(page.replace(".html", "-enhanced.html"), encoding='utf-8') as f:
+        chained = f.read()
+    with open(page, encoding='utf-8') as f:
+        result = engine.enhance(f.read(), page)
+assert result.html == chained, "in-process output differs from the three-script chain"
+print(f"   {os.path.basename(DEMO_PAGE)}: identical output ({result.applied_count} patterns applied)")
+
+# Patching may only touch the start tags the patterns edit and the end of the
+# head; every other byte (CRLFs, case, quoting, comments, script text) stays
+print("\n🩹 Patched markup:")
+import difflib
+from html.parser import HTMLParser
+
+from ux_applier import UXPatternApplier
+
+test_page = (
+    "<!DOCTYPE html>\r\n<html lang=\"en\">\r\n<head>\r\n<meta charset=\"utf-8\">\r\n"
+    "<title>Café &amp; “quotes”</title>\r\n"
+    "<style>section > img { width: 100% } /* <section> */</style>\r\n"
+    "<script>if (a<b && '<img src=x>') document.write('<section>');</script>\r\n"
+    "</head>\r\n<BODY>\r\n<!-- <section class=\"commented\"><img src=\"c.png\"> -->\r\n"
+    "<SECTION id=hero data-note='a > b'>\r\n  <IMG SRC=\"hero.png\" alt=\"Hero\">\r\n</SECTION>\r\n"
+    "<section class=\"stats\"><div class='stat'><span class=\"stat-number\">42</span></div></section>\r\n"
+    "<section data-scroll-reveal=\"false\"><img class=\"photo\" src=\"a.png\" alt=\"\"/></section>\r\n"
+    "<p>Ünïcödé text 🐟</p>\r\n</BODY>\r\n</html>\r\n"
+)
+library = engine.pattern_library
+enhancements = {"selections": {
+    opp_type: {"count": 1, "selected_patterns": [{"pattern": library["patterns"][pattern_id], "score": 90.0}]}
+    for opp_type, pattern_id in (("sections", "scroll_reveal"), ("images", "image_lazy_fade"),
+                                 ("statistics", "stat_count_up"))
+}}
+
+
+class StartTagSpans(HTMLParser):
+    """(tag, start, end) of every start tag, found independently of html_patch"""
+
+    def __init__(self, html):
+        super().__init__(convert_charrefs=True)
+        self.line_offsets = [0]
+        for line in html.splitlines(keepends=True):
+            self.line_offsets.append(self.line_offsets[-1] + len(line))
+        self.spans = []
+        self.feed(html)
+        self.close()
+
+    def handle_starttag(self, tag, attrs):
+        line, column = self.getpos()
+        start = self.line_offsets[line - 1] + column
+        self.spans.append((tag, start, start + len(self.get_starttag_text())))
+
+    handle_startendtag = handle_starttag
+
+
+patched = UXPatternApplier(library, enhancements).apply_enhancements(test_page)
+spans = StartTagSpans(test_page).spans
+# The injected <style> must close right before the original </head>
+style_start = patched.index('<style data-nexus-ux=')
+style_end = patched.index('</style>', style_start) + len('</style>')
+assert patched[style_end:].startswith(test_page[test_page.index("</head>"):test_page.index("<BODY>")]), \
+    "CSS not injected at the end of the head"
+patched = patched[:style_start] + patched[style_end:]
+edited = set()
+for op, i1, i2, _, _ in difflib.SequenceMatcher(None, test_page, patched, autojunk=False).get_opcodes():
+    if op == 'equal':
+        continue
+    span = next((span for span in spans if span[1] <= i1 and i2 <= span[2]), None)
+    assert span is not None, f"edit outside a start tag at offset {i1}: {test_page[i1 - 20:i2 + 20]!r}"
+    edited.add(span)
+expected = {span for span in spans if span[0] in ('section', 'img')
+            or 'stat-number' in test_page[span[1]:span[2]]}
+assert edited == expected, f"edited tags {sorted(edited)} != expected {sorted(expected)}"
+print(f"   {len(edited)} start tags and the head edited, all other bytes unchanged")
+
+# Tags taken from the opportunity scan's element index must be the ones a
+# search finds; an index that no longer fits the page falls back to searching
+print("\n🗂️  Element index vs. tag search:")
+from ux_opportunities import opportunity_report, scan_opportunities
+
+scanned = []
+counts = scan_opportunities(test_page, scanned)
+indexed = dict(enhancements, elements=opportunity_report("test.html", counts, elements=scanned)["elements"])
+applier = UXPatternApplier(library, indexed)
+assert applier._element_index(test_page, {"sections", "images", "statistics"}) is not None, \
+    "element index doesn't fit the page it was scanned from"
+assert applier.apply_enhancements(test_page) == UXPatternApplier(library, enhancements).apply_enhancements(test_page), \
+    "indexed tags differ from searched tags"
+print("   fresh index: identical output")
+
+shifted_page = test_page.replace("<BODY>", "<BODY><!-- moved -->")
+assert UXPatternApplier(library, indexed).apply_enhancements(shifted_page) \
+    == UXPatternApplier(library, enhancements).apply_enhancements(shifted_page), \
+    "stale index not ignored"
+print("   stale index: identical output")
+
+print("\n✅ NUXEE Pipeline Working!")
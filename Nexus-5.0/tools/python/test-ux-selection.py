@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test NUXEE Batch Pattern Selection
+
+select_batch (one NumPy pass over many pages) must select exactly what
+select_patterns does page by page, with static and with learned effectiveness
+"""
+
+import json
+import random
+
+import ux_analysis
+from ux_analysis import AdaptiveSelector
+from ux_effectiveness import EffectivenessStore, context_bucket
+from ux_engine import DEFAULT_LIBRARY, load_pattern_library
+
+library = load_pattern_library(DEFAULT_LIBRARY)
+# An unknown id in a candidate list must be skipped the same way by both
+pattern_ids = list(library["patterns"]) + ["missing_pattern"]
+opportunity_types = ["buttons", "links", "form_inputs", "cards", "navigation", "sections",
+                     "statistics", "testimonials", "prices", "cta_box"]
+
+random.seed(7)
+pages = []
+for _ in range(1000):
+    opportunities = {}
+    for opp_type in random.sample(opportunity_types, random.randint(0, len(opportunity_types))):
+        opportunities[opp_type] = {
+            "count": random.choice([0, 1, 3, 12]),
+            "patterns": random.sample(pattern_ids, random.randint(0, 4)),
+            "priority": random.choice(["high", "medium", "primary", "low"]),
+        }
+    page_context = {
+        "design_style": random.choice(["minimal", "material", "balanced", "bold"]),
+        "layout_density": random.choice([0.2, 0.5, 0.7, 0.71, 0.9]),
+        "page_intent": random.choice(["conversion", "information", "engagement"]),
+    }
+    pages.append((opportunities, {} if random.random() < 0.1 else page_context))
+
+
+def assert_same_selections(selector, label):
+    for threshold in (0, 60, 75, 90):
+        single = [selector.select_patterns(opportunities, page_context, threshold)
+                  for opportunities, page_context in pages]
+        batch = selector.select_batch(pages, threshold)
+        assert json.dumps(batch) == json.dumps(single), f"{label}: select_batch differs at threshold {threshold}"
+    print(f"   {label}: identical selections")
+
+
+print("🧪 Testing NUXEE Batch Pattern Selection")
+print("=" * 60)
+if ux_analysis.BatchPatternScorer is None:
+    print("   (NumPy not installed: select_batch falls back to select_patterns)")
+
+print("\n📐 Static effectiveness:")
+assert_same_selections(AdaptiveSelector(library), "library values")
+
+# A bucket's outcomes shrink toward the pattern's outcomes elsewhere, never toward themselves
+print("\n🧮 Posterior means:")
+from ux_effectiveness import ALL_CONTEXTS, PRIOR_STRENGTH
+
+counted = EffectivenessStore()
+pattern = {"id": "counted", "effectiveness": 0.8}
+for _ in range(20):
+    counted.record("counted", "minimal:conversion", False)
+for _ in range(30):
+    counted.record("counted", "bold:information", True)
+elsewhere = (0.8 * PRIOR_STRENGTH + 30) / (PRIOR_STRENGTH + 30)
+assert counted.effectiveness(pattern, "minimal:conversion") == elsewhere * PRIOR_STRENGTH / (PRIOR_STRENGTH + 20), \
+    "a bucket's outcomes must count once"
+overall = (0.8 * PRIOR_STRENGTH + 30) / (PRIOR_STRENGTH + 50)
+assert counted.effectiveness(pattern, "balanced:information") == overall, "an unseen bucket uses every outcome"
+assert counted.effectiveness(pattern, ALL_CONTEXTS) == overall, "all contexts uses every outcome once"
+assert EffectivenessStore().effectiveness(pattern, "minimal:conversion") == 0.8, "no outcomes: the library value"
+print("   each outcome counted once per posterior")
+
+# The batch matrix must follow the store as outcomes come in
+print("\n📈 Learned effectiveness:")
+store = EffectivenessStore()
+selector = AdaptiveSelector(library, store)
+for round_number in range(1, 4):
+    for _, page_context in pages[:500]:
+        for pattern_id in pattern_ids[:-1]:
+            if random.random() < 0.05:
+                success_rate = 0.1 if pattern_id.startswith("b") else 0.9
+                store.record(pattern_id, context_bucket(page_context), random.random() < success_rate)
+    assert_same_selections(selector, f"after round {round_number} of outcomes")
+
+print("\n✅ NUXEE Batch Selection Working!")
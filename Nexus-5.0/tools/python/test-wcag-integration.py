@@ -50,6 +50,209 @@ print(f"   Total Issues: {results['total_issues']}")
 print(f"   WCAG AA Compliance: {results['summary']['wcag_aa_compliance']}")
 print(f"   Fix Time: {results['summary']['estimated_fix_time_minutes']} minutes")
 
+# Every installed parser backend must produce the same findings
+print("\n🔀 Parser backends:")
+from html_parsers import available_parsers
+from wcag_hunters import HuntDocument
+
+def findings_by_hunter(parser):
+    document = HuntDocument(test_html, parser=parser)
+    master = WcagHunterOrchestrator(None, verbose=False, write_reports=False, document=document).run_all_hunts()
+    return {name: (report['counts'], report['findings']) for name, report in master['hunter_reports'].items()}
+
+reference = findings_by_hunter('html.parser')
+for parser in available_parsers():
+    assert findings_by_hunter(parser) == reference, f"{parser} findings differ from html.parser"
+    print(f"   {parser}: identical findings")
+
+# The streaming scan must find what the DOM hunt finds; only how a finding
+# points at its element differs (markup vs. tag/line/offset)
+print("\n🌊 Streaming scan:")
+import tempfile
+from wcag_stream import StreamingWcagOrchestrator
+
+def without_location(reports, location_keys):
+    return {name: (report['counts'], [{key: value for key, value in finding.items() if key not in location_keys}
+                                      for finding in report['findings']])
+            for name, report in reports.items()}
+
+with tempfile.NamedTemporaryFile('w', suffix='.html', encoding='utf-8', delete=False) as page:
+    page.write(test_html)
+try:
+    dom_reports = WcagHunterOrchestrator(test_html, verbose=False, write_reports=False,
+                                         parser='html.parser').run_all_hunts()['hunter_reports']
+    for chunk_size in (7, 1 << 16):
+        streamed = StreamingWcagOrchestrator(page.name, verbose=False, write_reports=False,
+                                             chunk_size=chunk_size).run_all_hunts()['hunter_reports']
+        assert without_location(streamed, ('tag', 'line', 'offset')) == without_location(dom_reports, ('element',)), \
+            f"streaming findings (chunk size {chunk_size}) differ from the DOM hunt"
+        print(f"   chunk size {chunk_size}: identical findings")
+finally:
+    os.unlink(page.name)
+
+# Template-dedup audits must report exactly what a full hunt of each page does,
+# shared-fragment findings included
+print("\n🧩 Template dedup:")
+from wcag_dedup import DedupWcagOrchestrator, FragmentIndex
+
+layout = """<!DOCTYPE html>
+<html lang="en">
+<head><title>{title}</title></head>
+<body>
+    <header><nav><a href="/">Home</a> <a href="/about" style="color: #aaa; background: #fff;">About</a>
+        <img src="logo.png"></nav></header>
+    <main>{body}</main>
+    <footer><p>Footer content</p><img src="badge.png" alt=""></footer>
+</body>
+</html>"""
+bodies = [
+    '<h1>One</h1><p style="color: #999; background: #fff;">Low contrast text</p>',
+    '<h2>Two</h2><img src="chart.png">',
+    '<h1>Three</h1><h3>Skipped to h3</h3>',
+]
+
+for parser in available_parsers():
+    fragments = FragmentIndex()
+    reused = 0
+    for number, body in enumerate(bodies, 1):
+        page_html = layout.format(title=f"Page {number}", body=body)
+        deduped = DedupWcagOrchestrator(page_html, fragments, verbose=False, write_reports=False, parser=parser)
+        full = WcagHunterOrchestrator(page_html, verbose=False, write_reports=False, parser=parser)
+        assert deduped.run_all_hunts()['hunter_reports'] == full.run_all_hunts()['hunter_reports'], \
+            f"{parser}: deduped findings of page {number} differ from a full hunt"
+        reused += deduped.dedup["elements_reused"]
+    assert reused, f"{parser}: no shared fragment was reused"
+    print(f"   {parser}: identical findings ({reused} elements reused)")
+
+# Inline color pairs are scored by their real WCAG ratio, whatever the color syntax
+print("\n🎨 Contrast ratios:")
+from wcag_hunters import ColorContrastHunter
+
+contrast_cases = [
+    # (inline style, expected ratio; None when the pair can't be resolved)
+    ("color: #000; background: #fff", 21.0),
+    ("color: #767676; background: #fff", 4.54),
+    ("color: #777; background-color: #fff", 4.48),
+    ("background-color: white; color: red", 4.0),
+    ("color: rgb(0, 0, 255); background: #fff", 8.59),
+    ("color: hsl(0, 0%, 60%); background: #fff", 2.85),
+    ("color: rgba(0, 0, 0, 0.5); background: #fff", 3.98),
+    ("color: navy; background: transparent", 16.01),
+    ("color: rebeccapurple; background: papayawhip", 7.43),
+    ("color: #777; background: linear-gradient(#fff, #000)", 4.48),
+    ("color: #777; background: url(texture.png)", None),
+]
+contrast_hunter = ColorContrastHunter(None, verbose=False)
+for style, expected in contrast_cases:
+    declarations = dict(part.split(':', 1) for part in style.split('; '))
+    ratio = contrast_hunter._calculate_contrast_ratio(
+        declarations['color'].strip(), (declarations.get('background') or declarations['background-color']).strip())
+    assert (ratio if ratio is None else round(ratio, 2)) == expected, f"{style}: ratio {ratio}, expected {expected}"
+
+contrast_page = "<html><body>" + "".join(f'<p style="{style}">Text</p>' for style, _ in contrast_cases) + "</body></html>"
+contrast_report = ColorContrastHunter(contrast_page, verbose=False).scan()
+expected_counts = {
+    "low_contrast_elements": sum(1 for _, ratio in contrast_cases if ratio is not None and ratio < 4.5),
+    "insufficient_aa": sum(1 for _, ratio in contrast_cases if ratio is not None and ratio < 4.5),
+    "insufficient_aaa": sum(1 for _, ratio in contrast_cases if ratio is not None and ratio < 7.0),
+}
+assert contrast_report['counts'] == expected_counts, f"counts {contrast_report['counts']} != {expected_counts}"
+assert [finding['contrast_ratio'] for finding in contrast_report['findings']] == \
+    [ratio for _, ratio in contrast_cases if ratio is not None and ratio < 7.0], "finding ratios differ"
+print(f"   {len(contrast_cases)} color pairs scored; {expected_counts['insufficient_aa']} below AA")
+
+# Cached reports are keyed on everything that changes findings, and the
+# least recently used entries are evicted down to 80% of the budget
+print("\n🗄️  Hunt result cache:")
+import json
+import time
+import wcag_hunters
+from hunt_cache import EVICT_TO, HuntResultCache, cache_key
+from wcag_hunters import ImageAccessibilityHunter, SemanticHtmlHunter, WcagChecker, page_key
+
+page_hash = page_key(test_html, 'html.parser')
+assert page_key(test_html + " ", 'html.parser') != page_hash, "page content must be keyed"
+assert len({page_key(test_html, parser) for parser in available_parsers()}) == len(available_parsers()), \
+    "the parser backend must be keyed"
+hunter_keys = {hunter(None, verbose=False).cache_key(page_hash)
+               for hunter in (ColorContrastHunter, ImageAccessibilityHunter, SemanticHtmlHunter)}
+assert len(hunter_keys) == 3, "the hunter class must be keyed"
+default_key = ColorContrastHunter(None, verbose=False).cache_key(page_hash)
+for variable in ('CONTRAST_THRESHOLD_AA', 'CONTRAST_THRESHOLD_AAA'):
+    os.environ[variable] = "3.0"
+    try:
+        assert ColorContrastHunter(None, verbose=False).cache_key(page_hash) != default_key, f"{variable} must be keyed"
+    finally:
+        del os.environ[variable]
+ruleset_version, wcag_hunters.RULESET_VERSION = wcag_hunters.RULESET_VERSION, "test"
+try:
+    assert ColorContrastHunter(None, verbose=False).cache_key(page_hash) != default_key, "RULESET_VERSION must be keyed"
+finally:
+    wcag_hunters.RULESET_VERSION = ruleset_version
+print("   keys cover content, parser, hunter, thresholds and rule-set version")
+
+with tempfile.TemporaryDirectory() as cache_dir:
+    cache = HuntResultCache(cache_dir)
+    uncached = WcagChecker(parser='html.parser').check(test_html)
+    assert WcagChecker(cache=cache, parser='html.parser').check(test_html) == uncached, "first cached check differs"
+    cached = WcagHunterOrchestrator(test_html, verbose=False, write_reports=False, cache=cache, parser='html.parser')
+    assert cached.run_all_hunts() == uncached['wcag_report'], "cached reports differ from a fresh hunt"
+    assert cache.hits == 3 and cached.document is None, "a fully cached page must not be parsed"
+    print(f"   cached check identical, page not parsed ({cache.hits} hits)")
+
+with tempfile.TemporaryDirectory() as cache_dir:
+    entry = {"padding": "x" * 1000}
+    entry_size = len(json.dumps(entry, separators=(',', ':')))
+    cache = HuntResultCache(cache_dir, max_bytes=entry_size * 10)
+    keys = [cache_key("entry", number) for number in range(11)]
+    for age, key in enumerate(keys[:10]):
+        cache.put(key, entry)
+        stamp = time.time() - 100 + age
+        os.utime(cache._path(key), (stamp, stamp))
+    assert cache.size() == cache.max_bytes, "nothing may be evicted at the budget"
+    # Reading the oldest entry makes it the most recently used
+    assert cache.get(keys[0]) == entry
+    cache.put(keys[10], entry)
+    kept = [number for number, key in enumerate(keys) if cache._path(key).exists()]
+    assert kept == [0] + list(range(4, 11)), f"evicted the wrong entries, kept {kept}"
+    assert cache.size() <= cache.max_bytes * EVICT_TO, "eviction must trim to 80% of the budget"
+    print(f"   over budget: evicted the 3 least recently used entries, {cache.size()} of {cache.max_bytes} bytes kept")
+
+# Re-scoring after fixes re-hunts only the touched elements; it must agree
+# with a full re-parse and hunt of the fixed page
+print("\n♻️  Incremental rescore:")
+from pathlib import Path
+from html_parsers import parse_html
+from wcag_pipeline import FIX_PASSES, WcagFixPipeline
+
+bare_page = """<html><head><style>.muted { color: #bbb } body { background: #fafafa }</style></head>
+<body><h1>Bare page</h1><h2>Section</h2><h4>Skipped to h4</h4>
+<p class="muted">Styled low contrast</p><img src="team_photo-2024.jpg"><img src="x.png" alt="image1">
+<section><div><div style="color: #999; background: #fff"><img src="logo.png"><span>Muted child</span></div></div></section>
+<div class="nav-menu"><a href="/">Home</a></div><p>© 2024 Example</p></body></html>"""
+demo_pages = sorted((Path(__file__).resolve().parent.parent / "nuxee" / "demo").glob("*.html"))
+pages = [test_html, bare_page] + [layout.format(title=f"Page {n}", body=body) for n, body in enumerate(bodies, 1)] \
+    + [path.read_text(encoding='utf-8') for path in demo_pages]
+
+for parser in available_parsers():
+    checker = WcagChecker(parser=parser)
+    fired = set()
+    for number, page_html in enumerate(pages, 1):
+        soup = parse_html(page_html, parser)
+        session = checker.session(soup)
+        session.score()
+        pipeline = WcagFixPipeline(verbose=False, parser=parser)
+        fired.update(name for name, count in pipeline.run_on_soup(soup).items() if count)
+        incremental = session.orchestrator.rerun_hunts(pipeline.modified)['hunter_reports']
+        full = WcagHunterOrchestrator(str(soup), verbose=False, write_reports=False,
+                                      parser=parser).run_all_hunts()['hunter_reports']
+        assert incremental == full, f"{parser}: incremental findings of page {number} differ from a full hunt"
+        result = WcagFixPipeline(verbose=False, checker=checker, parser=parser).run(page_html)
+        assert result.after == checker.score(result.html), \
+            f"{parser}: incremental score of page {number} differs from WcagChecker.score"
+    assert fired == set(FIX_PASSES), f"{parser}: passes never exercised: {set(FIX_PASSES) - fired}"
+    print(f"   {parser}: {len(pages)} pages rescored identically to a full hunt")
+
 print("\n✅ WCAG Hunter Integration Working!")
 print("   → Python hunters generate reports")
 print("   → TypeScript types define structure")
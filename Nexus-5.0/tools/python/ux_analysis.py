@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Analysis - Context Analysis and Pattern Selection
+Adaptive Consciousness for Context-Aware UX Enhancement
+
+Importable stages behind nexus-ux-analyzer.py and nexus-ux-enhance.py:
+ContextAnalyzer reads the page, AdaptiveSelector scores the library's
+candidate patterns for each opportunity category, and enhancement_report
+builds the <page>-ux-enhancements.json document.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
+
+from rule_patterns import (
+    CONTEXT_KEYWORDS, DESIGN_STYLE_KEYWORDS, ELEMENT_OPEN, EXISTING_PATTERN_KEYWORDS, HEX_COLOR,
+    PAGE_INTENT_KEYWORDS
+)
+from ux_effectiveness import DEFAULT_EFFECTIVENESS, EffectivenessStore, context_bucket
+
+try:
+    from ux_scoring import DIMENSIONS, BatchPatternScorer, PatternFeatureMatrix
+except ImportError:
+    # NumPy not installed: select_batch scores page by page
+    BatchPatternScorer = PatternFeatureMatrix = None
+
+CONFIDENCE_THRESHOLD = 60.0
+
+
+@lru_cache(maxsize=None)
+def target_selectors(target: str) -> Tuple[str, ...]:
+    """A pattern's lower-cased target list, split once per distinct target"""
+    return tuple(selector.strip() for selector in target.lower().split(","))
+
+
+@dataclass
+class PageScan:
+    """Everything ContextAnalyzer needs from one read of a page"""
+    length: int
+    keywords: FrozenSet[str]
+    padding: int
+    content_tags: int
+    elements: int
+    colors: List[str]
+
+
+class ContextAnalyzer:
+    """Analyzes page context to understand design style, layout, and intent"""
+    
+    def analyze_page(self, html_content: str) -> Dict[str, Any]:
+        """Comprehensive page analysis"""
+        scan = self.scan_page(html_content)
+        return {
+            "design_style": self._detect_design_style(scan),
+            "layout_density": self._calculate_density(scan),
+            "color_palette": self._extract_colors(scan),
+            "existing_patterns": self._detect_existing_patterns(scan),
+            "page_intent": self._detect_page_intent(scan),
+            "visual_complexity": self._assess_complexity(scan)
+        }
+    
+    def scan_page(self, html: str) -> PageScan:
+        """Lowercase once, check each keyword once, count tags in one regex pass"""
+        html_lower = html.lower()
+        content = ELEMENT_OPEN.findall(html)
+        return PageScan(
+            length=len(html),
+            keywords=frozenset(keyword for keyword in CONTEXT_KEYWORDS if keyword in html_lower),
+            padding=html_lower.count("padding"),
+            content_tags=len(content) - content.count(""),
+            elements=len(content),
+            # Only the first 10 colors are ever used, so stop scanning there
+            colors=[match.group() for match in islice(HEX_COLOR.finditer(html), 10)]
+        )
+    
+    def _detect_design_style(self, scan: PageScan) -> str:
+        """Detect overall design style: minimal, material, corporate, playful"""
+        scores = {}
+        
+        for style, keywords in DESIGN_STYLE_KEYWORDS.items():
+            score = sum(1 for keyword in keywords if keyword in scan.keywords)
+            scores[style] = score
+        
+        # Check for shadows (material design indicator)
+        if "box-shadow" in scan.keywords:
+            scores["material"] = scores.get("material", 0) + 5
+        
+        # Check for lots of whitespace (minimal indicator)
+        if scan.padding > 10:
+            scores["minimal"] = scores.get("minimal", 0) + 3
+        
+        return max(scores, key=scores.get) if scores else "balanced"
+    
+    def _calculate_density(self, scan: PageScan) -> float:
+        """Calculate layout density (0.0 = sparse, 1.0 = very dense)"""
+        # Density = content elements (div/section/article/aside/nav) per 1000 chars
+        density = scan.content_tags / (scan.length / 1000) if scan.length > 0 else 0
+        
+        # Normalize to 0-1 scale
+        return min(density / 10, 1.0)
+    
+    def _extract_colors(self, scan: PageScan) -> List[str]:
+        """Color palette: unique hex colors among the first 10 found, in page order"""
+        return list(dict.fromkeys(scan.colors))
+    
+    def _detect_existing_patterns(self, scan: PageScan) -> List[str]:
+        """Detect what UX patterns are already in use"""
+        return [pattern for pattern, keywords in EXISTING_PATTERN_KEYWORDS.items()
+                if any(keyword in scan.keywords for keyword in keywords)]
+    
+    def _detect_page_intent(self, scan: PageScan) -> str:
+        """Detect page primary intent: conversion, information, entertainment, utility"""
+        scores = {
+            intent: sum(1 for kw in keywords if kw in scan.keywords)
+            for intent, keywords in PAGE_INTENT_KEYWORDS.items()
+        }
+        
+        return max(scores, key=scores.get) if any(scores.values()) else "information"
+    
+    def _assess_complexity(self, scan: PageScan) -> str:
+        """Assess visual complexity: simple, moderate, complex"""
+        element_count = scan.elements
+        
+        if element_count < 100:
+            return "simple"
+        elif element_count < 300:
+            return "moderate"
+        else:
+            return "complex"
+
+
+class IntentDetector:
+    """Detects element purpose and user intent"""
+    
+    def detect_element_purpose(self, element_type: str, class_names: str, content: str) -> str:
+        """Determine element purpose: cta, navigation, information, decoration"""
+        class_lower = class_names.lower()
+        content_lower = content.lower()
+        
+        # CTA indicators
+        cta_keywords = ["btn", "button", "cta", "book", "buy", "subscribe", "sign", "submit"]
+        if any(kw in class_lower or kw in content_lower for kw in cta_keywords):
+            return "cta"
+        
+        # Navigation indicators
+        nav_keywords = ["nav", "menu", "link"]
+        if any(kw in class_lower for kw in nav_keywords):
+            return "navigation"
+        
+        # Information indicators
+        if element_type in ["article", "section", "p"]:
+            return "information"
+        
+        return "decoration"
+    
+    def assess_importance(self, element_type: str, class_names: str, parent_count: int) -> str:
+        """Assess element importance: primary, secondary, tertiary"""
+        class_lower = class_names.lower()
+        
+        # Primary indicators
+        if "primary" in class_lower or "hero" in class_lower or "main" in class_lower:
+            return "primary"
+        
+        # Secondary indicators
+        if "secondary" in class_lower or parent_count < 3:
+            return "secondary"
+        
+        return "tertiary"
+
+
+class PatternScorer:
+    """Scores patterns based on multi-dimensional context"""
+    
+    def __init__(self, effectiveness: Optional[EffectivenessStore] = None):
+        self.context_analyzer = ContextAnalyzer()
+        self.intent_detector = IntentDetector()
+        # Observed effectiveness; without a store the library's static values are used
+        self.effectiveness = effectiveness
+    
+    def score_pattern(self, pattern: Dict, element_context: Dict, 
+                     page_context: Dict) -> Tuple[float, Dict]:
+        """
+        Score a pattern for a specific element in page context
+        Returns: (total_score, score_breakdown)
+        """
+        scores = {}
+        
+        # Dimension 1: Element Context Match (30%)
+        scores["element_match"] = self._score_element_match(pattern, element_context) * 0.30
+        
+        # Dimension 2: Page Layout Fit (25%)
+        scores["layout_fit"] = self._score_layout_fit(pattern, page_context) * 0.25
+        
+        # Dimension 3: Intent Alignment (20%)
+        scores["intent_alignment"] = self._score_intent(pattern, element_context, page_context) * 0.20
+        
+        # Dimension 4: Technical Viability (15%)
+        scores["technical"] = self._score_technical(pattern) * 0.15
+        
+        # Dimension 5: Learning/Effectiveness (10%)
+        scores["effectiveness"] = self._score_effectiveness(pattern, page_context) * 0.10
+        
+        total_score = sum(scores.values()) * 100  # Convert to 0-100 scale
+        
+        return total_score, scores
+    
+    def _score_element_match(self, pattern: Dict, element_context: Dict) -> float:
+        """Score how well pattern matches element type"""
+        # Direct target match check
+        element_type = element_context.get("type", "")
+        element_classes = element_context.get("element_classes", ())
+        for target in target_selectors(pattern.get("target", "")):
+            if element_type in target or target in element_type:
+                return 1.0
+            
+            # Check class names
+            if any(target in cn.lower() for cn in element_context.get("classes", [])):
+                return 0.9
+            
+            # Class selectors against the page's real element classes (ux_opportunities)
+            if target[:1] == "." and target[1:] in element_classes:
+                return 0.9
+        
+        return 0.3  # Partial match
+    
+    def _score_layout_fit(self, pattern: Dict, page_context: Dict) -> float:
+        """Score pattern fit with overall page layout"""
+        score = 0.5  # Base score
+        
+        design_style = page_context.get("design_style", "balanced")
+        density = page_context.get("layout_density", 0.5)
+        
+        # Minimal style prefers subtle patterns
+        if design_style == "minimal":
+            if pattern.get("complexity") == "low":
+                score += 0.3
+            if "subtle" in pattern.get("description", "").lower():
+                score += 0.2
+        
+        # Material style loves shadows and elevation
+        elif design_style == "material":
+            if "shadow" in pattern.get("css", {}).get("hover", ""):
+                score += 0.3
+            if "elevation" in pattern.get("name", "").lower():
+                score += 0.2
+        
+        # High density layouts need subtle animations
+        if density > 0.7:
+            if pattern.get("complexity") == "low":
+                score += 0.2
+            else:
+                score -= 0.3  # Penalize complex patterns
+        
+        return min(score, 1.0)
+    
+    def _score_intent(self, pattern: Dict, element_context: Dict, 
+                     page_context: Dict) -> float:
+        """Score alignment with user intent"""
+        score = 0.5
+        
+        page_intent = page_context.get("page_intent", "information")
+        element_purpose = element_context.get("purpose", "decoration")
+        
+        # Conversion pages benefit from high-impact patterns
+        if page_intent == "conversion":
+            if pattern.get("impact") == "high":
+                score += 0.3
+            if element_purpose == "cta":
+                score += 0.2
+        
+        # Information pages need subtle, non-distracting patterns
+        elif page_intent == "information":
+            if pattern.get("complexity") == "low":
+                score += 0.3
+        
+        # Match pattern impact with element importance
+        if element_context.get("importance") == "primary":
+            if pattern.get("impact") == "high":
+                score += 0.2
+        
+        return min(score, 1.0)
+    
+    def _score_effectiveness(self, pattern: Dict, page_context: Dict) -> float:
+        """Learned effectiveness for the page's context bucket (see ux_effectiveness)"""
+        if self.effectiveness is None:
+            return pattern.get("effectiveness", DEFAULT_EFFECTIVENESS)
+        return self.effectiveness.effectiveness(pattern, context_bucket(page_context))
+    
+    def _score_technical(self, pattern: Dict) -> float:
+        """Score technical viability"""
+        score = 1.0
+        
+        # AAA compliance is mandatory
+        if not pattern.get("aaa_safe", False):
+            return 0.0
+        
+        # Prefer patterns that don't require JS
+        if pattern.get("requires_js", False):
+            score -= 0.2
+        
+        # Prefer low complexity
+        if pattern.get("complexity") == "low":
+            score += 0.0  # Already at 1.0
+        elif pattern.get("complexity") == "high":
+            score -= 0.3
+        
+        return max(score, 0.0)
+
+
+class AdaptiveSelector:
+    """Selects optimal patterns using adaptive intelligence"""
+    
+    def __init__(self, pattern_library: Dict, effectiveness: Optional[EffectivenessStore] = None):
+        self.patterns = pattern_library["patterns"]
+        self.scorer = PatternScorer(effectiveness)
+        # Built on first select_batch call
+        self._batch = None
+    
+    def select_patterns(self, opportunities: Dict, page_context: Dict, 
+                       confidence_threshold: float = 60.0) -> Dict:
+        """
+        Select optimal patterns for all opportunities
+        Returns: Dictionary of selected patterns with scores
+        """
+        selections = {}
+        
+        for opp_type, opp_data in opportunities.items():
+            if opp_data.get("count", 0) == 0:
+                continue
+            
+            # Get candidate patterns
+            candidate_ids = opp_data.get("patterns", [])
+            candidates = [self.patterns[pid] for pid in candidate_ids if pid in self.patterns]
+            
+            if not candidates:
+                continue
+            
+            # Create element context
+            element_context = {
+                "type": opp_type,
+                "classes": [opp_type],
+                "element_classes": tuple(opp_data.get("classes", ())),
+                "purpose": self._infer_purpose(opp_type),
+                "importance": opp_data.get("priority", "medium")
+            }
+            
+            # Score each candidate
+            scored_candidates = []
+            for pattern in candidates:
+                score, breakdown = self.scorer.score_pattern(
+                    pattern, element_context, page_context
+                )
+                
+                if score >= confidence_threshold:
+                    scored_candidates.append({
+                        "pattern": pattern,
+                        "score": score,
+                        "breakdown": breakdown,
+                        "confidence": self._calculate_confidence(breakdown)
+                    })
+            
+            # Select best pattern(s)
+            selected = self._pick(scored_candidates)
+            if selected:
+                selections[opp_type] = {
+                    "count": opp_data["count"],
+                    "selected_patterns": selected
+                }
+        
+        return selections
+    
+    def select_batch(self, pages: List[Tuple[Dict, Dict]],
+                     confidence_threshold: float = 60.0) -> List[Dict]:
+        """
+        select_patterns for many (opportunities, page_context) pairs at once
+        All scores come from one NumPy pass (ux_scoring); results are identical
+        """
+        if BatchPatternScorer is None or not pages:
+            return [self.select_patterns(opportunities, page_context, confidence_threshold)
+                    for opportunities, page_context in pages]
+        if self._batch is None:
+            self._batch = BatchPatternScorer(PatternFeatureMatrix(self.patterns, self.scorer))
+        
+        index = self._batch.features.index
+        
+        # A cell is one opportunity on one page; cells sharing the opportunity
+        # type, candidate list, priority and element classes are one "kind"
+        kinds: Dict[Tuple, int] = {}
+        cell_pages, cell_kinds, cell_counts = [], [], []
+        for page, (opportunities, _) in enumerate(pages):
+            for opp_type, opp_data in opportunities.items():
+                count = opp_data.get("count", 0)
+                if count == 0:
+                    continue
+                key = (opp_type, tuple(opp_data.get("patterns", [])), opp_data.get("priority", "medium"),
+                       tuple(opp_data.get("classes", ())))
+                kind = kinds.get(key)
+                if kind is None:
+                    kind = kinds[key] = len(kinds)
+                cell_pages.append(page)
+                cell_kinds.append(kind)
+                cell_counts.append(count)
+        
+        results = [{} for _ in pages]
+        kind_candidates = [[pid for pid in candidate_ids if pid in self.patterns]
+                           for _, candidate_ids, _, _ in kinds]
+        if not any(kind_candidates):
+            return results
+        kind_types = [opp_type for opp_type, _, _, _ in kinds]
+        scored_cells = self._batch.score(
+            [page_context for _, page_context in pages],
+            [(opp_type, classes, self._infer_purpose(opp_type), priority == "primary",
+              [index[pid] for pid in candidates])
+             for (opp_type, _, priority, classes), candidates in zip(kinds, kind_candidates)],
+            cell_pages, cell_kinds, confidence_threshold
+        )
+        
+        # Only cells with a candidate over the threshold come back to be built
+        for cell, cell_totals, cell_breakdowns in scored_cells:
+            candidate_ids = kind_candidates[cell_kinds[cell]]
+            scored_candidates = [
+                {"pattern": self.patterns[pid], "score": score, "slot": slot}
+                for slot, (pid, score) in enumerate(zip(candidate_ids, cell_totals))
+                if score >= confidence_threshold
+            ]
+            # Breakdowns only for the patterns that made the cut
+            selected = self._pick(scored_candidates)
+            for candidate in selected:
+                candidate["breakdown"] = dict(zip(DIMENSIONS, cell_breakdowns[candidate.pop("slot")]))
+                candidate["confidence"] = self._calculate_confidence(candidate["breakdown"])
+            results[cell_pages[cell]][kind_types[cell_kinds[cell]]] = {
+                "count": cell_counts[cell],
+                "selected_patterns": selected
+            }
+        
+        return results
+    
+    def _pick(self, scored_candidates: List[Dict]) -> List[Dict]:
+        """Top pattern, plus the runner-up when it also scores above 80"""
+        if not scored_candidates:
+            return []
+        # Sort by score
+        scored_candidates.sort(key=lambda x: x["score"], reverse=True)
+        
+        # Take top pattern (or top 2 if both score high)
+        selected = [scored_candidates[0]]
+        if len(scored_candidates) > 1 and scored_candidates[1]["score"] > 80:
+            selected.append(scored_candidates[1])
+        return selected
+    
+    def _infer_purpose(self, opp_type: str) -> str:
+        """Infer purpose from opportunity type"""
+        purpose_map = {
+            "buttons": "cta",
+            "links": "navigation",
+            "form_inputs": "cta",
+            "cards": "information",
+            "navigation": "navigation",
+            "testimonials": "information",
+            "prices": "cta",
+            "statistics": "cta"
+        }
+        return purpose_map.get(opp_type, "decoration")
+    
+    def _calculate_confidence(self, breakdown: Dict) -> str:
+        """Calculate confidence level from score breakdown"""
+        avg_score = sum(breakdown.values()) / len(breakdown) if breakdown else 0
+        
+        if avg_score > 0.8:
+            return "high"
+        elif avg_score > 0.6:
+            return "medium"
+        else:
+            return "low"
+
+
+def enhancement_report(html_file: str, opportunities: Dict, page_context: Dict, selections: Dict,
+                       confidence_threshold: float = CONFIDENCE_THRESHOLD) -> Dict[str, Any]:
+    """
+    The <page>-ux-enhancements.json document consumed by nexus-ux-applier.py
+    The opportunity scan's element index is passed through for the applier.
+    """
+    report = {
+        "file": html_file,
+        "timestamp": opportunities.get("timestamp"),
+        "page_context": page_context,
+        "selections": selections,
+        "summary": {
+            "total_opportunities": opportunities.get("total_opportunities", 0),
+            "patterns_selected": sum(len(sel["selected_patterns"]) for sel in selections.values()),
+            "total_applications": sum(
+                sel["count"] * len(sel["selected_patterns"]) for sel in selections.values()
+            ),
+            "confidence_threshold": confidence_threshold
+        }
+    }
+    if "elements" in opportunities:
+        report["elements"] = opportunities["elements"]
+    return report
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Pattern CSS
+Ready-to-inject CSS for every library pattern, compiled once per library
+
+UXPatternApplier used to rebuild each selected pattern's rules from its css
+dict on every page. compile_pattern_css turns the whole library into one
+block per pattern up front (memoized by a digest of the library content), so
+a page only joins the blocks it selected. The same compilation backs the
+shared-stylesheet mode: every block scoped to pages that list the pattern in
+<html data-nexus-ux-patterns>, so one external file serves the whole site.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, List
+
+# css key -> selector suffix, in output order; "animation" is raw CSS (@keyframes)
+CSS_STATES = (
+    ("base", ""),
+    ("hover", ":hover"),
+    ("active", ":active"),
+    ("focus", ":focus"),
+    ("before", "::before"),
+    ("after", "::after"),
+    ("hover_before", ":hover::before"),
+    ("animation", None),
+    ("visible", ".visible"),
+    ("loaded", ".loaded"),
+)
+
+# <html> attribute listing a page's patterns when the shared stylesheet is used
+PATTERNS_ATTRIBUTE = "data-nexus-ux-patterns"
+STYLESHEET_NAME = "nexus-ux.css"
+
+MOTION_SAFETY_HEADER = "\n/* AAA Motion Safety */\n"
+ENHANCEMENTS_HEADER = "\n/* NEXUS UX Enhancements - Adaptive Intelligence */"
+
+
+def split_selectors(target: str) -> List[str]:
+    """Split a selector list on top-level commas (not inside [...] or (...))"""
+    selectors, depth, start = [], 0, 0
+    for i, ch in enumerate(target):
+        if ch in "([":
+            depth += 1
+        elif ch in ")]":
+            depth -= 1
+        elif ch == "," and depth == 0:
+            selectors.append(target[start:i].strip())
+            start = i + 1
+    selectors.append(target[start:].strip())
+    return [selector for selector in selectors if selector]
+
+
+def compile_pattern(pattern: Dict, scope: str = "") -> str:
+    """
+    CSS rules for one pattern, or "" if it has no css/target
+    State suffixes apply to every selector in the target list, and the
+    :active declarations also cover .active (dropdowns/modals) in one rule.
+    scope is prefixed to every selector.
+    """
+    css_rules = pattern.get("css", {})
+    selectors = split_selectors(pattern.get("target", ""))
+    if not css_rules or not selectors:
+        return ""
+
+    css_lines = []
+    for state, suffix in CSS_STATES:
+        if state not in css_rules:
+            continue
+        if suffix is None:
+            css_lines.append(css_rules[state])
+            continue
+        suffixes = [suffix]
+        if state == "active" and "active" not in css_rules.get("base", ""):
+            suffixes.append(".active")
+        selector_list = ", ".join(f"{scope}{selector}{s}" for s in suffixes for selector in selectors)
+        css_lines.append(f"{selector_list} {{")
+        css_lines.append(f"  {css_rules[state]}")
+        css_lines.append("}")
+    return "\n".join(css_lines)
+
+
+def library_digest(pattern_library: Dict) -> str:
+    """Content hash of the parts of a library that end up in CSS"""
+    content = json.dumps([pattern_library.get("patterns", {}), pattern_library.get("motion_safety", {})],
+                         sort_keys=True)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PatternCSS:
+    """Compiled CSS of one pattern library"""
+    digest: str
+    motion_safety: str
+    names: Dict[str, str]
+    inline: Dict[str, str]
+    scoped: Dict[str, str]
+
+    def stylesheet(self) -> str:
+        """The shared external stylesheet: every pattern, scoped by PATTERNS_ATTRIBUTE"""
+        parts = [f"/* NEXUS UX patterns {self.digest} */"]
+        if self.motion_safety:
+            parts.append(f"{MOTION_SAFETY_HEADER}{self.motion_safety}")
+        parts.append(ENHANCEMENTS_HEADER)
+        for pattern_id, css in self.scoped.items():
+            parts.append(f"\n/* {self.names[pattern_id]} */")
+            parts.append(css)
+        return "\n".join(parts) + "\n"
+
+
+_COMPILED: Dict[str, PatternCSS] = {}
+
+
+def compile_pattern_css(pattern_library: Dict) -> PatternCSS:
+    """Compile every pattern of a library (cached per library content)"""
+    digest = library_digest(pattern_library)
+    compiled = _COMPILED.get(digest)
+    if compiled is None:
+        inline, scoped, names = {}, {}, {}
+        for pattern_id, pattern in pattern_library.get("patterns", {}).items():
+            css = compile_pattern(pattern)
+            if not css:
+                continue
+            names[pattern_id] = pattern.get("name", pattern_id)
+            inline[pattern_id] = css
+            scoped[pattern_id] = compile_pattern(pattern, f'html[{PATTERNS_ATTRIBUTE}~="{pattern_id}"] ')
+        compiled = _COMPILED[digest] = PatternCSS(
+            digest=digest,
+            motion_safety=pattern_library.get("motion_safety", {}).get("prefers_reduced_motion", ""),
+            names=names, inline=inline, scoped=scoped,
+        )
+    return compiled
+
+
+def remember_pattern_css(compiled: PatternCSS):
+    """Make an already compiled library (e.g. from ux_library's cache) a cache hit"""
+    _COMPILED.setdefault(compiled.digest, compiled)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Effectiveness Store
+Observed pattern effectiveness, learned incrementally from verified pages
+
+PatternScorer's effectiveness dimension used to be the library's static
+"effectiveness" value. The store keeps success/trial counts per pattern and
+per page-context bucket (design style x page intent) and turns them into
+Beta posterior means, with the library value as the prior. A bucket shrinks
+toward the pattern's outcomes in every other bucket, so no outcome counts twice:
+
+    pattern mean = (prior * PRIOR_STRENGTH + other successes) / (PRIOR_STRENGTH + other trials)
+    bucket mean  = (pattern mean * PRIOR_STRENGTH + successes) / (PRIOR_STRENGTH + trials)
+
+A pattern with no outcomes scores exactly as before. Each outcome updates
+two counters (no batch recomputation), lookups are dict hits, and the store
+persists as one compact JSON file. ux_site.py feeds it: every pattern applied
+to a verified page that touched elements there is a success when it passes
+its own AAA checks (ux_verify) and the WCAG hunters don't regress, a failure
+otherwise.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+STORE_FILENAME = "ux_effectiveness.json"
+STORE_SCHEMA_VERSION = 1
+# Weight of the prior, in pseudo-observations
+PRIOR_STRENGTH = 10.0
+# Bucket holding a pattern's outcomes across all page contexts
+ALL_CONTEXTS = "*"
+DEFAULT_EFFECTIVENESS = 0.5
+
+
+def context_bucket(page_context: Dict[str, Any]) -> str:
+    """Page-context bucket outcomes are grouped by"""
+    return f"{page_context.get('design_style', 'balanced')}:{page_context.get('page_intent', 'information')}"
+
+
+class EffectivenessStore:
+    """Success/trial counts per pattern and context bucket, read as Beta posterior means"""
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, prior_strength: float = PRIOR_STRENGTH):
+        self.path = Path(path) if path else None
+        self.prior_strength = prior_strength
+        # pattern id -> bucket -> [successes, trials]
+        self.outcomes: Dict[str, Dict[str, List[int]]] = {}
+        # pattern id -> bucket -> posterior mean, dropped when the pattern gets an outcome
+        self._means: Dict[str, Dict[str, float]] = {}
+        self.version = 0
+        self.dirty = False
+        if self.path is not None:
+            self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("schemaVersion") == STORE_SCHEMA_VERSION:
+            self.prior_strength = data.get("prior_strength", self.prior_strength)
+            self.outcomes = data.get("outcomes", {})
+
+    def effectiveness(self, pattern: Dict[str, Any], bucket: str) -> float:
+        """Posterior mean effectiveness of a pattern in a context bucket"""
+        pattern_id = pattern.get("id")
+        means = self._means.get(pattern_id)
+        if means is not None and bucket in means:
+            return means[bucket]
+
+        mean = pattern.get("effectiveness", DEFAULT_EFFECTIVENESS)
+        counts = self.outcomes.get(pattern_id)
+        if counts:
+            # ALL_CONTEXTS includes the bucket's own outcomes; its prior must not
+            successes, trials = counts.get(ALL_CONTEXTS, (0, 0))
+            bucket_successes, bucket_trials = counts.get(bucket, (0, 0)) if bucket != ALL_CONTEXTS else (0, 0)
+            mean = ((mean * self.prior_strength + successes - bucket_successes)
+                    / (self.prior_strength + trials - bucket_trials))
+            mean = (mean * self.prior_strength + bucket_successes) / (self.prior_strength + bucket_trials)
+        self._means.setdefault(pattern_id, {})[bucket] = mean
+        return mean
+
+    def record(self, pattern_id: str, bucket: str, success: bool):
+        """One observed outcome of a pattern applied on a page in this bucket"""
+        counts = self.outcomes.setdefault(pattern_id, {})
+        for key in (ALL_CONTEXTS, bucket):
+            entry = counts.setdefault(key, [0, 0])
+            entry[0] += int(success)
+            entry[1] += 1
+        self._means.pop(pattern_id, None)
+        self.version += 1
+        self.dirty = True
+
+    def trials(self, pattern_id: str, bucket: str = ALL_CONTEXTS) -> int:
+        return self.outcomes.get(pattern_id, {}).get(bucket, [0, 0])[1]
+
+    def save(self):
+        """Atomically write the store (tmp file + rename)"""
+        if self.path is None or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + f".{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                "schemaVersion": STORE_SCHEMA_VERSION,
+                "module": "ux_effectiveness",
+                "prior_strength": self.prior_strength,
+                "outcomes": self.outcomes,
+            }, f, separators=(',', ':'))
+        os.replace(tmp, self.path)
+        self.dirty = False
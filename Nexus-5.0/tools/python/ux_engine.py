@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Enhancement Engine
+Detection, context analysis, selection and application in one process
+
+enhance-ux.sh used to start three interpreters that each re-read the page and
+ux-patterns-library.json and handed off through -ux-opportunities.json and
+-ux-enhancements.json. The engine loads the library once, reads each page
+once and passes every stage's output along in memory: opportunity counting,
+context analysis and the applier's patching all work on the markup string. The intermediate JSON files are written only when asked for.
+For many pages, selection is scored a batch at a time (ux_scoring), and
+pattern CSS is compiled once per library (ux_css); with a stylesheet path
+every page links one shared nexus-ux.css instead of inlining its CSS.
+An effectiveness store swaps the library's static effectiveness for the
+outcomes observed so far (ux_effectiveness).
+"""
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ux_analysis import CONFIDENCE_THRESHOLD, AdaptiveSelector, ContextAnalyzer, enhancement_report
+from ux_applier import UXPatternApplier
+from ux_css import compile_pattern_css
+from ux_effectiveness import EffectivenessStore
+from ux_library import LIBRARY_PATH, load_library
+from ux_opportunities import opportunity_report, scan_opportunities
+
+DEFAULT_LIBRARY = LIBRARY_PATH
+# Bump when the enhanced output for the same page and library changes
+ENGINE_VERSION = "2.2.0"
+# Pages whose pattern selections are scored together (see ux_scoring)
+SELECTION_BATCH_SIZE = 1024
+
+
+def load_pattern_library(path: Union[str, Path] = DEFAULT_LIBRARY) -> Dict[str, Any]:
+    """The validated ux-patterns-library.json document (see ux_library)"""
+    return load_library(path).document
+
+
+def output_paths(html_file: Union[str, Path]) -> Dict[str, Path]:
+    """Output locations used by enhance-ux.sh for a given input"""
+    path = Path(html_file)
+    stem = path.with_suffix('') if path.suffix == '.html' else path
+    return {
+        "opportunities": Path(f"{stem}-ux-opportunities.json"),
+        "enhancements": Path(f"{stem}-ux-enhancements.json"),
+        "output": Path(f"{stem}-enhanced.html"),
+    }
+
+
+@dataclass
+class EnhancementResult:
+    """Outcome of one page run"""
+    html_file: str
+    html: str
+    original_size: int
+    opportunities: Dict[str, Any]
+    enhancements: Dict[str, Any]
+    applied_count: int
+    css_blocks: int
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Ids of the patterns whose CSS went into the page
+    applied_ids: List[str] = field(default_factory=list)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return sum(self.timings.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """The numbers enhance-ux.sh reports"""
+        return {
+            "file": self.html_file,
+            **self.enhancements["summary"],
+            "applied_patterns": self.applied_count,
+            "original_size": self.original_size,
+            "enhanced_size": len(self.html),
+            "timings_ms": {stage: round(ms, 2) for stage, ms in self.timings.items()},
+        }
+
+
+class UXEnhancementEngine:
+    """Runs every UX stage for any number of pages against one loaded library"""
+
+    def __init__(self, pattern_library: Dict[str, Any],
+                 confidence_threshold: float = CONFIDENCE_THRESHOLD,
+                 stylesheet: Optional[Union[str, Path]] = None,
+                 effectiveness: Optional[EffectivenessStore] = None):
+        self.pattern_library = pattern_library
+        self.confidence_threshold = confidence_threshold
+        self.pattern_css = compile_pattern_css(pattern_library)
+        # Shared external stylesheet linked from every page instead of inline CSS
+        self.stylesheet = Path(stylesheet) if stylesheet else None
+        self.context_analyzer = ContextAnalyzer()
+        # Learned pattern effectiveness (ux_effectiveness); static library values without it
+        self.selector = AdaptiveSelector(pattern_library, effectiveness)
+
+    def enhance(self, html: str, html_file: str = "") -> EnhancementResult:
+        """Enhance one page's markup in memory"""
+        opportunities, page_context, timings = self._analyze(html, html_file)
+
+        start = time.perf_counter()
+        selections = self.selector.select_patterns(opportunities["opportunities"], page_context,
+                                                   confidence_threshold=self.confidence_threshold)
+        timings["select"] = (time.perf_counter() - start) * 1000
+
+        return self._apply(html, html_file, opportunities, page_context, selections, timings)
+
+    def enhance_many(self, pages: Iterable[Tuple[str, str]],
+                     batch_size: int = SELECTION_BATCH_SIZE) -> Iterator[EnhancementResult]:
+        """Enhance (html_file, html) pages, scoring each batch's selections in one NumPy pass"""
+        pages = iter(pages)
+        while True:
+            batch = list(islice(pages, batch_size))
+            if not batch:
+                return
+            analyzed = [(html_file, html) + self._analyze(html, html_file) for html_file, html in batch]
+
+            start = time.perf_counter()
+            batch_selections = self.selector.select_batch(
+                [(opportunities["opportunities"], page_context)
+                 for _, _, opportunities, page_context, _ in analyzed],
+                confidence_threshold=self.confidence_threshold
+            )
+            select_ms = (time.perf_counter() - start) * 1000 / len(batch)
+
+            for (html_file, html, opportunities, page_context, timings), selections in zip(analyzed,
+                                                                                            batch_selections):
+                timings["select"] = select_ms
+                yield self._apply(html, html_file, opportunities, page_context, selections, timings)
+
+    def enhance_file(self, html_file: Union[str, Path], write_json: bool = False) -> EnhancementResult:
+        """Enhance a page on disk, writing <page>-enhanced.html (and the stage JSON if asked)"""
+        with open(html_file, 'r', encoding='utf-8') as f:
+            html = f.read()
+        result = self.enhance(html, str(html_file))
+        self.write_outputs(result, write_json)
+        return result
+
+    def enhance_files(self, html_files: Iterable[Union[str, Path]], write_json: bool = False,
+                      batch_size: int = SELECTION_BATCH_SIZE) -> Iterator[EnhancementResult]:
+        """enhance_file for many pages, with batched selection"""
+        def pages():
+            for html_file in html_files:
+                with open(html_file, 'r', encoding='utf-8') as f:
+                    yield str(html_file), f.read()
+
+        for result in self.enhance_many(pages(), batch_size):
+            self.write_outputs(result, write_json)
+            yield result
+
+    def write_outputs(self, result: EnhancementResult, write_json: bool = False):
+        """Write <page>-enhanced.html (and the stage JSON if asked)"""
+        paths = output_paths(result.html_file)
+        if write_json:
+            for name in ("opportunities", "enhancements"):
+                with open(paths[name], 'w') as f:
+                    json.dump(getattr(result, name), f, indent=2)
+        with open(paths["output"], 'w', encoding='utf-8') as f:
+            f.write(result.html)
+
+    def write_stylesheet(self) -> Optional[Path]:
+        """Write the shared stylesheet (when one is configured)"""
+        if self.stylesheet is None:
+            return None
+        self.stylesheet.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.stylesheet, 'w', encoding='utf-8') as f:
+            f.write(self.pattern_css.stylesheet())
+        return self.stylesheet
+
+    # -- stages ---------------------------------------------------------------
+
+    def _analyze(self, html: str, html_file: str) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, float]]:
+        """Detect opportunities and analyze page context"""
+        timings = {}
+
+        start = time.perf_counter()
+        elements = []
+        opportunities = opportunity_report(html_file, scan_opportunities(html, elements), elements=elements)
+        timings["detect"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        page_context = self.context_analyzer.analyze_page(html)
+        timings["analyze"] = (time.perf_counter() - start) * 1000
+        return opportunities, page_context, timings
+
+    def _apply(self, html: str, html_file: str, opportunities: Dict[str, Any], page_context: Dict[str, Any],
+               selections: Dict[str, Any], timings: Dict[str, float]) -> EnhancementResult:
+        """Build the enhancement report and apply it"""
+        start = time.perf_counter()
+        enhancements = enhancement_report(html_file, opportunities, page_context, selections,
+                                          self.confidence_threshold)
+        applier = UXPatternApplier(self.pattern_library, enhancements, pattern_css=self.pattern_css,
+                                   stylesheet_href=self._stylesheet_href(html_file))
+        enhanced_html = applier.apply_enhancements(html)
+        timings["apply"] = (time.perf_counter() - start) * 1000
+
+        return EnhancementResult(html_file=html_file, html=enhanced_html, original_size=len(html),
+                                 opportunities=opportunities, enhancements=enhancements,
+                                 applied_count=applier.applied_count,
+                                 css_blocks=len(applier.css_blocks), timings=timings,
+                                 applied_ids=list(dict.fromkeys(applier.applied_ids)))
+
+    def _stylesheet_href(self, html_file: str) -> Optional[str]:
+        """The shared stylesheet's URL relative to a page"""
+        if self.stylesheet is None:
+            return None
+        page_dir = os.path.dirname(os.path.abspath(html_file)) if html_file else os.getcwd()
+        return Path(os.path.relpath(os.path.abspath(self.stylesheet), page_dir)).as_posix()
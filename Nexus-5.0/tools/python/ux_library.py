@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Pattern Library Loader
+ux-patterns-library.json located relative to the tools, validated once,
+indexed, and cached in compiled form
+
+The CLIs used to json.load("ux-patterns-library.json") from the current
+directory, so they only worked when run from nuxee/. load_library finds the
+library next to the tool (or in ../nuxee for the python/ mirrors), checks
+its schema, and builds lookups by id, category, target selector and
+aaa_safe along with the compiled pattern CSS (ux_css). The compiled form is
+pickled under __pycache__/ beside the library, keyed by the file's sha256,
+so later runs and pool workers skip parsing, validation and CSS compilation.
+
+Environment:
+  NEXUS_UX_LIBRARY_CACHE_DIR   pickle cache location (default <library dir>/__pycache__)
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from ux_css import CSS_STATES, PatternCSS, compile_pattern_css, remember_pattern_css, split_selectors
+
+LIBRARY_FILENAME = "ux-patterns-library.json"
+TOOL_DIR = Path(__file__).resolve().parent
+# nuxee/ holds the library; the python/ mirrors of these modules look there too
+LIBRARY_PATH = next((path for path in (TOOL_DIR / LIBRARY_FILENAME, TOOL_DIR.parent / "nuxee" / LIBRARY_FILENAME)
+                     if path.exists()), TOOL_DIR / LIBRARY_FILENAME)
+# Bump when PatternLibrary's fields, the validation rules or the CSS compilation change
+LIBRARY_CACHE_VERSION = 1
+
+LEVELS = ("low", "medium", "high")
+REQUIRED_FIELDS = ("id", "name", "category", "target", "css")
+FLAG_FIELDS = ("aaa_safe", "requires_js", "requires_motion_check")
+CSS_KEYS = frozenset(state for state, _ in CSS_STATES)
+
+
+class LibrarySchemaError(ValueError):
+    """The pattern library doesn't have the shape the UX stages rely on"""
+
+    def __init__(self, path: Union[str, Path], problems: List[str]):
+        self.path = str(path)
+        self.problems = problems
+        super().__init__(f"{path}: " + "; ".join(problems))
+
+
+def validate_library(document: Any) -> List[str]:
+    """Schema problems in a parsed library ([] when valid)"""
+    if not isinstance(document, dict):
+        return ["library must be a JSON object"]
+    patterns = document.get("patterns")
+    if not isinstance(patterns, dict):
+        return ["'patterns' must be an object keyed by pattern id"]
+    categories = document.get("categories")
+    if categories is not None and not isinstance(categories, dict):
+        return ["'categories' must be an object"]
+
+    problems = []
+    for pattern_id, pattern in patterns.items():
+        where = f"patterns.{pattern_id}"
+        if not isinstance(pattern, dict):
+            problems.append(f"{where} must be an object")
+            continue
+        missing = [name for name in REQUIRED_FIELDS if name not in pattern]
+        if missing:
+            problems.append(f"{where} is missing {', '.join(missing)}")
+        for name in ("id", "name", "category", "target"):
+            if name in pattern and not (isinstance(pattern[name], str) and pattern[name].strip()):
+                problems.append(f"{where}.{name} must be a non-empty string")
+        if pattern.get("id", pattern_id) != pattern_id:
+            problems.append(f"{where}.id is {pattern['id']!r}")
+        if categories is not None and isinstance(pattern.get("category"), str) \
+                and pattern["category"] not in categories:
+            problems.append(f"{where}.category {pattern['category']!r} is not a library category")
+        css = pattern.get("css", {})
+        if not isinstance(css, dict) or not all(isinstance(rule, str) for rule in css.values()):
+            problems.append(f"{where}.css must map states to CSS strings")
+        elif set(css) - CSS_KEYS:
+            problems.append(f"{where}.css has unknown states {', '.join(sorted(set(css) - CSS_KEYS))}")
+        for name in ("impact", "complexity"):
+            if name in pattern and pattern[name] not in LEVELS:
+                problems.append(f"{where}.{name} must be one of {', '.join(LEVELS)}")
+        for name in FLAG_FIELDS:
+            if pattern.get(name) is not None and not isinstance(pattern[name], bool):
+                problems.append(f"{where}.{name} must be true/false")
+        effectiveness = pattern.get("effectiveness", 0.5)
+        if isinstance(effectiveness, bool) or not isinstance(effectiveness, (int, float)) \
+                or not 0 <= effectiveness <= 1:
+            problems.append(f"{where}.effectiveness must be a number from 0 to 1")
+    return problems
+
+
+@dataclass(frozen=True)
+class PatternLibrary:
+    """A validated pattern library with its lookups and compiled CSS"""
+    path: str
+    sha256: str
+    document: Dict[str, Any]
+    by_category: Dict[str, Tuple[str, ...]]
+    by_selector: Dict[str, Tuple[str, ...]]
+    aaa_safe: FrozenSet[str]
+    css: PatternCSS
+
+    @property
+    def patterns(self) -> Dict[str, Dict[str, Any]]:
+        """Patterns keyed by id"""
+        return self.document["patterns"]
+
+    def get(self, pattern_id: str) -> Optional[Dict[str, Any]]:
+        return self.patterns.get(pattern_id)
+
+    def in_category(self, category: str) -> List[Dict[str, Any]]:
+        return [self.patterns[pattern_id] for pattern_id in self.by_category.get(category, ())]
+
+    def for_selector(self, selector: str) -> List[Dict[str, Any]]:
+        """Patterns whose target list includes this selector (case-insensitive)"""
+        return [self.patterns[pattern_id] for pattern_id in self.by_selector.get(selector.strip().lower(), ())]
+
+    def is_aaa_safe(self, pattern_id: str) -> bool:
+        return pattern_id in self.aaa_safe
+
+
+def build_library(path: Union[str, Path], content: bytes) -> PatternLibrary:
+    """Parse, validate and index library file content"""
+    try:
+        document = json.loads(content)
+    except ValueError as e:
+        raise LibrarySchemaError(path, [f"invalid JSON ({e})"]) from e
+    problems = validate_library(document)
+    if problems:
+        raise LibrarySchemaError(path, problems)
+
+    by_category: Dict[str, List[str]] = {}
+    by_selector: Dict[str, List[str]] = {}
+    for pattern_id, pattern in document["patterns"].items():
+        by_category.setdefault(pattern["category"], []).append(pattern_id)
+        for selector in split_selectors(pattern["target"].lower()):
+            by_selector.setdefault(selector, []).append(pattern_id)
+    return PatternLibrary(
+        path=str(path),
+        sha256=hashlib.sha256(content).hexdigest(),
+        document=document,
+        by_category={category: tuple(ids) for category, ids in by_category.items()},
+        by_selector={selector: tuple(ids) for selector, ids in by_selector.items()},
+        aaa_safe=frozenset(pattern_id for pattern_id, pattern in document["patterns"].items()
+                       if pattern.get("aaa_safe", False)),
+        css=compile_pattern_css(document),
+    )
+
+
+def _cache_path(path: Path, sha256: str) -> Path:
+    cache_dir = Path(os.getenv('NEXUS_UX_LIBRARY_CACHE_DIR') or path.parent / "__pycache__")
+    return cache_dir / f"{path.stem}.{sha256[:16]}.v{LIBRARY_CACHE_VERSION}.pickle"
+
+
+def _read_cache(cache_path: Path, sha256: str) -> Optional[PatternLibrary]:
+    try:
+        with open(cache_path, 'rb') as f:
+            library = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(library, PatternLibrary) or library.sha256 != sha256:
+        return None
+    return library
+
+
+def _write_cache(cache_path: Path, library: PatternLibrary):
+    """Atomically write the compiled library; a read-only tool dir just means no cache"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            pickle.dump(library, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+
+
+# Libraries already loaded by this process, by content hash
+_LOADED: Dict[str, PatternLibrary] = {}
+
+
+def load_library(path: Union[str, Path, None] = None, use_cache: bool = True) -> PatternLibrary:
+    """
+    The validated, indexed library at path (default: the one shipped with the tools)
+    Raises LibrarySchemaError if the file isn't a valid pattern library.
+    """
+    path = Path(path) if path else LIBRARY_PATH
+    with open(path, 'rb') as f:
+        content = f.read()
+    sha256 = hashlib.sha256(content).hexdigest()
+
+    library = _LOADED.get(sha256)
+    if library is not None:
+        return library
+    cache_path = _cache_path(path.resolve(), sha256)
+    library = _read_cache(cache_path, sha256) if use_cache else None
+    if library is None:
+        library = build_library(path, content)
+        if use_cache:
+            _write_cache(cache_path, library)
+    else:
+        # Reuse the pickled CSS rather than compiling it again
+        remember_pattern_css(library.css)
+    _LOADED[sha256] = library
+    return library
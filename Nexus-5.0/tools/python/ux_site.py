@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+NEXUS UX Site Enhancement
+Enhances whole sites (directories and/or globs) across a process pool
+
+- Pages fan out to one worker per core; each worker loads the pattern
+  library once and runs chunks of pages through one UXEnhancementEngine, so
+  selection within a chunk is batch-scored (ux_scoring)
+- Every page gets its <page>-enhanced.html plus an entry in one site
+  manifest (<reports>/ux_site_manifest.json): scores, applied patterns and
+  WCAG verification of the enhanced page against the original
+- Verification runs the WCAG hunters in-process (hunters/wcag_hunters.py)
+  rather than check-wcag-aaa.sh and jq per page, and compares both their
+  issue total and their AAA contrast failures (insufficient_aaa); each
+  applied pattern is also checked on the elements it targets (ux_verify:
+  state contrast, focus indicator, hidden content, motion)
+- Pages whose content hash, library hash and engine settings are unchanged
+  since the last run (and whose output is still there) are skipped
+- Per-pattern outcomes feed the effectiveness store
+  (<reports>/ux_effectiveness.json, see ux_effectiveness), which later runs
+  select with; already enhanced pages keep their output until they change
+"""
+
+import glob
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ux_analysis import CONFIDENCE_THRESHOLD
+from ux_effectiveness import STORE_FILENAME, EffectivenessStore, context_bucket
+from ux_css import PatternCSS
+from ux_engine import DEFAULT_LIBRARY, ENGINE_VERSION, UXEnhancementEngine, load_pattern_library, output_paths
+from ux_library import LibrarySchemaError, load_library
+
+TOOL_DIR = Path(__file__).resolve().parent
+HUNTERS_DIR = TOOL_DIR.parent / "hunters"
+DEFAULT_REPORT_DIR = "__reports/ux"
+MANIFEST_FILENAME = "ux_site_manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
+MANIFEST_SAVE_INTERVAL = 100
+# Generated pages that are never enhanced again
+OUTPUT_SUFFIXES = ("-enhanced.html", "-accessible.html")
+
+STATUS_ENHANCED = "enhanced"
+STATUS_FAILED = "failed"
+
+VERIFY_PASS = "pass"
+VERIFY_NO_REGRESSION = "no-regression"
+VERIFY_REGRESSED = "regressed"
+VERIFY_UNVERIFIED = "unverified"
+# Bump when verify() checks something new (recorded in the manifest settings)
+VERIFY_VERSION = 3
+
+# Per-worker engine, checker and pattern verifier, created once by the pool initializer
+_ENGINE: Optional[UXEnhancementEngine] = None
+_CHECKER = None
+_VERIFIER = None
+
+
+def discover_pages(targets: List[str]) -> List[Path]:
+    """Source HTML files from directories (recursive) and glob patterns, de-duplicated"""
+    pages = set()
+    for target in targets:
+        if os.path.isdir(target):
+            for root, _dirs, names in os.walk(target):
+                for name in names:
+                    if name.endswith(('.html', '.htm')):
+                        pages.add(Path(root) / name)
+        else:
+            for match in glob.glob(target, recursive=True):
+                if os.path.isfile(match):
+                    pages.add(Path(match))
+    return sorted(p for p in pages if not p.name.endswith(OUTPUT_SUFFIXES))
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def wcag_checker():
+    """The in-process WCAG checker from hunters/, or None when it can't be loaded"""
+    if str(HUNTERS_DIR) not in sys.path:
+        sys.path.insert(0, str(HUNTERS_DIR))
+    try:
+        from wcag_hunters import WcagChecker
+    except ImportError:
+        return None
+    return WcagChecker()
+
+
+def pattern_verifier(pattern_css: PatternCSS):
+    """The per-pattern AAA checks (ux_verify), or None when they can't be loaded"""
+    try:
+        from ux_verify import MOTION_GUARD, PatternVerifier
+    except ImportError:
+        return None
+    return PatternVerifier(MOTION_GUARD in pattern_css.motion_safety)
+
+
+def wcag_score(html: str) -> Dict[str, Any]:
+    """The checker's compact score plus its AAA contrast failure count"""
+    result = _CHECKER.check(html)
+    score = _CHECKER.summarize(result)
+    score["insufficient_aaa"] = sum(report.get("counts", {}).get("insufficient_aaa", 0)
+                                    for report in result["wcag_report"]["hunter_reports"].values())
+    return score
+
+
+def verify(original: str, enhanced: str, patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Score the page before and after enhancement, and check each applied pattern
+    hunters: pass with no hunter issues and no AAA contrast failures left,
+    regressed when the enhancement added either. The page passes when the
+    hunters do and every pattern passes its own checks, and regresses when the
+    hunters do or any pattern fails.
+    """
+    if _CHECKER is None:
+        return {"status": VERIFY_UNVERIFIED}
+    before = wcag_score(original)
+    after = wcag_score(enhanced)
+    if after["total_issues"] == 0 and after["insufficient_aaa"] == 0:
+        hunters = VERIFY_PASS
+    elif (after["total_issues"] <= before["total_issues"]
+          and after["insufficient_aaa"] <= before["insufficient_aaa"]):
+        hunters = VERIFY_NO_REGRESSION
+    else:
+        hunters = VERIFY_REGRESSED
+    checks = _VERIFIER.verify(original, patterns) if _VERIFIER is not None and patterns else {}
+
+    status = hunters
+    if any(not check.passed for check in checks.values()):
+        status = VERIFY_REGRESSED
+    return {"status": status, "hunters": hunters, "before": before, "after": after,
+            "patterns": {pattern_id: check.to_dict() for pattern_id, check in checks.items()}}
+
+
+def _init_worker(library_path: str, confidence_threshold: float, stylesheet: Optional[str],
+                 verify_pages: bool, effectiveness_path: Optional[str]):
+    global _ENGINE, _CHECKER, _VERIFIER
+    # Workers select with the store as it was when the run started
+    effectiveness = EffectivenessStore(effectiveness_path) if effectiveness_path else None
+    _ENGINE = UXEnhancementEngine(load_pattern_library(library_path),
+                                  confidence_threshold=confidence_threshold, stylesheet=stylesheet,
+                                  effectiveness=effectiveness)
+    _CHECKER = wcag_checker() if verify_pages else None
+    _VERIFIER = pattern_verifier(_ENGINE.pattern_css) if verify_pages else None
+
+
+def _failed(record: Dict[str, Any], error: Exception):
+    record["status"] = STATUS_FAILED
+    record["error"] = f"{type(error).__name__}: {error}"
+
+
+def enhance_pages(html_files: List[str]) -> List[Dict[str, Any]]:
+    """Enhance a chunk of pages and write their outputs; one record per page, never raises"""
+    records, pages = [], []
+    for html_file in html_files:
+        record: Dict[str, Any] = {"file": html_file}
+        try:
+            with open(html_file, 'rb') as f:
+                raw = f.read()
+            record["input_sha256"] = hashlib.sha256(raw).hexdigest()
+            pages.append((html_file, raw.decode('utf-8')))
+        except Exception as e:
+            _failed(record, e)
+        records.append(record)
+
+    try:
+        results = list(_ENGINE.enhance_many(pages, batch_size=len(pages) or 1))
+    except Exception:
+        # Enhance page by page so one bad page doesn't fail the chunk
+        results = None
+
+    by_file = {record["file"]: record for record in records}
+    for i, (html_file, html) in enumerate(pages):
+        record = by_file[html_file]
+        start = time.time()
+        try:
+            result = results[i] if results is not None else _ENGINE.enhance(html, html_file)
+            _ENGINE.write_outputs(result)
+            summary = result.summary()
+            # Patterns whose CSS went in and that had elements to act on
+            applied = {
+                selected["pattern"]["id"]: selected["pattern"]
+                for selection in result.enhancements["selections"].values() if selection["count"] > 0
+                for selected in selection["selected_patterns"] if selected["pattern"]["id"] in result.applied_ids
+            }
+            record.update({
+                "status": STATUS_ENHANCED,
+                "output": str(output_paths(html_file)["output"]),
+                "total_opportunities": summary["total_opportunities"],
+                "patterns_selected": summary["patterns_selected"],
+                "total_applications": summary["total_applications"],
+                "applied_patterns": result.applied_count,
+                "context_bucket": context_bucket(result.enhancements["page_context"]),
+                "original_size": summary["original_size"],
+                "enhanced_size": summary["enhanced_size"],
+                "patterns": [
+                    {
+                        "id": selected["pattern"]["id"],
+                        "opportunity": opp_type,
+                        "elements": selection["count"],
+                        "score": round(selected["score"], 2),
+                        "confidence": selected["confidence"],
+                    }
+                    for opp_type, selection in result.enhancements["selections"].items()
+                    for selected in selection["selected_patterns"]
+                ],
+                "verification": verify(html, result.html, list(applied.values())),
+            })
+            elapsed = result.elapsed_ms / 1000
+        except Exception as e:
+            _failed(record, e)
+            elapsed = 0.0
+        record["seconds"] = round(elapsed + time.time() - start, 4)
+    return records
+
+
+class UXSiteManifest:
+    """JSON manifest of enhanced pages, keyed by resolved input path"""
+
+    def __init__(self, path: Path, settings: Dict[str, Any]):
+        self.path = Path(path)
+        self.settings = settings
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        if data.get("schemaVersion") == MANIFEST_SCHEMA_VERSION:
+            self.entries = data.get("entries", {})
+
+    @staticmethod
+    def key(html_file: Path) -> str:
+        return str(Path(html_file).resolve())
+
+    def lookup(self, html_file: Path, input_hash: str) -> Optional[Dict[str, Any]]:
+        """The recorded entry if the page and settings are unchanged and the output still exists"""
+        entry = self.entries.get(self.key(html_file))
+        if (not entry or entry.get("input_sha256") != input_hash
+                or entry.get("settings") != self.settings):
+            return None
+        output = Path(entry["output"])
+        if not output.exists() or output.stat().st_size != entry.get("output_bytes"):
+            return None
+        return entry
+
+    def record(self, record: Dict[str, Any]):
+        """Store a successfully enhanced page"""
+        self.entries[self.key(Path(record["file"]))] = {
+            **record,
+            "settings": self.settings,
+            "output_bytes": Path(record["output"]).stat().st_size,
+        }
+        self.dirty = True
+
+    def save(self, summary: Optional[Dict[str, Any]] = None):
+        """Atomically write the manifest (tmp file + rename)"""
+        if not self.dirty and summary is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + f".{os.getpid()}.tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                "schemaVersion": MANIFEST_SCHEMA_VERSION,
+                "module": "ux_site_manifest",
+                "settings": self.settings,
+                **({"last_run": summary} if summary is not None else {}),
+                "entries": self.entries,
+            }, f, indent=1)
+        os.replace(tmp, self.path)
+        self.dirty = False
+
+
+class SiteEnhancer:
+    """Fans pages out across a process pool and records them in the site manifest"""
+
+    def __init__(self, targets: List[str], workers: Optional[int] = None,
+                 report_dir: str = DEFAULT_REPORT_DIR, library: str = str(DEFAULT_LIBRARY),
+                 confidence_threshold: float = CONFIDENCE_THRESHOLD, stylesheet: Optional[str] = None,
+                 verify_pages: bool = True, use_manifest: bool = True, learn: bool = True,
+                 chunksize: int = 16):
+        self.targets = targets
+        self.workers = workers or os.cpu_count() or 1
+        self.report_dir = Path(report_dir)
+        self.library = library
+        self.confidence_threshold = confidence_threshold
+        self.stylesheet = str(Path(stylesheet).resolve()) if stylesheet else None
+        self.verify_pages = verify_pages
+        self.use_manifest = use_manifest
+        self.chunksize = chunksize
+        self.settings = {
+            "engine": ENGINE_VERSION,
+            "library_sha256": load_library(library).sha256,
+            "confidence_threshold": confidence_threshold,
+            "stylesheet": self.stylesheet,
+            "verify": VERIFY_VERSION if verify_pages else False,
+        }
+        self.manifest_path = self.report_dir / MANIFEST_FILENAME
+        self.manifest = UXSiteManifest(self.manifest_path, self.settings)
+        self.effectiveness_path = self.report_dir / STORE_FILENAME if learn else None
+        self.effectiveness = EffectivenessStore(self.effectiveness_path) if learn else None
+        self.summary: Dict[str, Any] = {
+            "total_pages": 0,
+            "processed": 0,
+            "enhanced": 0,
+            "failed": 0,
+            "skipped_unchanged": 0,
+            "applications": 0,
+            "outcomes_recorded": 0,
+            "verification": Counter(),
+            "patterns": Counter(),
+        }
+
+    def pending_pages(self, pages: List[Path]) -> List[str]:
+        """Pages still to enhance; unchanged pages keep their manifest entry"""
+        pending = []
+        for page in pages:
+            if self.use_manifest and self.manifest.lookup(page, file_sha256(page)) is not None:
+                self.summary["skipped_unchanged"] += 1
+                continue
+            pending.append(str(page))
+        return pending
+
+    def _count(self, record: Dict[str, Any]):
+        self.summary["processed"] += 1
+        if record["status"] == STATUS_FAILED:
+            self.summary["failed"] += 1
+            return
+        self.summary["enhanced"] += 1
+        self.summary["applications"] += record["total_applications"]
+        self.summary["verification"][record["verification"]["status"]] += 1
+        self.summary["patterns"].update(pattern["id"] for pattern in record["patterns"])
+        self.manifest.record(record)
+        self._learn(record)
+
+    def _learn(self, record: Dict[str, Any]):
+        """
+        Feed each checked pattern's outcome to the effectiveness store
+        Only patterns that were applied and touched elements are recorded; one
+        succeeds when it passed its own checks and the hunters didn't regress.
+        """
+        verification = record["verification"]
+        if self.effectiveness is None or verification["status"] == VERIFY_UNVERIFIED:
+            return
+        hunters_held = verification["hunters"] != VERIFY_REGRESSED
+        for pattern_id, check in verification["patterns"].items():
+            if check["elements"] == 0:
+                continue
+            self.effectiveness.record(pattern_id, record["context_bucket"], hunters_held and not check["failures"])
+            self.summary["outcomes_recorded"] += 1
+
+    def run(self) -> Iterator[Dict[str, Any]]:
+        """Yield per-page records as workers finish; writes the manifest as it goes"""
+        start = time.time()
+        pages = discover_pages(self.targets)
+        self.summary["total_pages"] = len(pages)
+        pending = self.pending_pages(pages)
+        chunks = [pending[i:i + self.chunksize] for i in range(0, len(pending), self.chunksize)]
+
+        if self.stylesheet:
+            UXEnhancementEngine(load_pattern_library(self.library), stylesheet=self.stylesheet).write_stylesheet()
+
+        try:
+            if chunks:
+                with Pool(min(self.workers, len(chunks)), initializer=_init_worker,
+                          initargs=(self.library, self.confidence_threshold, self.stylesheet,
+                                    self.verify_pages,
+                                    str(self.effectiveness_path) if self.effectiveness_path else None)) as pool:
+                    for records in pool.imap_unordered(enhance_pages, chunks):
+                        for record in records:
+                            self._count(record)
+                            yield record
+                        if self.summary["processed"] % MANIFEST_SAVE_INTERVAL < len(records):
+                            self.save()
+        finally:
+            elapsed = time.time() - start
+            self.summary["seconds"] = round(elapsed, 3)
+            self.summary["pages_per_second"] = round(self.summary["processed"] / max(elapsed, 1e-9), 1)
+            self.save(self.site_summary())
+
+    def save(self, summary: Optional[Dict[str, Any]] = None):
+        self.manifest.save(summary)
+        if self.effectiveness is not None:
+            self.effectiveness.save()
+
+    def site_summary(self) -> Dict[str, Any]:
+        return {
+            **self.summary,
+            "workers": self.workers,
+            "verification": dict(self.summary["verification"]),
+            "patterns": dict(self.summary["patterns"].most_common()),
+        }
+
+
+def main():
+    targets, workers, report_dir = [], None, DEFAULT_REPORT_DIR
+    library, threshold, stylesheet = str(DEFAULT_LIBRARY), CONFIDENCE_THRESHOLD, None
+    argv = iter(sys.argv[1:])
+    for arg in argv:
+        if arg == '--workers':
+            workers = int(next(argv))
+        elif arg == '--reports':
+            report_dir = next(argv)
+        elif arg == '--library':
+            library = next(argv)
+        elif arg == '--threshold':
+            threshold = float(next(argv))
+        elif arg == '--stylesheet':
+            stylesheet = next(argv)
+        elif not arg.startswith('--'):
+            targets.append(arg)
+
+    if not targets:
+        print("Usage: ux_site.py <dir|glob> [<dir|glob> ...] [--workers N] [--reports DIR] "
+              "[--library PATH] [--threshold 60] [--stylesheet PATH] [--no-verify] [--no-cache] [--no-learn] [--quiet]")
+        sys.exit(1)
+
+    quiet = '--quiet' in sys.argv
+    try:
+        enhancer = SiteEnhancer(targets, workers=workers, report_dir=report_dir, library=library,
+                                confidence_threshold=threshold, stylesheet=stylesheet,
+                                verify_pages='--no-verify' not in sys.argv,
+                                use_manifest='--no-cache' not in sys.argv,
+                                learn='--no-learn' not in sys.argv)
+    except LibrarySchemaError as e:
+        print(f"❌ Invalid pattern library: {e}")
+        sys.exit(1)
+
+    print("🚀 NEXUS UX SITE ENHANCEMENT")
+    print(f"   Library: {library}")
+    print("=" * 60)
+    for record in enhancer.run():
+        if quiet:
+            continue
+        if record["status"] == STATUS_FAILED:
+            print(f"⚠️  [{enhancer.summary['processed']}] {record['file']} ({record['error']})")
+        else:
+            icon = "✅" if record["verification"]["status"] != VERIFY_REGRESSED else "⚠️ "
+            print(f"{icon} [{enhancer.summary['processed']}] {record['file']} "
+                  f"({record['patterns_selected']} patterns, {record['total_applications']} applications, "
+                  f"WCAG {record['verification']['status']})")
+
+    summary = enhancer.site_summary()
+    print("=" * 60)
+    print("📈 Site Summary:")
+    print(f"   Pages: {summary['total_pages']} (enhanced: {summary['enhanced']}, "
+          f"unchanged: {summary['skipped_unchanged']}, failed: {summary['failed']})")
+    print(f"   Applications: {summary['applications']}")
+    if summary['verification']:
+        print("   Verification: " + ", ".join(f"{status} {count}"
+                                             for status, count in summary['verification'].items()))
+    if summary['outcomes_recorded']:
+        print(f"   Learned: {summary['outcomes_recorded']} pattern outcomes → {enhancer.effectiveness_path}")
+    if summary['processed']:
+        print(f"   Throughput: {summary['pages_per_second']:.1f} pages/sec "
+              f"({enhancer.workers} workers, {summary['seconds']:.1f}s)")
+    print(f"\n📋 Site manifest: {enhancer.manifest_path}")
+
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -2,299 +2,59 @@
 """
 NEXUS WCAG HTML Advanced Auto-Fixer
 Intelligently adds missing semantic landmarks and fixes contrast to achieve 100% WCAG AAA compliance
+
+All fixes run in-process on a single parsed DOM (see wcag_pipeline.py).
 """
 
 import json
 import sys
-import re
-import subprocess
-from bs4 import BeautifulSoup
 
-def load_report(report_file):
-    """Load WCAG report"""
-    with open(report_file, 'r') as f:
-        return json.load(f)
+from html_parsers import pop_parser_argument
+from wcag_pipeline import WcagFixPipeline
+
 
 def load_html(html_file):
     """Load original HTML"""
-    with open(html_file, 'r') as f:
+    with open(html_file, 'r', encoding='utf-8') as f:
         return f.read()
 
+
 def save_html(html_file, content):
     """Save fixed HTML"""
-    with open(html_file, 'w') as f:
+    with open(html_file, 'w', encoding='utf-8') as f:
         f.write(content)
 
-def fix_missing_lang(html):
-    """Add missing lang attribute to html tag"""
-    if re.search(r'<html(?![^>]*lang=)', html, re.IGNORECASE):
-        html = re.sub(r'<html', '<html lang="en"', html, count=1, flags=re.IGNORECASE)
-        print("   ✓ Added lang='en' to <html> tag")
-        return html, 1
-    return html, 0
 
-def fix_missing_nav(soup, html):
-    """Add missing nav landmark"""
-    fixes = 0
-    
-    # Check if nav already exists
-    if soup.find('nav'):
-        return html, 0
-    
-    # Strategy 1: Find links/menu in body and wrap in nav
-    body = soup.find('body')
-    if not body:
-        return html, 0
-    
-    # Look for groups of links that might be navigation
-    # Add a simple nav placeholder after body tag
-    nav_html = '\n  <nav aria-label="Main navigation">\n    <!-- Navigation links go here -->\n  </nav>\n'
-    
-    # Insert after opening body tag
-    html = re.sub(r'(<body[^>]*>)', r'\1' + nav_html, html, count=1, flags=re.IGNORECASE)
-    print("   ✓ Added <nav> landmark")
-    fixes += 1
-    
-    return html, fixes
-
-def fix_missing_header(soup, html):
-    """Add missing header landmark"""
-    fixes = 0
-    
-    # Check if header already exists
-    if soup.find('header'):
-        return html, 0
-    
-    # Look for h1 or title elements and wrap in header
-    header_html = '\n  <header>\n    <!-- Page header content -->\n  </header>\n'
-    
-    # Find the first h1 or prominent content and wrap it
-    h1_match = re.search(r'(<h1[^>]*>.*?</h1>)', html, re.DOTALL | re.IGNORECASE)
-    if h1_match:
-        h1_content = h1_match.group(1)
-        header_with_h1 = f'\n  <header>\n    {h1_content}\n  </header>\n'
-        html = html.replace(h1_content, header_with_h1, 1)
-        print("   ✓ Added <header> landmark around h1")
-        fixes += 1
-    else:
-        # Add empty header after nav or at start of body
-        html = re.sub(r'(</nav>)', r'\1' + header_html, html, count=1, flags=re.IGNORECASE)
-        if '</nav>' not in html:
-            html = re.sub(r'(<body[^>]*>)', r'\1' + header_html, html, count=1, flags=re.IGNORECASE)
-        print("   ✓ Added <header> landmark")
-        fixes += 1
-    
-    return html, fixes
+def main():
+    args, ratio = [], 7.0
+    cli_args, parser = pop_parser_argument(sys.argv[1:])
+    argv = iter(cli_args)
+    for arg in argv:
+        if arg == '--ratio':
+            ratio = float(next(argv))
+        elif not arg.startswith('--'):
+            args.append(arg)
+
+    if len(args) != 3:
+        print("Usage: wcag-fixer-advanced.py <report.json> <input.html> <output.html> [--ratio 7.0] [--parser NAME] [--json]")
+        sys.exit(1)
 
-def fix_missing_main(soup, html):
-    """Add missing main landmark"""
-    fixes = 0
-    
-    # Check if main already exists
-    if soup.find('main'):
-        return html, 0
-    
-    # Find the main content area (after header, before footer)
-    # Look for sections, articles, or substantial divs
-    
-    # Strategy: Wrap the middle content in main
-    # Find content between header and footer (or just wrap most of body)
-    
-    main_start = '\n  <main>\n'
-    main_end = '\n  </main>\n'
-    
-    # Try to find where to insert main
-    # Look for first heading or content after header/nav
-    if '<header>' in html or '</nav>' in html:
-        # Insert main after header or nav
-        if '</header>' in html:
-            html = re.sub(r'(</header>)', r'\1' + main_start, html, count=1, flags=re.IGNORECASE)
-        else:
-            html = re.sub(r'(</nav>)', r'\1' + main_start, html, count=1, flags=re.IGNORECASE)
-        
-        # Insert main end before footer or before closing body
-        if '<footer' in html:
-            html = re.sub(r'(\s*<footer)', main_end + r'\1', html, count=1, flags=re.IGNORECASE)
-        else:
-            html = re.sub(r'(\s*</body>)', main_end + r'\1', html, count=1, flags=re.IGNORECASE)
-        
-        print("   ✓ Added <main> landmark")
-        fixes += 1
-    
-    return html, fixes
+    # The report is accepted for CLI compatibility; fixes are derived from the DOM itself
+    _report_file, input_file, output_file = args
+    as_json = '--json' in sys.argv
 
-def fix_missing_footer(soup, html):
-    """Add missing footer landmark"""
-    fixes = 0
-    
-    # Check if footer already exists
-    if soup.find('footer'):
-        return html, 0
-    
-    # Add footer before closing body tag
-    footer_html = '\n  <footer>\n    <!-- Footer content -->\n  </footer>\n'
-    
-    # Look for copyright, contact info, or bottom content
-    copyright_match = re.search(r'(<[^>]*>.*?©.*?</[^>]*>)', html, re.IGNORECASE)
-    if copyright_match:
-        copyright_content = copyright_match.group(1)
-        footer_with_content = f'\n  <footer>\n    {copyright_content}\n  </footer>\n'
-        html = html.replace(copyright_content, footer_with_content, 1)
-        print("   ✓ Added <footer> landmark around copyright")
-        fixes += 1
-    else:
-        # Add empty footer before closing body
-        html = re.sub(r'(\s*</body>)', footer_html + r'\1', html, count=1, flags=re.IGNORECASE)
-        print("   ✓ Added <footer> landmark")
-        fixes += 1
-    
-    return html, fixes
+    if not as_json:
+        print("   Applying comprehensive fixes...")
 
-def fix_missing_alt_tags(html, findings):
-    """Add missing alt attributes to images"""
-    fixes = 0
-    for finding in findings:
-        if 'Missing alt attribute' in str(finding):
-            element = finding.get('element', '')
-            if '<img' in element and 'src=' in element:
-                # Extract src value
-                src_match = re.search(r'src=["\']([^"\']+)["\']', element)
-                if src_match:
-                    src = src_match.group(1)
-                    # Generate descriptive alt text from filename
-                    filename = src.split('/')[-1]
-                    filename = re.sub(r'\.(jpg|jpeg|png|gif|svg|webp)$', '', filename, flags=re.IGNORECASE)
-                    filename = filename.replace('-', ' ').replace('_', ' ')
-                    alt_text = filename.title() if filename else 'Image'
-                    
-                    # Find img without alt
-                    pattern = re.compile(
-                        r'<img([^>]*src=["\'][^"\']*' + re.escape(src.split('/')[-1]) + r'["\'][^>]*)>',
-                        re.IGNORECASE
-                    )
-                    
-                    def add_alt(match):
-                        attrs = match.group(1)
-                        if 'alt=' not in attrs:
-                            return f'<img{attrs} alt="{alt_text}">'
-                        return match.group(0)
-                    
-                    new_html = pattern.sub(add_alt, html, count=1)
-                    if new_html != html:
-                        html = new_html
-                        print(f"   ✓ Added alt='{alt_text}' to image")
-                        fixes += 1
-    
-    return html, fixes
+    pipeline = WcagFixPipeline(contrast_target=ratio, verbose=not as_json, parser=parser)
+    result = pipeline.run(load_html(input_file))
+    save_html(output_file, result.html)
 
-def fix_heading_hierarchy(html):
-    """Fix heading hierarchy skips (e.g., h2 to h4)"""
-    fixes = 0
-    
-    # Find h4 elements that should be h3
-    # Simple heuristic: if there are h2s but no h3s before an h4, convert h4 to h3
-    if '<h2' in html and '<h4' in html:
-        # Check if h4 appears before any h3
-        h2_pos = html.find('<h2')
-        h3_pos = html.find('<h3')
-        h4_pos = html.find('<h4')
-        
-        if h2_pos >= 0 and h4_pos >= 0:
-            if h3_pos < 0 or h4_pos < h3_pos:
-                # We have h2 -> h4 skip, convert h4 to h3
-                html = re.sub(r'<h4', '<h3', html, count=1)
-                html = re.sub(r'</h4>', '</h3>', html, count=1)
-                print("   ✓ Fixed heading hierarchy (h4 → h3)")
-                fixes += 1
-    
-    return html, fixes
+    if as_json:
+        print(json.dumps(result.to_dict(), indent=2))
+    else:
+        print(f"\n   Total fixes applied: {result.total_fixes}")
 
-def main():
-    if len(sys.argv) != 4:
-        print("Usage: wcag-fixer-advanced.py <report.json> <input.html> <output.html>")
-        sys.exit(1)
-    
-    report_file = sys.argv[1]
-    input_file = sys.argv[2]
-    output_file = sys.argv[3]
-    
-    print("   Applying comprehensive fixes...")
-    
-    # Load files
-    report = load_report(report_file)
-    html = load_html(input_file)
-    
-    # Parse HTML for intelligent manipulation
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    total_fixes = 0
-    findings = report.get('intelligence_data', {}).get('findings', [])
-    
-    # Apply fixes in order
-    html, fixes = fix_missing_lang(html)
-    total_fixes += fixes
-    
-    html, fixes = fix_missing_alt_tags(html, findings)
-    total_fixes += fixes
-    
-    # Re-parse after initial fixes
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    # Add semantic landmarks
-    html, fixes = fix_missing_nav(soup, html)
-    total_fixes += fixes
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    html, fixes = fix_missing_header(soup, html)
-    total_fixes += fixes
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    html, fixes = fix_missing_main(soup, html)
-    total_fixes += fixes
-    soup = BeautifulSoup(html, 'html.parser')
-    
-    html, fixes = fix_missing_footer(soup, html)
-    total_fixes += fixes
-    
-    # Fix heading hierarchy
-    html, fixes = fix_heading_hierarchy(html)
-    total_fixes += fixes
-    
-    # Save intermediate version for contrast fixing
-    temp_file = output_file + '.temp'
-    save_html(temp_file, html)
-    
-    # Fix color contrast issues using contrast-fixer.py
-    try:
-        result = subprocess.run(
-            ['python3', f'{sys.path[0]}/contrast-fixer.py', temp_file, output_file],
-            capture_output=True,
-            text=True
-        )
-        
-        # Parse output to get fix count
-        if 'Fixed' in result.stdout:
-            import re
-            match = re.search(r'Fixed (\d+)', result.stdout)
-            if match:
-                contrast_fixes = int(match.group(1))
-                total_fixes += contrast_fixes
-        
-        # Print contrast fixer output
-        if result.stdout:
-            for line in result.stdout.strip().split('\n'):
-                print(line)
-        
-        # Clean up temp file
-        import os
-        os.remove(temp_file)
-        
-    except Exception as e:
-        # If contrast fixer fails, just save what we have
-        print(f"   ⚠️  Contrast fixer unavailable: {e}")
-        save_html(output_file, html)
-    
-    print(f"\n   Total fixes applied: {total_fixes}")
 
 if __name__ == '__main__':
     main()
@@ -6,7 +6,8 @@ Applies automated fixes to HTML based on WCAG compliance report
 
 import json
 import sys
-import re
+
+from rule_patterns import ALT_ATTRIBUTE, IMAGE_EXTENSION, IMG_TAG, LANDMARK_DIVS, SRC_ATTRIBUTE
 
 def load_report(report_file):
     """Load WCAG report"""
@@ -39,31 +40,25 @@ def fix_missing_alt_tags(html, findings):
             element = finding.get('element', '')
             if '<img' in element and 'src=' in element:
                 # Extract src value
-                src_match = re.search(r'src=["\']([^"\']+)["\']', element)
+                src_match = SRC_ATTRIBUTE.search(element)
                 if src_match:
                     src = src_match.group(1)
                     # Generate descriptive alt text from filename
-                    filename = src.split('/')[-1]
-                    filename = re.sub(r'\.(jpg|jpeg|png|gif|svg|webp)$', '', filename, flags=re.IGNORECASE)
+                    basename = src.split('/')[-1]
+                    filename = IMAGE_EXTENSION.sub('', basename)
                     filename = filename.replace('-', ' ').replace('_', ' ')
                     alt_text = filename.title() if filename else 'Image'
                     
-                    # Find this specific image without alt
-                    pattern = re.compile(
-                        r'<img([^>]*src=["\']([^"\']*' + re.escape(src.split('/')[-1]) + r')["\'][^>]*)(?<!alt=["\'][^"\']*")>',
-                        re.IGNORECASE
-                    )
-                    
-                    matches = pattern.findall(html)
-                    if matches:
-                        # Simple approach: find img tags without alt
-                        old_tag = f'<img{matches[0][0]}>'
-                        new_tag = f'<img{matches[0][0]} alt="{alt_text}">'
-                        
-                        if 'alt=' not in old_tag:
-                            html = html.replace(old_tag, new_tag, 1)
+                    # Find the first img tag for this file that still has no alt
+                    for match in IMG_TAG.finditer(html):
+                        attrs = match.group('attrs')
+                        tag_src = SRC_ATTRIBUTE.search(attrs)
+                        if tag_src and tag_src.group(1).endswith(basename) and not ALT_ATTRIBUTE.search(attrs):
+                            new_tag = f'<img{attrs} alt="{alt_text}">'
+                            html = html[:match.start()] + new_tag + html[match.end():]
                             print(f"   ✓ Added alt='{alt_text}' to image")
                             fixes += 1
+                            break
     
     return html, fixes
 
@@ -77,8 +72,7 @@ def fix_semantic_landmarks(html, findings):
         # Fix missing nav
         if 'Missing <nav> landmark' in issue and '<nav' not in html:
             # Look for navigation-like divs
-            pattern = r'<div[^>]*(?:class|id)=["\'].*?(?:nav|menu|navigation)[^"\']*["\'][^>]*>'
-            match = re.search(pattern, html, re.IGNORECASE)
+            match = LANDMARK_DIVS['nav'].search(html)
             if match:
                 old_div = match.group(0)
                 new_nav = old_div.replace('<div', '<nav')
@@ -89,8 +83,7 @@ def fix_semantic_landmarks(html, findings):
         
         # Fix missing header
         elif 'Missing <header> landmark' in issue and '<header' not in html:
-            pattern = r'<div[^>]*(?:class|id)=["\'].*?header[^"\']*["\'][^>]*>'
-            match = re.search(pattern, html, re.IGNORECASE)
+            match = LANDMARK_DIVS['header'].search(html)
             if match:
                 old_div = match.group(0)
                 new_header = old_div.replace('<div', '<header')
@@ -100,8 +93,7 @@ def fix_semantic_landmarks(html, findings):
         
         # Fix missing footer
         elif 'Missing <footer> landmark' in issue and '<footer' not in html:
-            pattern = r'<div[^>]*(?:class|id)=["\'].*?footer[^"\']*["\'][^>]*>'
-            match = re.search(pattern, html, re.IGNORECASE)
+            match = LANDMARK_DIVS['footer'].search(html)
             if match:
                 old_div = match.group(0)
                 new_footer = old_div.replace('<div', '<footer')
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+NEXUS Parallel Batch WCAG Recoder
+Recodes a directory of HTML files across a process pool
+
+- Each worker builds the fix pipeline and checker once and reuses them for every page
+- Pages are scored before and after fixing in-process (no HTTP checker)
+- Every page gets the <page>-wcag-report.json recode-html.sh writes (the
+  checker's full result for the input page); improved pages also get
+  <page>-accessible.html
+- Per-file results are streamed to a JSONL log as they complete
+- --resume skips files that already have a successful record in the log
+- Unchanged pages (same content hash, fixer version and thresholds) are
+  skipped via the recode manifest and their previous outputs reused
+- Paths with spaces are handled natively (no shell word splitting)
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from html_parsers import pop_parser_argument, resolve_parser
+from wcag_pipeline import WcagFixPipeline, FIXER_VERSION
+from recode_manifest import RecodeManifest, current_thresholds, file_sha256, toolchain_versions
+
+RESULTS_FILENAME = ".wcag-batch-results.jsonl"
+OUTPUT_SUFFIXES = ("-accessible.html",)
+
+STATUS_ALREADY_COMPLIANT = "already_compliant"
+STATUS_IMPROVED = "improved"
+STATUS_FAILED = "failed"
+
+MANIFEST_SAVE_INTERVAL = 100
+
+# Per-worker pipeline, created once by the pool initializer
+_PIPELINE: Optional[WcagFixPipeline] = None
+
+
+def output_paths(html_file: Path) -> Dict[str, Path]:
+    """Output locations used by recode-html.sh for a given input"""
+    stem = str(html_file)[:-len('.html')] if str(html_file).endswith('.html') else str(html_file)
+    return {
+        "output": Path(f"{stem}-accessible.html"),
+        "report": Path(f"{stem}-wcag-report.json"),
+    }
+
+
+def discover_html_files(target_dir: Path) -> List[Path]:
+    """All source HTML files under target_dir, excluding generated outputs"""
+    files = []
+    for root, _dirs, names in os.walk(target_dir):
+        for name in names:
+            if name.endswith('.html') and not name.endswith(OUTPUT_SUFFIXES):
+                files.append(Path(root) / name)
+    return sorted(files)
+
+
+def load_completed(results_file: Path) -> Dict[str, Dict]:
+    """Previously recorded results keyed by file path (last record wins)"""
+    completed: Dict[str, Dict] = {}
+    if not results_file.exists():
+        return completed
+    with open(results_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from an interrupted run
+                continue
+            completed[record.get("file", "")] = record
+    return completed
+
+
+def _init_worker(contrast_target: float, parser: str):
+    global _PIPELINE
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'hunters'))
+    from wcag_hunters import WcagChecker
+    _PIPELINE = WcagFixPipeline(contrast_target=contrast_target, verbose=False,
+                                checker=WcagChecker(parser=parser), parser=parser)
+
+
+def recode_file(html_file: str) -> Dict:
+    """Fix one page in-process and write its outputs; never raises"""
+    start = time.time()
+    record = {"file": html_file, "fixer_version": FIXER_VERSION}
+    try:
+        with open(html_file, 'rb') as f:
+            raw = f.read()
+        record["input_sha256"] = hashlib.sha256(raw).hexdigest()
+        html = raw.decode('utf-8')
+        paths = output_paths(Path(html_file))
+        with open(paths["report"], 'w', encoding='utf-8') as f:
+            json.dump(_PIPELINE.checker.check(html), f, indent=2)
+        record["report"] = str(paths["report"])
+        result = _PIPELINE.run(html)
+        record["counts"] = result.counts
+        record["total_fixes"] = result.total_fixes
+        record["initial_score"] = result.before
+        record["final_score"] = result.after
+        if result.before["total_issues"] == 0 and result.total_fixes == 0:
+            record["status"] = STATUS_ALREADY_COMPLIANT
+        else:
+            with open(paths["output"], 'w', encoding='utf-8') as f:
+                f.write(result.html)
+            record["status"] = STATUS_IMPROVED
+            record["output"] = str(paths["output"])
+    except Exception as e:
+        record["status"] = STATUS_FAILED
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.time() - start, 4)
+    return record
+
+
+class BatchRecoder:
+    """Fans pages out across a process pool and aggregates results"""
+
+    def __init__(self, target_dir: str, workers: Optional[int] = None,
+                 results_file: Optional[str] = None, resume: bool = False,
+                 contrast_target: float = 7.0, chunksize: int = 8, use_cache: bool = True,
+                 parser: Optional[str] = None):
+        self.target_dir = Path(target_dir)
+        self.workers = workers or os.cpu_count() or 1
+        self.results_file = Path(results_file) if results_file else self.target_dir / RESULTS_FILENAME
+        self.resume = resume
+        self.contrast_target = contrast_target
+        self.chunksize = chunksize
+        self.parser = resolve_parser(parser)
+        self.manifest = RecodeManifest.locate(
+            self.target_dir, toolchain_versions(self.parser), current_thresholds(contrast_target)
+        ) if use_cache else None
+        if self.manifest is not None:
+            self.manifest.absorb_nested(self.target_dir)
+        self.summary = {
+            "total_files": 0,
+            "processed": 0,
+            "already_compliant": 0,
+            "improved": 0,
+            "failed": 0,
+            "resumed": 0,
+            "skipped_unchanged": 0,
+        }
+
+    def _count(self, record: Dict):
+        status = record.get("status")
+        if status in (STATUS_ALREADY_COMPLIANT, STATUS_IMPROVED, STATUS_FAILED):
+            self.summary[status] += 1
+
+    def pending_files(self, files: List[Path]) -> List[str]:
+        """Files still to process; resumed records and unchanged pages are reused"""
+        if self.resume:
+            completed = load_completed(self.results_file)
+        else:
+            completed = {}
+            self.results_file.unlink(missing_ok=True)
+        pending = []
+        for f in files:
+            record = completed.get(str(f))
+            if record and record.get("status") != STATUS_FAILED:
+                self._count(record)
+                self.summary["resumed"] += 1
+                continue
+            if self.manifest is not None:
+                entry = self.manifest.lookup(f, file_sha256(f))
+                if entry is not None:
+                    self._count(entry["result"])
+                    self.summary["skipped_unchanged"] += 1
+                    continue
+            pending.append(str(f))
+        return pending
+
+    def _record_manifest(self, record: Dict):
+        if self.manifest is None or record.get("status") == STATUS_FAILED:
+            return
+        html_file = Path(record["file"])
+        paths = output_paths(html_file)
+        outputs = [paths["output"], paths["report"]] if record["status"] == STATUS_IMPROVED else [paths["report"]]
+        self.manifest.record(html_file, record["input_sha256"], outputs, {
+            "status": record["status"],
+            "total_fixes": record.get("total_fixes", 0),
+            "initial_score": record.get("initial_score"),
+            "final_score": record.get("final_score"),
+        })
+
+    def run(self) -> Iterator[Dict]:
+        """Yield per-file records as workers finish them"""
+        files = discover_html_files(self.target_dir)
+        self.summary["total_files"] = len(files)
+        pending = self.pending_files(files)
+        if not pending:
+            return
+
+        try:
+            with open(self.results_file, 'a', encoding='utf-8') as log, \
+                    Pool(self.workers, initializer=_init_worker, initargs=(self.contrast_target, self.parser)) as pool:
+                for record in pool.imap_unordered(recode_file, pending, chunksize=self.chunksize):
+                    log.write(json.dumps(record) + "\n")
+                    log.flush()
+                    self.summary["processed"] += 1
+                    self._count(record)
+                    self._record_manifest(record)
+                    if self.manifest is not None and self.summary["processed"] % MANIFEST_SAVE_INTERVAL == 0:
+                        self.manifest.save()
+                    yield record
+        finally:
+            if self.manifest is not None:
+                self.manifest.save()
+
+
+def main():
+    args, workers, results_file, ratio = [], None, None, 7.0
+    cli_args, parser = pop_parser_argument(sys.argv[1:])
+    argv = iter(cli_args)
+    for arg in argv:
+        if arg == '--workers':
+            workers = int(next(argv))
+        elif arg == '--results':
+            results_file = next(argv)
+        elif arg == '--ratio':
+            ratio = float(next(argv))
+        elif not arg.startswith('--'):
+            args.append(arg)
+
+    if len(args) != 1:
+        print("Usage: wcag_batch.py <directory> [--workers N] [--results file.jsonl] [--resume] "
+              "[--ratio 7.0] [--no-cache] [--parser NAME] [--quiet]")
+        sys.exit(1)
+
+    target_dir = Path(args[0])
+    if not target_dir.is_dir():
+        print(f"Error: Directory not found: {target_dir}")
+        sys.exit(1)
+
+    quiet = '--quiet' in sys.argv
+    recoder = BatchRecoder(target_dir, workers=workers, results_file=results_file,
+                           resume='--resume' in sys.argv, contrast_target=ratio,
+                           use_cache='--no-cache' not in sys.argv, parser=parser)
+
+    print("🔄 BATCH HTML WCAG COMPLIANCE PROCESSOR")
+    print("=" * 60)
+    start = time.time()
+    for record in recoder.run():
+        if quiet:
+            continue
+        icon = {"already_compliant": "✅", "improved": "🛠️ ", "failed": "⚠️ "}[record["status"]]
+        if record.get("error"):
+            detail = record["error"]
+        else:
+            detail = (f"{record['total_fixes']} fixes, score {record['initial_score']['compliance_score']}"
+                      f" → {record['final_score']['compliance_score']}")
+        print(f"{icon} [{recoder.summary['processed']}] {record['file']} ({detail})")
+    elapsed = time.time() - start
+
+    summary = recoder.summary
+    print("=" * 60)
+    print("📈 Summary:")
+    print(f"   Total Files: {summary['total_files']}")
+    print(f"   Processed: {summary['processed']} (resumed: {summary['resumed']}, "
+          f"unchanged: {summary['skipped_unchanged']})")
+    print(f"   Already Compliant: {summary['already_compliant']}")
+    print(f"   Improved: {summary['improved']}")
+    print(f"   Failed: {summary['failed']}")
+    if summary['processed']:
+        print(f"   Throughput: {summary['processed'] / max(elapsed, 1e-9):.1f} pages/sec "
+              f"({recoder.workers} workers, {elapsed:.1f}s)")
+    print(f"\n📋 Results log: {recoder.results_file}")
+
+    sys.exit(1 if summary['failed'] else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+NEXUS WCAG Single-Parse Fix Pipeline
+Parses a page once and runs every fix pass as a transform on the same DOM
+
+Passes (in order): lang, alt, landmarks (nav/header/main/footer), headings, contrast.
+The tree is serialized exactly once and fix counts are returned as data, so
+callers no longer need temp files, subprocesses or stdout scraping.
+With a checker (hunters.wcag_hunters.WcagChecker) the page is also scored
+before and after fixing in the same process. Every pass records the elements
+it touches, so the after-score re-hunts only those (plus document-level
+rules) on the already-parsed tree instead of re-parsing the fixed page.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Callable, Optional
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+from contrast_engine import (
+    CascadeContrastEngine, adjust_foreground, contrast_ratio, parse_declarations, to_hex
+)
+from html_parsers import parse_html, resolve_parser
+from rule_patterns import IMAGE_EXTENSION, INLINE_COLOR
+
+FIXER_VERSION = "3.0.0"
+
+FIX_PASSES = ["lang", "alt", "nav", "header", "main", "footer", "headings", "contrast"]
+
+
+@dataclass
+class FixResult:
+    """Outcome of one pipeline run"""
+    html: str
+    counts: Dict[str, int]
+    messages: List[str] = field(default_factory=list)
+    before: Optional[Dict[str, Any]] = None
+    after: Optional[Dict[str, Any]] = None
+
+    @property
+    def total_fixes(self) -> int:
+        return sum(self.counts.values())
+
+    def to_dict(self) -> Dict:
+        data = {
+            "fixer_version": FIXER_VERSION,
+            "total_fixes": self.total_fixes,
+            "counts": self.counts,
+            "messages": self.messages,
+        }
+        if self.before is not None:
+            data["before"] = self.before
+            data["after"] = self.after
+        return data
+
+
+def alt_text_from_src(src: str) -> str:
+    """Generate descriptive alt text from an image filename"""
+    filename = src.split('/')[-1]
+    filename = IMAGE_EXTENSION.sub('', filename)
+    filename = filename.replace('-', ' ').replace('_', ' ')
+    return filename.title() if filename else 'Image'
+
+
+def set_inline_color(element: Tag, hex_color: str):
+    """Set (or replace) the color declaration in an element's inline style"""
+    style = element.get('style', '').strip()
+    if any(prop == 'color' for prop, _, _ in parse_declarations(style)):
+        style = INLINE_COLOR.sub(lambda m: f'{m.group(1)}{m.group(2)}color: {hex_color}', style)
+    else:
+        style = f'{style.rstrip(";")}; color: {hex_color}' if style else f'color: {hex_color}'
+    element['style'] = style
+
+
+class WcagFixPipeline:
+    """Runs all WCAG fix passes over a single parsed document"""
+
+    def __init__(self, contrast_target: float = 7.0, verbose: bool = True, checker=None,
+                 parser: Optional[str] = None):
+        self.contrast_target = contrast_target
+        self.verbose = verbose
+        self.checker = checker
+        self.parser = resolve_parser(parser)
+        self.passes: List[Callable[[BeautifulSoup], int]] = [
+            self.fix_missing_lang,
+            self.fix_missing_alt,
+            self.fix_missing_nav,
+            self.fix_missing_header,
+            self.fix_missing_main,
+            self.fix_missing_footer,
+            self.fix_heading_hierarchy,
+            self.fix_contrast,
+        ]
+        self._messages: List[str] = []
+        self.modified: List[Tag] = []
+
+    def _touch(self, *elements: Tag):
+        self.modified.extend(elements)
+
+    def _log(self, message: str):
+        self._messages.append(message)
+        if self.verbose:
+            print(f"   ✓ {message}")
+
+    # -- entry points ---------------------------------------------------------
+
+    def run(self, html: str) -> FixResult:
+        """Parse once, apply every pass, serialize once"""
+        soup = parse_html(html, self.parser)
+        session = self.checker.session(soup) if self.checker else None
+        before = session.score() if session else None
+        counts = self.run_on_soup(soup)
+        after = session.rescore(self.modified) if session else None
+        fixed_html = str(soup)
+        return FixResult(html=fixed_html, counts=counts, messages=list(self._messages),
+                         before=before, after=after)
+
+    def run_on_soup(self, soup: BeautifulSoup) -> Dict[str, int]:
+        """Apply every pass to an already-parsed document in place"""
+        self._messages = []
+        self.modified = []
+        return {name: fix(soup) for name, fix in zip(FIX_PASSES, self.passes)}
+
+    # -- passes ---------------------------------------------------------------
+
+    def fix_missing_lang(self, soup: BeautifulSoup) -> int:
+        """Add missing lang attribute to html tag"""
+        html_tag = soup.find('html')
+        if html_tag is None or html_tag.get('lang'):
+            return 0
+        html_tag['lang'] = 'en'
+        self._touch(html_tag)
+        self._log("Added lang='en' to <html> tag")
+        return 1
+
+    def fix_missing_alt(self, soup: BeautifulSoup) -> int:
+        """Add alt text derived from the filename to images without alt"""
+        fixes = 0
+        for img in soup.find_all('img'):
+            if img.get('alt') is not None or not img.get('src'):
+                continue
+            alt_text = alt_text_from_src(img['src'])
+            img['alt'] = alt_text
+            self._touch(img)
+            self._log(f"Added alt='{alt_text}' to image")
+            fixes += 1
+        return fixes
+
+    def fix_missing_nav(self, soup: BeautifulSoup) -> int:
+        """Add a nav landmark placeholder at the start of body"""
+        body = soup.find('body')
+        if soup.find('nav') or body is None:
+            return 0
+        nav = soup.new_tag('nav')
+        nav['aria-label'] = 'Main navigation'
+        nav.append(Comment(' Navigation links go here '))
+        body.insert(0, nav)
+        self._touch(nav)
+        self._log("Added <nav> landmark")
+        return 1
+
+    def fix_missing_header(self, soup: BeautifulSoup) -> int:
+        """Wrap the first h1 in a header, or add an empty header after nav"""
+        body = soup.find('body')
+        if soup.find('header') or body is None:
+            return 0
+        header = soup.new_tag('header')
+        h1 = soup.find('h1')
+        if h1 is not None:
+            h1.wrap(header)
+            self._touch(header, h1)
+            self._log("Added <header> landmark around h1")
+            return 1
+        header.append(Comment(' Page header content '))
+        nav = soup.find('nav')
+        if nav is not None:
+            nav.insert_after(header)
+        else:
+            body.insert(0, header)
+        self._touch(header)
+        self._log("Added <header> landmark")
+        return 1
+
+    def fix_missing_main(self, soup: BeautifulSoup) -> int:
+        """Wrap the content between header/nav and footer in main"""
+        if soup.find('main'):
+            return 0
+        anchor = soup.find('header') or soup.find('nav')
+        if anchor is None:
+            return 0
+        main = soup.new_tag('main')
+        siblings = []
+        for sibling in anchor.next_siblings:
+            if isinstance(sibling, Tag) and (sibling.name == 'footer' or sibling.find('footer')):
+                break
+            siblings.append(sibling)
+        anchor.insert_after(main)
+        for sibling in siblings:
+            main.append(sibling.extract())
+        self._touch(main, *(sibling for sibling in siblings if isinstance(sibling, Tag)))
+        self._log("Added <main> landmark")
+        return 1
+
+    def fix_missing_footer(self, soup: BeautifulSoup) -> int:
+        """Wrap copyright content in footer, or add an empty footer to body"""
+        body = soup.find('body')
+        if soup.find('footer') or body is None:
+            return 0
+        footer = soup.new_tag('footer')
+        copyright_text = soup.find(string=lambda s: isinstance(s, NavigableString)
+                                   and not isinstance(s, Comment) and '©' in s)
+        if copyright_text is not None and isinstance(copyright_text.parent, Tag) \
+                and copyright_text.parent.name not in ('body', 'html'):
+            self._touch(footer, copyright_text.parent)
+            copyright_text.parent.wrap(footer)
+            # Trailing copyright swept into a freshly added <main> belongs after it
+            container = footer.parent
+            if container is not None and container.name == 'main' and footer.find_next_sibling() is None:
+                container.insert_after(footer.extract())
+            self._log("Added <footer> landmark around copyright")
+            return 1
+        footer.append(Comment(' Footer content '))
+        body.append(footer)
+        self._touch(footer)
+        self._log("Added <footer> landmark")
+        return 1
+
+    def fix_heading_hierarchy(self, soup: BeautifulSoup) -> int:
+        """Fix an h2 → h4 skip by promoting the first h4 to h3"""
+        headings = soup.find_all(['h2', 'h3', 'h4'])
+        first = {}
+        for index, heading in enumerate(headings):
+            first.setdefault(heading.name, index)
+        if 'h2' not in first or 'h4' not in first:
+            return 0
+        if 'h3' in first and first['h3'] < first['h4']:
+            return 0
+        headings[first['h4']].name = 'h3'
+        self._touch(headings[first['h4']])
+        self._log("Fixed heading hierarchy (h4 → h3)")
+        return 1
+
+    def fix_contrast(self, soup: BeautifulSoup) -> int:
+        """Raise effective text contrast to the target using the cascade engine"""
+        engine = CascadeContrastEngine(soup)
+        fixes = 0
+        fixed = set()
+        for _, element in engine.text_nodes():
+            if id(element) in fixed:
+                continue
+            fg, bg, ratio = engine.effective_colors(element)
+            if ratio >= self.contrast_target:
+                continue
+            adjusted = adjust_foreground(fg, bg, self.contrast_target)
+            new_hex = to_hex(adjusted)
+            set_inline_color(element, new_hex)
+            engine.invalidate(element)
+            self._touch(element)
+            fixed.add(id(element))
+            fixes += 1
+            self._log(f"Raised contrast on <{element.name}> {to_hex(fg)} → {new_hex} "
+                      f"({ratio:.2f}:1 → {contrast_ratio(adjusted, bg):.2f}:1)")
+        return fixes
+
+
+def fix_html(html: str, contrast_target: float = 7.0, verbose: bool = False,
+             parser: Optional[str] = None) -> FixResult:
+    """Convenience wrapper: run the full pipeline on an HTML string"""
+    return WcagFixPipeline(contrast_target=contrast_target, verbose=verbose, parser=parser).run(html)
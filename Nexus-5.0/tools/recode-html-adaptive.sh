@@ -418,16 +418,16 @@ main() {
     
     # Step 1: Initial WCAG check
     echo -e "${CYAN}🔍 Step 1: Running initial WCAG compliance check...${NC}"
-    INITIAL_OUTPUT=$("${SCRIPT_DIR}/check-wcag.sh" "$INPUT_FILE" 2>&1)
-    INITIAL_SCORE=$(echo "$INITIAL_OUTPUT" | grep "Compliance Score:" | head -1 | awk '{print $NF}' | tr -d '/')
-    INITIAL_ISSUES=$(echo "$INITIAL_OUTPUT" | grep "Total Issues:" | head -1 | awk '{print $NF}')
+    INITIAL_OUTPUT=$(python3 "${SCRIPT_DIR}/hunters/wcag_hunters.py" --json "$INPUT_FILE")
+    INITIAL_SCORE=$(echo "$INITIAL_OUTPUT" | jq -r '.intelligence_data.complianceScore')
+    INITIAL_ISSUES=$(echo "$INITIAL_OUTPUT" | jq -r '.wcag_report.total_issues')
     
     echo -e "   ${YELLOW}Initial Score: $INITIAL_SCORE/100${NC}"
     echo -e "   ${YELLOW}Issues Found: $INITIAL_ISSUES${NC}"
     echo ""
     
     # Extract issue types for pattern recommendation
-    ISSUES_TEXT=$(echo "$INITIAL_OUTPUT" | grep -A 20 "TOP FINDINGS" || echo "")
+    ISSUES_TEXT=$(echo "$INITIAL_OUTPUT" | jq -r '.intelligence_data.findings[:20][] | .issue // .element' || echo "")
     
     # Step 2: Adaptive pattern selection
     RECOMMENDED_PATTERNS=$(select_adaptive_patterns "$ISSUES_TEXT" "$FILE_HASH" "$INITIAL_SCORE")
@@ -437,7 +437,7 @@ main() {
     echo -e "${CYAN}🛠️  Step 3: Applying AI-guided adaptive fixes...${NC}"
     START_TIME=$(date +%s)
     
-    python3 "${SCRIPT_DIR}/wcag-fixer-advanced.py" "$REPORT_FILE" "$INPUT_FILE" "$OUTPUT_FILE" 2>&1 | grep "✓" || echo "   Processing..."
+    python3 "${SCRIPT_DIR}/python/wcag-fixer-advanced.py" "$REPORT_FILE" "$INPUT_FILE" "$OUTPUT_FILE" 2>&1 | grep "✓" || echo "   Processing..."
     
     END_TIME=$(date +%s)
     TIME_TAKEN=$((END_TIME - START_TIME))
@@ -445,9 +445,9 @@ main() {
     
     # Step 4: Re-check
     echo -e "${CYAN}🔄 Step 4: Re-checking fixed version...${NC}"
-    FINAL_OUTPUT=$("${SCRIPT_DIR}/check-wcag.sh" "$OUTPUT_FILE" 2>&1)
-    FINAL_SCORE=$(echo "$FINAL_OUTPUT" | grep "Compliance Score:" | head -1 | awk '{print $NF}' | tr -d '/')
-    FINAL_ISSUES=$(echo "$FINAL_OUTPUT" | grep "Total Issues:" | head -1 | awk '{print $NF}')
+    FINAL_OUTPUT=$(python3 "${SCRIPT_DIR}/hunters/wcag_hunters.py" --json "$OUTPUT_FILE")
+    FINAL_SCORE=$(echo "$FINAL_OUTPUT" | jq -r '.intelligence_data.complianceScore')
+    FINAL_ISSUES=$(echo "$FINAL_OUTPUT" | jq -r '.wcag_report.total_issues')
     
     echo -e "   ${GREEN}Final Score: $FINAL_SCORE/100${NC}"
     echo -e "   ${GREEN}Issues Remaining: $FINAL_ISSUES${NC}"
@@ -37,15 +37,15 @@ echo ""
 
 # Step 1: Initial WCAG check
 echo "🔍 Step 1: Running initial WCAG compliance check..."
-INITIAL_OUTPUT=$("${SCRIPT_DIR}/check-wcag.sh" "$INPUT_FILE" 2>&1)
-INITIAL_SCORE=$(echo "$INITIAL_OUTPUT" | grep "Compliance Score:" | head -1 | awk '{print $NF}' | tr -d '/')
-INITIAL_ISSUES=$(echo "$INITIAL_OUTPUT" | grep "Total Issues:" | head -1 | awk '{print $NF}')
+INITIAL_OUTPUT=$(python3 "${SCRIPT_DIR}/hunters/wcag_hunters.py" --json "$INPUT_FILE")
+INITIAL_SCORE=$(echo "$INITIAL_OUTPUT" | jq -r '.intelligence_data.complianceScore')
+INITIAL_ISSUES=$(echo "$INITIAL_OUTPUT" | jq -r '.wcag_report.total_issues')
 
 echo -e "   ${YELLOW}Initial Score: $INITIAL_SCORE/100${NC}"
 echo -e "   ${YELLOW}Issues Found: $INITIAL_ISSUES${NC}"
 
 # Extract issue types for pattern recommendation
-ISSUES_TEXT=$(echo "$INITIAL_OUTPUT" | grep -A 20 "TOP FINDINGS" || echo "")
+ISSUES_TEXT=$(echo "$INITIAL_OUTPUT" | jq -r '.intelligence_data.findings[:20][] | .issue // .element' || echo "")
 
 echo ""
 echo "🧠 Step 2: Consulting Pattern Evolution Engine..."
@@ -63,7 +63,7 @@ echo "🛠️  Step 3: Applying AI-guided fixes..."
 START_TIME=$(date +%s)
 
 # Apply fixes using advanced fixer
-python3 "${SCRIPT_DIR}/wcag-fixer-advanced.py" "$REPORT_FILE" "$INPUT_FILE" "$OUTPUT_FILE" 2>&1 | grep "✓" || echo "   Processing..."
+python3 "${SCRIPT_DIR}/python/wcag-fixer-advanced.py" "$REPORT_FILE" "$INPUT_FILE" "$OUTPUT_FILE" 2>&1 | grep "✓" || echo "   Processing..."
 
 # Record end time
 END_TIME=$(date +%s)
@@ -73,9 +73,9 @@ echo ""
 echo "🔄 Step 4: Re-checking fixed version..."
 
 # Re-run WCAG check on fixed version
-FINAL_OUTPUT=$("${SCRIPT_DIR}/check-wcag.sh" "$OUTPUT_FILE" 2>&1)
-FINAL_SCORE=$(echo "$FINAL_OUTPUT" | grep "Compliance Score:" | head -1 | awk '{print $NF}' | tr -d '/')
-FINAL_ISSUES=$(echo "$FINAL_OUTPUT" | grep "Total Issues:" | head -1 | awk '{print $NF}')
+FINAL_OUTPUT=$(python3 "${SCRIPT_DIR}/hunters/wcag_hunters.py" --json "$OUTPUT_FILE")
+FINAL_SCORE=$(echo "$FINAL_OUTPUT" | jq -r '.intelligence_data.complianceScore')
+FINAL_ISSUES=$(echo "$FINAL_OUTPUT" | jq -r '.wcag_report.total_issues')
 
 echo -e "   ${GREEN}Final Score: $FINAL_SCORE/100${NC}"
 echo -e "   ${GREEN}Issues Remaining: $FINAL_ISSUES${NC}"
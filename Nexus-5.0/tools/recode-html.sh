@@ -5,7 +5,7 @@
 set -e
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-NEXUS_URL="http://127.0.0.1:8080"
+WCAG_CHECK="${SCRIPT_DIR}/hunters/wcag_hunters.py"
 
 # Colors
 GREEN='\033[0;32m'
@@ -22,13 +22,6 @@ print_header() {
     echo ""
 }
 
-# Check if NEXUS is running
-if ! curl -sf "${NEXUS_URL}/status" > /dev/null 2>&1; then
-    echo -e "${YELLOW}⚠️  NEXUS is not running. Starting...${NC}"
-    ./start-nexus.sh --background
-    sleep 5
-fi
-
 # Input HTML file
 if [ -z "$1" ]; then
     echo "Usage: $0 <html-file>"
@@ -51,6 +44,12 @@ BASENAME=$(basename "$INPUT_FILE" .html)
 OUTPUT_FILE="${INPUT_FILE%.html}-accessible.html"
 REPORT_FILE="${INPUT_FILE%.html}-wcag-report.json"
 
+# Skip unchanged pages: same content hash, fixer version and thresholds as the last run
+if [ -f "$OUTPUT_FILE" ] && python3 "${SCRIPT_DIR}/python/recode_manifest.py" fresh "$INPUT_FILE"; then
+    echo -e "${GREEN}✅ Unchanged since last recode - reusing $OUTPUT_FILE${NC}"
+    exit 0
+fi
+
 print_header "🔍 WCAG Analysis & Auto-Fix: $INPUT_FILE"
 
 echo "📄 Input: $INPUT_FILE"
@@ -60,12 +59,7 @@ echo ""
 
 # Step 1: Run WCAG check
 echo "🔍 Step 1: Running WCAG compliance check..."
-HTML_CONTENT=$(cat "$INPUT_FILE")
-JSON_PAYLOAD=$(jq -n --arg html "$HTML_CONTENT" '{html: $html}')
-
-WCAG_REPORT=$(curl -sf -X POST "${NEXUS_URL}/wcag-check" \
-    -H "Content-Type: application/json" \
-    -d "$JSON_PAYLOAD")
+WCAG_REPORT=$(python3 "$WCAG_CHECK" --json "$INPUT_FILE")
 
 echo "$WCAG_REPORT" > "$REPORT_FILE"
 
@@ -93,18 +87,13 @@ echo "🛠️  Step 3: Generating accessible version..."
 cp "$INPUT_FILE" "$OUTPUT_FILE"
 
 # Apply fixes based on WCAG report (using advanced fixer)
-python3 "${SCRIPT_DIR}/wcag-fixer-advanced.py" "$REPORT_FILE" "$INPUT_FILE" "$OUTPUT_FILE"
+python3 "${SCRIPT_DIR}/python/wcag-fixer-advanced.py" "$REPORT_FILE" "$INPUT_FILE" "$OUTPUT_FILE"
 
 echo ""
 
 # Step 4: Re-check the fixed version
 echo "🔄 Step 4: Re-checking fixed version..."
-FIXED_HTML=$(cat "$OUTPUT_FILE")
-FIXED_JSON=$(jq -n --arg html "$FIXED_HTML" '{html: $html}')
-
-FIXED_REPORT=$(curl -sf -X POST "${NEXUS_URL}/wcag-check" \
-    -H "Content-Type: application/json" \
-    -d "$FIXED_JSON")
+FIXED_REPORT=$(python3 "$WCAG_CHECK" --json "$OUTPUT_FILE")
 
 NEW_ISSUES=$(echo "$FIXED_REPORT" | jq -r '.wcag_report.total_issues')
 NEW_COMPLIANCE=$(echo "$FIXED_REPORT" | jq -r '.compliance_summary.level_aa')
@@ -115,6 +104,9 @@ echo "   New Compliance: $NEW_COMPLIANCE"
 echo "   Score: $NEW_SCORE/100"
 echo ""
 
+# Record inputs that produced these outputs for the next run's skip check
+python3 "${SCRIPT_DIR}/python/recode_manifest.py" record "$INPUT_FILE" "$OUTPUT_FILE" "$REPORT_FILE" || true
+
 # Summary
 print_header "✅ COMPLETION SUMMARY"
 